@@ -9,7 +9,7 @@
 
 from adjacency_list_graph import AdjacencyListGraph   # Graph data structure (For Adjacency List)
 from bfs import bfs                                   # BFS algorithm (For fewest stops search)
-from print_path import print_path                     # For path reconstruction using BFS parent array
+from print_path import reconstruct_path              # For path reconstruction using BFS parent array
 
 import csv             # CSV for Underground data file reading
 import time            # Time for Exucution time measurement
@@ -94,12 +94,12 @@ def find_stops(G, station_to_index, index_to_station, start_name, end_name):
     end = station_to_index[end_name]               # Convert destination name → integer index
     dist, parent = bfs(G, start)                   # Perform BFS and get distance and parent arrays
 
-    # print_path reconstructs path using parent array From BFS
-    path = print_path(parent, start, end, lambda i: index_to_station[i]) 
+    # reconstruct_path walks the parent array from BFS iteratively (no recursion limit)
+    path = reconstruct_path(parent, start, end)
 
     print("\n-----------------------------------")
     print(f"Fewest stops from **{start_name}** to **{end_name}**:")
-    print(" → ".join(path))
+    print(" → ".join(index_to_station[i] for i in path) if path is not None else "No route")
     print(f"Total stops: {dist[end]}")
     print("-----------------------------------\n")
 
@@ -9,6 +9,7 @@
 import pandas as pd
 from adjacency_list_graph import AdjacencyListGraph
 from mst import kruskal
+from print_path import reconstruct_path as reconstruct_index_path
 import heapq
 import random
 import time
@@ -95,13 +96,14 @@ def dijkstra(graph, index, source):
     return dist, prev
 
 def reconstruct_path(prev, index, source, target):
-    path = []
-    u = index[target]
-    while u is not None:
-        path.append(u)
-        u = prev[u]
-    path.reverse()
-    return path
+    """Return the station indices on the path, or None if target is unreachable."""
+    return reconstruct_index_path(prev, index[source], index[target])
+
+def describe_route(path_indices, time):
+    """Return the stations and time of a route, or "No route" if there is none."""
+    if path_indices is None:
+        return "No route"
+    return f"{[vertices[i] for i in path_indices]} | Total time: {time}"
 
 # (Impact analysis example)
 source_station = "Baker Street"
@@ -109,7 +111,6 @@ target_station = "Elephant & Castle"
 
 dist_orig, prev_orig = dijkstra(graph, index, source_station)
 path_orig_indices = reconstruct_path(prev_orig, index, source_station, target_station)
-path_orig = [vertices[i] for i in path_orig_indices]
 time_orig = dist_orig[index[target_station]]
 
 backbone_graph = AdjacencyListGraph(len(vertices), directed=False, weighted=True)
@@ -119,13 +120,13 @@ for u, v in mst_set:
 
 dist_back, prev_back = dijkstra(backbone_graph, index, source_station)
 path_back_indices = reconstruct_path(prev_back, index, source_station, target_station)
-path_back = [vertices[i] for i in path_back_indices]
 time_back = dist_back[index[target_station]]
 
 print(f"\nJourney from {source_station} to {target_station}:")
-print(f"Original path: {path_orig} | Total time: {time_orig}")
-print(f"Backbone-only path: {path_back} | Total time: {time_back}")
-print(f"Difference in journey time: {time_back - time_orig}")
+print(f"Original path: {describe_route(path_orig_indices, time_orig)}")
+print(f"Backbone-only path: {describe_route(path_back_indices, time_back)}")
+if path_orig_indices is not None and path_back_indices is not None:
+    print(f"Difference in journey time: {time_back - time_orig}")
 
 
 # Empirical Performance Measurement
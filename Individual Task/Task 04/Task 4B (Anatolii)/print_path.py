@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# print_path.py
+
+# Introduction to Algorithms, Fourth edition
+# Linda Xiao and Tom Cormen
+
+#########################################################################
+#                                                                       #
+# Copyright 2022 Massachusetts Institute of Technology                  #
+#                                                                       #
+# Permission is hereby granted, free of charge, to any person obtaining #
+# a copy of this software and associated documentation files (the       #
+# "Software"), to deal in the Software without restriction, including   #
+# without limitation the rights to use, copy, modify, merge, publish,   #
+# distribute, sublicense, and/or sell copies of the Software, and to    #
+# permit persons to whom the Software is furnished to do so, subject to #
+# the following conditions:                                             #
+#                                                                       #
+# The above copyright notice and this permission notice shall be        #
+# included in all copies or substantial portions of the Software.       #
+#                                                                       #
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,       #
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF    #
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND                 #
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS   #
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN    #
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN     #
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE      #
+# SOFTWARE.                                                             #
+#                                                                       #
+#########################################################################
+
+def reconstruct_path(pi, s, v):
+	"""Return the list of vertices on the path from s to v given by the predecessors pi,
+	or None if no path from s to v exists.  Iterative, so long predecessor chains do not
+	hit the recursion limit: walks up from v to s and reverses the list once.
+
+	Arguments:
+	pi -- vertex predecessors, indexed by vertex, with None for no predecessor
+	s -- source vertex for the path
+	v -- end vertex for the path
+	"""
+	path = [v]
+	while v != s:
+		v = pi[v]
+		if v is None:
+			return None
+		path.append(v)
+		if len(path) > len(pi):
+			raise RuntimeError("Predecessors contain a cycle")
+	path.reverse()
+	return path
+
+
+def reconstruct_paths(pi, s, targets):
+	"""Return a dictionary mapping each vertex in targets to its path from s, as returned
+	by reconstruct_path.  The walk up from each target stops at the first earlier target
+	it reaches, whose path then serves as the prefix, and at any vertex already known to
+	have no path from s.
+
+	Arguments:
+	pi -- vertex predecessors, indexed by vertex, with None for no predecessor
+	s -- source vertex for the paths
+	targets -- iterable of end vertices
+	"""
+	targets = list(targets)
+	paths = {s: [s]}
+	unreachable = set()  # vertices found to have no path from s
+	for v in targets:
+		if v in paths:
+			continue
+		chain = []
+		u = v
+		while u is not None and u not in paths and u not in unreachable:
+			chain.append(u)
+			u = pi[u]
+			if len(chain) > len(pi):
+				raise RuntimeError("Predecessors contain a cycle")
+		if u is None or u in unreachable:
+			unreachable.update(chain)
+			paths[v] = None
+		else:
+			chain.reverse()
+			paths[v] = paths[u] + chain
+	return {v: paths[v] for v in targets}
+
+
+def print_path(pi, s, v, mapping_func):
+	"""Return a path of the vertices on a path from s to v as a list.
+	Returns None if no path from s to v exists.
+	Differs from Print-Path in the textbook because this function does not actually print.
+	It is up to the caller to print.  Iterative, using reconstruct_path.
+
+	Inputs:
+	pi: vertex predecessors on the path from s to v
+	s: source vertex for the path
+	v: end vertex for the path
+	mapping_func: function to map vertex numbers to what they print as
+	"""
+	path = reconstruct_path(pi, s, v)
+	if path is None:
+		return None
+	return [mapping_func(u) for u in path]
+
+
+# Testing
+if __name__ == "__main__":
+
+	# A long chain 0 -> 1 -> ... -> n-1 would exceed the recursion limit of a recursive version.
+	n = 100000
+	pi = [None] + list(range(n - 1))
+	print(reconstruct_path(pi, 0, n - 1) == list(range(n)), print_path(pi, 0, 3, str))
+	print(reconstruct_path(pi, 5, 2), reconstruct_path([None, None, 1], 0, 2))
+
+	# A tree of paths from vertex 0: all paths at once agree with one at a time.
+	pi = [None, 0, 0, 1, 1, 2, 3, 3, None, 8]
+	paths = reconstruct_paths(pi, 0, [6, 3, 7, 9, 5, 0, 8])
+	print(paths)
+	print(all(paths[v] == reconstruct_path(pi, 0, v) for v in paths))
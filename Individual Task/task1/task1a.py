@@ -15,15 +15,29 @@ sys.path.insert(0, os.path.join(CLRS_ROOT, "Chapter 10"))
 sys.path.insert(0, os.path.join(CLRS_ROOT, "Chapter 31"))
 
 # Now you can import
-from chained_hashtable import ChainedHashTable
-from hash_functions import hashpjw
+from chained_hashtable import ResizingChainedHashTable
+from station_set import StationSet
+from hash_functions import cached_hashpjw
 
 class StationStatusTracker:
     """Track operational status of London Underground stations using chained hash table."""
 
-    def __init__(self, table_size=11):
-        """Initialize with hash table of given size (default: 11 for 5 stations)."""
-        self.operational_stations = ChainedHashTable(table_size, hash_func=hashpjw)
+    def __init__(self, table_size=11, max_load_factor=1.0, incremental_rehash=False, backend="chained"):
+        """Initialize with hash table of given initial size (default: 11 for 5 stations).
+        The table grows to keep the load factor at most max_load_factor; with
+        incremental_rehash the move to a larger table is spread across later updates.
+        backend "robin_hood" uses the open-address StationSet instead of chaining
+        (incremental_rehash does not apply to it)."""
+        # Station names are hashed once each and the hash is remembered.
+        if backend == "chained":
+            self.operational_stations = ResizingChainedHashTable(table_size, hash_func=cached_hashpjw,
+                                                                 max_load_factor=max_load_factor,
+                                                                 incremental=incremental_rehash)
+        elif backend == "robin_hood":
+            self.operational_stations = StationSet(table_size, hash_func=cached_hashpjw,
+                                                   max_load_factor=min(max_load_factor, 0.85))
+        else:
+            raise RuntimeError(f"Unknown backend: {backend}")
         self.table_size = table_size
         self.station_count = 0
 
@@ -49,6 +63,11 @@ class StationStatusTracker:
         result = self.operational_stations.search(station_name)
         return result is not None
 
+    def status_mask(self, station_names):
+        """Return a list of booleans, one per station in graph vertex order, for use as
+        the mask argument of bfs and dijkstra."""
+        return [self.is_operational(name) for name in station_names]
+
     def get_status(self, station_name):
         """Get descriptive status text for a station."""
         if self.is_operational(station_name):
@@ -85,4 +104,13 @@ if __name__ == "__main__":
     print(tracker.get_status("D"))
     print(tracker.get_status("A"))
 
+    print("\nSAME SEQUENCE WITH THE ROBIN HOOD BACKEND")
+    robin_hood = StationStatusTracker(backend="robin_hood")
+    for station in stations:
+        robin_hood.mark_operational(station)
+    robin_hood.mark_closed("B")
+    robin_hood.mark_closed("D")
+    print(all(robin_hood.is_operational(s) == tracker.is_operational(s) for s in stations + ["F"]))
+    print("Status mask for bfs/dijkstra:", tracker.status_mask(stations))
+
     print("=" * 60)
\ No newline at end of file
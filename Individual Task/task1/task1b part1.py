@@ -2,7 +2,7 @@
 # Task 1b Part 1: Empirical Performance Measurement
 # Riyah Hussain
 
-import os, sys, random, time
+import os, sys, random
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -14,9 +14,11 @@ CLRS_ROOT = os.path.join(PROJECT_ROOT, "clrsPython")
 sys.path.insert(0, os.path.join(CLRS_ROOT, "Chapter 11"))
 sys.path.insert(0, os.path.join(CLRS_ROOT, "Chapter 10"))
 sys.path.insert(0, os.path.join(CLRS_ROOT, "Chapter 31"))
+sys.path.insert(0, os.path.join(os.path.dirname(PROJECT_ROOT), "benchmarks"))
 
 from chained_hashtable import ChainedHashTable
-from hash_functions import hashpjw
+from hash_functions import hashpjw, next_prime
+from harness import run_case, fit_exponent
 
 class StationStatusTracker:
     """Track operational status using chained hash table."""
@@ -52,6 +54,10 @@ def measure_average_query_time(tracker, stations, num_queries=10000):
     """
     Measure average time per status check over random queries.
 
+    The whole batch of queries is timed repeatedly by the benchmark harness, after a
+    warm-up and with garbage collection off, and the median batch time is used, so
+    one slow batch does not skew the result.
+
     Args:
         tracker: StationStatusTracker instance
         stations: list of station names to query from
@@ -60,40 +66,20 @@ def measure_average_query_time(tracker, stations, num_queries=10000):
     Returns:
         Average time per query in microseconds
     """
-    total_time = 0.0
-
-    for _ in range(num_queries):
-        # Random station from the dataset
-        station = random.choice(stations)
+    queries = [random.choice(stations) for _ in range(num_queries)]
 
-        # Measure query time
-        start = time.perf_counter()
-        tracker.is_operational(station)
-        end = time.perf_counter()
+    def check_all():
+        for station in queries:
+            tracker.is_operational(station)
 
-        total_time += (end - start)
+    result = run_case("is_operational", check_all, {"n": len(stations)},
+                      target_time=0.5, warmup_time=0.1, min_samples=10)
 
     # Return average time in microseconds
-    avg_time_microseconds = (total_time / num_queries) * 1_000_000
+    avg_time_microseconds = result.stats["median"] / num_queries * 1_000_000
     return avg_time_microseconds
 
 
-def find_next_prime(n):
-    """Find the next prime number greater than or equal to n."""
-
-    def is_prime(num):
-        if num < 2:
-            return False
-        for i in range(2, int(num ** 0.5) + 1):
-            if num % i == 0:
-                return False
-        return True
-
-    while not is_prime(n):
-        n += 1
-    return n
-
-
 def run_performance_analysis(dataset_sizes, num_queries=10000):
     """
     Run performance analysis for different dataset sizes.
@@ -125,7 +111,7 @@ def run_performance_analysis(dataset_sizes, num_queries=10000):
         stations = generate_station_dataset(n)
 
         # Choose table size as next prime >= n (for better hash distribution)
-        table_size = find_next_prime(n)
+        table_size = next_prime(n)
 
         # Build data structure
         tracker = build_data_structure(stations, table_size)
@@ -237,19 +223,22 @@ def analyze_alignment(results):
     print("  • Python's memory management overhead")
     print("  • System background processes during measurement")
 
-    # Calculate growth rate
+    # Fit time = c * n^k: for O(1) the empirical exponent k should be close to 0
     if len(n_values) > 1:
-        time_growth = ((avg_times[-1] - avg_times[0]) / avg_times[0]) * 100
-        size_growth = ((n_values[-1] - n_values[0]) / n_values[0]) * 100
+        fit = fit_exponent(n_values, avg_times)
         print(f"\nGrowth Analysis:")
-        print(f"  Dataset size increased by: {size_growth:.1f}%")
-        print(f"  Query time increased by: {time_growth:.1f}%")
-        print(f"  Growth ratio (time/size): {time_growth / size_growth:.4f}")
+        print(f"  Empirical exponent k (time ~ n^k): {fit['exponent']:.4f}", end="")
+        print(f" ± {fit['stderr']:.4f}" if fit['stderr'] is not None else "")
+        print(f"  R² of the log-log fit: {fit['r_squared']:.4f}")
+        growth = (n_values[-1] / n_values[0]) ** fit['exponent']
+        print(f"  Predicted time growth over the {n_values[-1] / n_values[0]:.0f}x size range: {growth:.2f}x")
 
-        if abs(time_growth) < 20:
+        if abs(fit['exponent']) < 0.1:
             print("  → Time complexity appears constant (O(1)) ✓")
+        elif fit['exponent'] < 1:
+            print("  → Some growth observed, but sublinear in the dataset size")
         else:
-            print("  → Some growth observed, but significantly less than dataset growth")
+            print("  → Time grows at least linearly with the dataset size")
 
 
 if __name__ == "__main__":
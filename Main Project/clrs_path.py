@@ -0,0 +1,14 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Puts every clrsPython folder on sys.path, so that `from bfs import bfs` and the
+# like work from the Main Project modules in the same way as in the task scripts.
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLRS_ROOT = os.path.join(PROJECT_ROOT, "clrsPython")
+
+for name in sorted(os.listdir(CLRS_ROOT)):
+    path = os.path.join(CLRS_ROOT, name)
+    if os.path.isdir(path) and path not in sys.path:
+        sys.path.append(path)
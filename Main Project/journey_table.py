@@ -0,0 +1,193 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Precomputed all-pairs journey table: journey times, fewest stops, and next hops
+# for every pair of stations, so that planner queries become table lookups.
+
+import clrs_path  # noqa: F401  (puts the clrsPython folders on sys.path)
+
+import numpy as np
+from bfs import bfs
+from dijkstra import dijkstra
+from floyd_warshall import floyd_warshall, NIL
+
+NO_HOP = -1    # next_hop entry when no path exists
+NO_STOPS = -1  # stops entry when no path exists
+
+
+class JourneyTable:
+    """All-pairs journey times and paths for a station graph.
+
+    times[a, b] is the shortest journey time from a to b (infinity if unreachable),
+    stops[a, b] is the fewest number of stops from a to b (NO_STOPS if unreachable),
+    and next_hop[a, b] is the station after a on a fastest path to b.
+    Stations can be given by index or, if names were supplied, by name.
+    """
+
+    def __init__(self, times, next_hop, stops, names=None):
+        self.times = times
+        self.next_hop = next_hop
+        self.stops_matrix = stops
+        self.names = list(names) if names is not None else None
+        self.index = {name: i for i, name in enumerate(self.names)} if names is not None else None
+
+    def get_card_V(self):
+        """Return the number of stations in the table."""
+        return self.times.shape[0]
+
+    def vertex(self, station):
+        """Return the index of a station given by name or index."""
+        if self.index is not None and station in self.index:
+            return self.index[station]
+        if isinstance(station, (int, np.integer)) and 0 <= station < self.get_card_V():
+            return int(station)
+        raise KeyError("Unknown station: " + str(station))
+
+    def time(self, a, b):
+        """Return the shortest journey time from a to b, or infinity if unreachable."""
+        return self.times[self.vertex(a), self.vertex(b)].item()
+
+    def stops(self, a, b):
+        """Return the fewest number of stops from a to b, or None if unreachable."""
+        n = self.stops_matrix[self.vertex(a), self.vertex(b)].item()
+        return None if n == NO_STOPS else n
+
+    def path(self, a, b):
+        """Return the stations on a fastest path from a to b, or None if unreachable.
+        Names are returned if the table has names, indices otherwise."""
+        u = self.vertex(a)
+        v = self.vertex(b)
+        path = [u]
+        while u != v:
+            u = self.next_hop[u, v].item()
+            if u == NO_HOP:
+                return None
+            path.append(u)
+            if len(path) > self.get_card_V():
+                raise RuntimeError("Next-hop table has a cycle between " + str(a) + " and " + str(b))
+        if self.names is not None:
+            return [self.names[i] for i in path]
+        return path
+
+    def save(self, filename):
+        """Save the table as a NumPy .npz archive."""
+        arrays = {"times": self.times, "next_hop": self.next_hop, "stops": self.stops_matrix}
+        if self.names is not None:
+            arrays["names"] = np.array(self.names, dtype=str)
+        np.savez(filename, **arrays)
+
+
+def load_journey_table(filename):
+    """Load a table saved by JourneyTable.save."""
+    with np.load(filename, allow_pickle=False) as archive:
+        names = archive["names"].tolist() if "names" in archive.files else None
+        return JourneyTable(archive["times"], archive["next_hop"], archive["stops"], names)
+
+
+def first_hops(pi, s):
+    """Return, for every vertex v, the vertex after s on the path from s to v given by
+    the predecessors pi (s itself for v == s, NO_HOP if v is unreachable)."""
+    card_V = len(pi)
+    hop = [NO_HOP] * card_V
+    hop[s] = s
+    for v in range(card_V):
+        if hop[v] != NO_HOP or pi[v] is None:
+            continue
+        # Walk up the predecessors until reaching s or a vertex already resolved.
+        chain = []
+        u = v
+        while hop[u] == NO_HOP and pi[u] is not None:
+            chain.append(u)
+            u = pi[u]
+        if hop[u] == NO_HOP:
+            continue
+        first = chain[-1] if u == s else hop[u]
+        for w in chain:
+            hop[w] = first
+    return hop
+
+
+def weight_matrix(G):
+    """Return the n x n weight matrix of G, with 0 on the diagonal and infinity for no edge,
+    keeping the lightest edge if several join the same pair of vertices."""
+    card_V = G.get_card_V()
+    W = np.full((card_V, card_V), float('inf'))
+    for u in range(card_V):
+        for edge in G.get_adj_list(u):
+            v = edge.get_v()
+            W[u, v] = min(W[u, v], edge.get_weight())
+    np.fill_diagonal(W, 0)
+    return W
+
+
+def build_journey_table(G, names=None, method="dijkstra"):
+    """Build a JourneyTable for a weighted graph G.  Journey times and next hops come
+    from Dijkstra's algorithm run from every vertex, or from one run of the vectorized
+    Floyd-Warshall algorithm; fewest stops come from breadth-first search.
+
+    Arguments:
+    G -- a weighted graph with nonnegative weights, such as an AdjacencyListGraph
+    names -- optional list of station names, indexed by vertex
+    method -- "dijkstra" or "floyd_warshall"
+    """
+    card_V = G.get_card_V()
+    times = np.empty((card_V, card_V))
+    next_hop = np.empty((card_V, card_V), dtype=np.int32)
+    stops = np.empty((card_V, card_V), dtype=np.int32)
+    if method == "dijkstra":
+        for s in range(card_V):
+            d, pi = dijkstra(G, s)
+            times[s] = d
+            next_hop[s] = first_hops(pi, s)
+    elif method == "floyd_warshall":
+        times, Pi = floyd_warshall(weight_matrix(G), card_V, predecessors=True)
+        for s in range(card_V):
+            next_hop[s] = first_hops([None if p == NIL else p for p in Pi[s].tolist()], s)
+    else:
+        raise RuntimeError("Unknown method: " + str(method))
+    for s in range(card_V):
+        dist, _ = bfs(G, s)
+        stops[s] = [NO_STOPS if x == float('inf') else x for x in dist]
+    return JourneyTable(times, next_hop, stops, names)
+
+
+# Testing
+if __name__ == "__main__":
+
+    import os
+    import tempfile
+    from adjacency_list_graph import AdjacencyListGraph
+
+    # Task 2A network: the fastest path from A to F is A -> B -> C -> D -> F, 9 minutes.
+    stations = ["A", "B", "C", "D", "E", "F", "G"]
+    edges = [("A", "B", 2), ("A", "C", 4), ("B", "C", 1), ("C", "D", 4), ("C", "E", 5),
+             ("C", "F", 8), ("D", "F", 2), ("E", "F", 2)]
+    graph = AdjacencyListGraph(len(stations), directed=False, weighted=True)
+    for u, v, w in edges:
+        graph.insert_edge(stations.index(u), stations.index(v), w)
+
+    table = build_journey_table(graph, stations)
+    print(table.time("A", "F"), table.stops("A", "F"), table.path("A", "F"))
+    print(table.time("A", "G"), table.stops("A", "G"), table.path("A", "G"))
+
+    # Every entry should agree with a fresh Dijkstra run.
+    all_equal = True
+    for s in range(len(stations)):
+        d, pi = dijkstra(graph, s)
+        for t in range(len(stations)):
+            path = table.path(s, t)
+            if d[t] != table.time(s, t):
+                all_equal = False
+            elif path is not None:
+                length = sum(graph.find_edge(stations.index(path[i]), stations.index(path[i + 1])).get_weight()
+                             for i in range(len(path) - 1))
+                all_equal = all_equal and length == d[t]
+    print("All journey times are " + ("not " if not all_equal else "") + "equal")
+
+    # Floyd-Warshall should give the same times and equally fast paths.
+    fw_table = build_journey_table(graph, stations, method="floyd_warshall")
+    print(np.array_equal(fw_table.times, table.times), fw_table.path("A", "F"))
+
+    # Round trip through a file.
+    filename = os.path.join(tempfile.mkdtemp(), "journey_table.npz")
+    table.save(filename)
+    loaded = load_journey_table(filename)
+    print(loaded.path("A", "F") == table.path("A", "F"), loaded.time("B", "E") == table.time("B", "E"))
@@ -0,0 +1,257 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# One loader for the Underground data: parses the CSV or Excel file once, keeps the
+# fastest time for each pair of adjacent stations, and caches the parsed network in a
+# JSON snapshot next to the source file, so later runs skip the parsing.
+
+import clrs_path  # noqa: F401  (puts the clrsPython folders on sys.path)
+
+import csv
+import hashlib
+import json
+import os
+from adjacency_list_graph import from_edges
+from station_registry import StationStatusRegistry
+
+SNAPSHOT_VERSION = 2  # bump when the snapshot contents change
+
+
+class UndergroundNetwork:
+    """Stations, lines, and the weighted, undirected graph of the Underground.
+
+    Station ids are the vertex numbers of the graph, in order of first appearance in
+    the data.  lines maps each line name to the ids of its stations, and edge_lines
+    maps each edge (u, v) with u < v to the names of the lines that run along it.
+    """
+
+    def __init__(self, names, edges, lines, edge_lines):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.edges = list(edges)
+        self.lines = lines
+        self.edge_lines = edge_lines
+        self.graph = from_edges(len(self.names), self.edges, directed=False, weighted=True)
+
+    def get_graph(self):
+        """Return the network as an AdjacencyListGraph weighted by journey time."""
+        return self.graph
+
+    def get_card_V(self):
+        """Return the number of stations."""
+        return len(self.names)
+
+    def get_names(self):
+        """Return the list of station names, indexed by id."""
+        return self.names
+
+    def get_name(self, v):
+        """Return the name of station id v."""
+        return self.names[v]
+
+    def vertex(self, station):
+        """Return the id of a station given by name."""
+        if station not in self.index:
+            raise KeyError("Unknown station: " + str(station))
+        return self.index[station]
+
+    def get_edges(self):
+        """Return the list of (u, v, time) edges, one per pair of adjacent stations."""
+        return self.edges
+
+    def get_lines(self):
+        """Return a dict from line name to the ids of its stations."""
+        return self.lines
+
+    def status_registry(self):
+        """Return a StationStatusRegistry for these stations and lines, all operational."""
+        return StationStatusRegistry(self.names, self.lines)
+
+
+def read_rows(path):
+    """Return the rows of a CSV or Excel file of the Underground data as lists of
+    strings: line, station, next station, time."""
+    if path.lower().endswith((".xlsx", ".xls")):
+        import pandas as pd  # only needed for Excel files
+        frame = pd.read_excel(path, header=None, dtype=str).fillna("")
+        return frame.values.tolist()
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        return list(csv.reader(file))
+
+
+def parse_rows(rows):
+    """Parse rows of the Underground data into station names, deduplicated edges, and
+    line memberships.  A row with only a line and a station lists the station; a row
+    with two stations and a time is a connection.  Rows whose time is not a number,
+    such as a header, are skipped."""
+    index = {}
+    names = []
+    weights = {}      # (u, v) with u < v -> fastest time
+    lines = {}        # line -> list of station ids
+    edge_lines = {}   # (u, v) with u < v -> set of lines
+
+    def station_id(name, line):
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        v = index[name]
+        if line:
+            members = lines.setdefault(line, [])
+            if v not in members:
+                members.append(v)
+        return v
+
+    for row in rows:
+        row = [str(cell).strip() for cell in row] + [""] * (4 - len(row))
+        line, s1, s2, time = row[:4]
+        if s2 == "" or time == "":
+            if s1 != "" and s2 == "":
+                station_id(s1, line)
+            continue
+        try:
+            w = float(time)
+        except ValueError:
+            continue  # header or malformed row
+        if w == int(w):
+            w = int(w)
+        u = station_id(s1, line)
+        v = station_id(s2, line)
+        if u == v:
+            continue
+        key = (u, v) if u < v else (v, u)
+        if key not in weights or w < weights[key]:
+            weights[key] = w
+        if line:
+            edge_lines.setdefault(key, set()).add(line)
+
+    edges = [(u, v, w) for (u, v), w in weights.items()]
+    return names, edges, lines, edge_lines
+
+
+def file_digest(path):
+    """Return the SHA-256 digest of a file's contents, as a hex string."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_path(path):
+    """Return where the snapshot of a data file is kept."""
+    return path + ".snapshot.json"
+
+
+def encode_snapshot(key, digest, data):
+    """Return the snapshot of parsed data as a dictionary that json can write.  JSON
+    holds only plain data, so reading a snapshot, even a planted one, runs no code."""
+    names, edges, lines, edge_lines = data
+    return {"version": SNAPSHOT_VERSION, "key": list(key), "digest": digest,
+            "names": names, "edges": [list(edge) for edge in edges], "lines": lines,
+            "edge_lines": [[u, v, sorted(members)] for (u, v), members in edge_lines.items()]}
+
+
+def decode_snapshot(snapshot):
+    """Return the parsed data held in a snapshot dictionary, checking its shape."""
+    names = [str(name) for name in snapshot["names"]]
+    card_V = len(names)
+    edges = [(int(u), int(v), w) for u, v, w in snapshot["edges"]]
+    if any(not 0 <= u < card_V or not 0 <= v < card_V or not isinstance(w, (int, float))
+           for u, v, w in edges):
+        raise ValueError("snapshot edge out of range")
+    lines = {str(line): [int(v) for v in members] for line, members in snapshot["lines"].items()}
+    edge_lines = {(int(u), int(v)): set(members) for u, v, members in snapshot["edge_lines"]}
+    return names, edges, lines, edge_lines
+
+
+def write_snapshot(cache, snapshot):
+    """Write a snapshot dictionary, ignoring a location that cannot be written."""
+    try:
+        with open(cache, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file)
+    except OSError:
+        pass  # read-only location: work without a snapshot
+
+
+def load_network(path, use_snapshot=True):
+    """Load the Underground network from a CSV or Excel file.
+
+    If use_snapshot is True, a JSON snapshot of the parsed data is kept next to the
+    file.  It is used when the file's modification time and size are unchanged, or
+    when they changed but the contents hash to the same digest; otherwise the file is
+    parsed again and the snapshot rewritten.
+
+    Arguments:
+    path -- path of the data file
+    use_snapshot -- whether to read and write the snapshot
+    """
+    stat = os.stat(path)
+    key = (SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache = snapshot_path(path)
+    digest = None
+    if use_snapshot and os.path.exists(cache):
+        try:
+            with open(cache, encoding="utf-8") as file:
+                snapshot = json.load(file)
+            if snapshot["version"] == SNAPSHOT_VERSION:
+                if tuple(snapshot["key"]) == key:
+                    return UndergroundNetwork(*decode_snapshot(snapshot))
+                digest = file_digest(path)
+                if snapshot["digest"] == digest:
+                    data = decode_snapshot(snapshot)
+                    snapshot["key"] = list(key)  # touched but unchanged
+                    write_snapshot(cache, snapshot)
+                    return UndergroundNetwork(*data)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # unreadable or malformed snapshot: parse the file again
+
+    data = parse_rows(read_rows(path))
+    if use_snapshot:
+        write_snapshot(cache, encode_snapshot(key, digest if digest is not None else file_digest(path), data))
+    return UndergroundNetwork(*data)
+
+
+# Testing
+if __name__ == "__main__":
+
+    import shutil
+    import tempfile
+    import time
+    from dijkstra import dijkstra
+    from mst import kruskal, get_total_weight
+
+    source = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "Individual Task", "task1", "data", "London_Underground_data.csv")
+    path = os.path.join(tempfile.mkdtemp(), "London_Underground_data.csv")
+    shutil.copy(source, path)
+
+    start = time.perf_counter()
+    network = load_network(path)
+    parsed = time.perf_counter() - start
+    start = time.perf_counter()
+    cached = load_network(path)
+    loaded = time.perf_counter() - start
+    print(network.get_card_V(), "stations,", network.get_graph().get_card_E(), "connections,",
+          len(network.get_lines()), "lines")
+    print("Parsed in", round(parsed * 1000, 2), "ms, loaded from snapshot in", round(loaded * 1000, 2), "ms")
+    print(cached.get_names() == network.get_names() and cached.get_edges() == network.get_edges())
+
+    # Touching the file without changing it still uses the snapshot.
+    os.utime(path, None)
+    print(load_network(path).get_edges() == network.get_edges())
+
+    print(cached.get_lines() == network.get_lines() and cached.edge_lines == network.edge_lines)
+
+    # A malformed snapshot is ignored and rewritten.
+    with open(snapshot_path(path), encoding="utf-8") as file:
+        snapshot = json.load(file)
+    snapshot["edges"][0][1] = network.get_card_V()  # no such station
+    with open(snapshot_path(path), "w", encoding="utf-8") as file:
+        json.dump(snapshot, file)
+    print(load_network(path).get_edges() == network.get_edges())
+
+    graph = network.get_graph()
+    d, pi = dijkstra(graph, network.vertex("Baker Street"))
+    print("Baker Street to Elephant & Castle:", d[network.vertex("Elephant & Castle")], "minutes")
+    print("Backbone total time:", get_total_weight(kruskal(graph)))
+    registry = network.status_registry()
+    registry.close_line("Waterloo & City")
+    print(registry.operational_count(), "stations open with the Waterloo & City closed")
@@ -0,0 +1,164 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Operational-status registry: station names are mapped to dense integer ids once,
+# and status is kept as one bit per station, so whole lines open and close at once.
+
+
+class StationStatusRegistry:
+    """Operational status of every station, stored as a bitset in a bytearray.
+
+    Bit i is set when station i is operational.  Stations can be given by name or by
+    id, where ids are the positions in the list of stations the registry was built
+    from, so they can match the vertex numbering of a graph.  The registry can be
+    indexed by vertex id, so it serves directly as a status mask for bfs and dijkstra.
+    """
+
+    def __init__(self, stations, lines=None):
+        """Arguments:
+        stations -- list of station names, indexed by id.  All start operational.
+        lines -- optional dict from line name to the names or ids of its stations
+        """
+        self.names = list(stations)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise RuntimeError("Station names must be unique")
+        self.nbytes = (len(self.names) + 7) // 8
+        self.all_mask = (1 << len(self.names)) - 1
+        self.bits = bytearray(self.all_mask.to_bytes(self.nbytes, "little"))
+        self.line_masks = {}
+        for line, members in (lines or {}).items():
+            self.add_line(line, members)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, v):
+        """Return True if station id v is operational."""
+        return (self.bits[v >> 3] >> (v & 7)) & 1 == 1
+
+    def vertex(self, station):
+        """Return the id of a station given by name or id."""
+        if station in self.index:
+            return self.index[station]
+        if isinstance(station, int) and 0 <= station < len(self.names):
+            return station
+        raise KeyError("Unknown station: " + str(station))
+
+    def get_name(self, v):
+        """Return the name of station id v."""
+        return self.names[v]
+
+    def add_line(self, line, members):
+        """Record which stations, given by name or id, are on a line."""
+        self.line_masks[line] = self.mask_of(members)
+
+    def get_lines(self):
+        """Return the names of the known lines."""
+        return list(self.line_masks)
+
+    def mask_of(self, stations):
+        """Return an integer with the bit of each given station set."""
+        mask = 0
+        for station in stations:
+            mask |= 1 << self.vertex(station)
+        return mask
+
+    def get_mask(self):
+        """Return the status bits as one integer."""
+        return int.from_bytes(self.bits, "little")
+
+    def set_mask(self, mask):
+        """Replace the status bits with those of an integer."""
+        self.bits[:] = (mask & self.all_mask).to_bytes(self.nbytes, "little")
+
+    def is_operational(self, station):
+        """PRIMARY QUERY: Return True if a station, given by name or id, is operational."""
+        return self[self.vertex(station)]
+
+    def mark_operational(self, station):
+        """Mark one station as operational. Returns True if it was closed."""
+        v = self.vertex(station)
+        was_closed = not self[v]
+        self.bits[v >> 3] |= 1 << (v & 7)
+        return was_closed
+
+    def mark_closed(self, station):
+        """Mark one station as closed. Returns True if it was operational."""
+        v = self.vertex(station)
+        was_operational = self[v]
+        self.bits[v >> 3] &= ~(1 << (v & 7)) & 0xFF
+        return was_operational
+
+    def close_many(self, stations):
+        """Close every given station with one bitwise operation on the whole bitset."""
+        self.set_mask(self.get_mask() & ~self.mask_of(stations))
+
+    def open_many(self, stations):
+        """Open every given station with one bitwise operation on the whole bitset."""
+        self.set_mask(self.get_mask() | self.mask_of(stations))
+
+    def close_line(self, line):
+        """Close every station on a line."""
+        if line not in self.line_masks:
+            raise KeyError("Unknown line: " + str(line))
+        self.set_mask(self.get_mask() & ~self.line_masks[line])
+
+    def open_line(self, line):
+        """Reopen every station on a line."""
+        if line not in self.line_masks:
+            raise KeyError("Unknown line: " + str(line))
+        self.set_mask(self.get_mask() | self.line_masks[line])
+
+    def operational_count(self):
+        """Return the number of operational stations."""
+        return self.get_mask().bit_count()
+
+    def operational_stations(self):
+        """Yield the ids of the operational stations in increasing order, skipping
+        whole bytes in which every station is closed."""
+        for i, byte in enumerate(self.bits):
+            base = i << 3
+            while byte:
+                low = byte & -byte  # lowest set bit
+                yield base + low.bit_length() - 1
+                byte ^= low
+
+
+# Testing
+if __name__ == "__main__":
+
+    stations = ["Ealing Broadway", "Acton Town", "Hammersmith", "Earl's Court", "Victoria",
+                "Westminster", "Embankment", "Monument", "Tower Hill", "Bank", "Oxford Circus",
+                "Green Park"]
+    lines = {"District": ["Ealing Broadway", "Acton Town", "Hammersmith", "Earl's Court",
+                          "Victoria", "Westminster", "Embankment", "Monument", "Tower Hill"],
+             "Central": ["Ealing Broadway", "Oxford Circus", "Bank"],
+             "Victoria": ["Victoria", "Green Park", "Oxford Circus"]}
+    registry = StationStatusRegistry(stations, lines)
+    print(registry.operational_count(), registry.is_operational("Bank"))
+
+    registry.close_line("District")
+    print([registry.get_name(v) for v in registry.operational_stations()])
+    print(registry.is_operational("Westminster"), registry[registry.vertex("Green Park")])
+
+    registry.open_many(["Westminster", "Embankment"])
+    registry.close_many([10, 11])
+    print([registry.get_name(v) for v in registry.operational_stations()])
+    print(registry.mark_closed("Bank"), registry.mark_closed("Bank"), registry.mark_operational("Bank"))
+
+    registry.open_line("District")
+    print(registry.operational_count())
+
+    # Random bulk operations should match a Python set of operational ids.
+    from random import sample, random
+    big = StationStatusRegistry(["station " + str(i) for i in range(300)])
+    expected = set(range(300))
+    for step in range(200):
+        ids = sample(range(300), 40)
+        if random() < 0.5:
+            big.close_many(ids)
+            expected -= set(ids)
+        else:
+            big.open_many(ids)
+            expected |= set(ids)
+    print(list(big.operational_stations()) == sorted(expected),
+          all(big[v] == (v in expected) for v in range(300)))
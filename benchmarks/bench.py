@@ -0,0 +1,328 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Benchmark regression suite: runs the fixed matrix of workloads in several independent
+# processes, compares the per-process medians with a stored baseline and flags
+# statistically significant slowdowns, and fits the empirical growth exponent of a
+# workload family.
+#
+#   python bench.py run [--filter TEXT] [--runs 5] [--json FILE] [--csv FILE]
+#   python bench.py compare --baseline results/baseline.json [--update-baseline]
+#   python bench.py fit --family bfs-gnp [--sizes 1000 2000 5000]
+
+import clrs_path  # noqa: F401  (puts the clrsPython folders on sys.path)
+
+import argparse
+import csv
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from harness import case_key, environment, fit_exponent, format_result, load_json, run_case, write_json
+from workloads import FIT_FAMILIES, all_workloads
+
+RUNS = 5             # independent processes per run or comparison
+TARGET_TIME = 0.3    # seconds of samples per case in each process
+SIGNIFICANCE = 0.01  # largest p-value counted as a real change
+THRESHOLD = 0.10     # smallest relative change of the median worth reporting
+HASH_SEED = "0"      # PYTHONHASHSEED of the processes, so set and dict layouts repeat
+RUN_STATISTICS = ("median", "p95", "p99")
+
+
+def run_workloads(pattern=None, target_time=TARGET_TIME, verbose=True):
+    """Run every workload whose key contains pattern in this process, printing each
+    result if verbose, and return the list of CaseResults."""
+    results = []
+    for workload in all_workloads():
+        if pattern and pattern not in case_key(workload.name, workload.params):
+            continue
+        func, setup = workload.prepare()
+        result = run_case(workload.name, func, workload.params, setup, target_time=target_time)
+        if verbose:
+            print(format_result(result), flush=True)
+        results.append(result)
+    return results
+
+
+def run_processes(runs, pattern=None, target_time=TARGET_TIME):
+    """Run the workloads in runs fresh processes, one after another, and return a list
+    of summaries, one per case, as made by summarize_runs.
+
+    Each process builds its own graphs and tables, with the same seeds and the same
+    PYTHONHASHSEED, so the runs differ only in the variation between processes, such
+    as memory layout and the state of the machine, which a comparison must count.
+    """
+    env = dict(os.environ, PYTHONHASHSEED=HASH_SEED)
+    directory = tempfile.mkdtemp()
+    per_run = []
+    try:
+        for run in range(runs):
+            output = os.path.join(directory, f"run-{run}.json")
+            command = [sys.executable, os.path.abspath(__file__), "run", "--runs", "1", "--quiet",
+                       "--target-time", str(target_time), "--json", output]
+            if pattern:
+                command += ["--filter", pattern]
+            start = time.perf_counter()
+            subprocess.run(command, env=env, check=True)
+            print(f"run {run + 1}/{runs} done in {time.perf_counter() - start:.1f} s", flush=True)
+            per_run.append(load_json(output))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return summarize_runs(per_run)
+
+
+def summarize_runs(per_run):
+    """Combine the results of several runs, each a dictionary from key to result
+    dictionary as returned by load_json, into one summary per case: for each of
+    RUN_STATISTICS, the list of its values over the runs, and their median."""
+    summaries = []
+    for key, first in per_run[0].items():
+        results = [run[key] for run in per_run if key in run]
+        summary = {"name": first["name"], "params": first["params"], "key": key, "runs": len(results)}
+        for name in RUN_STATISTICS:
+            values = [result["stats"][name] for result in results]
+            summary["run_" + name + "s"] = values
+            summary[name] = float(np.median(values))
+        summaries.append(summary)
+    return summaries
+
+
+def write_summaries(summaries, filename):
+    """Write run summaries, with a description of the environment, as JSON."""
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "summaries": summaries}, file, indent=1)
+
+
+def load_summaries(filename):
+    """Load run summaries written by write_summaries, returning a dictionary from key
+    to summary."""
+    with open(filename, encoding="utf-8") as file:
+        data = json.load(file)
+    if "summaries" not in data:
+        raise RuntimeError(filename + " holds no per-run summaries; it was written by an older "
+                           "version of bench.py, so make a new baseline.")
+    return {s["key"]: s for s in data["summaries"]}
+
+
+def write_summaries_csv(summaries, filename):
+    """Write one row per case: the median over the runs of each statistic, and the
+    fastest and slowest run median."""
+    with open(filename, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["key", "runs", "median", "median_min", "median_max",
+                                                  "p95", "p99"])
+        writer.writeheader()
+        for s in summaries:
+            writer.writerow({"key": s["key"], "runs": s["runs"], "median": s["median"],
+                             "median_min": min(s["run_medians"]), "median_max": max(s["run_medians"]),
+                             "p95": s["p95"], "p99": s["p99"]})
+
+
+def format_summary(summary):
+    """Return a one-line summary of a case over its runs, with times in microseconds."""
+    medians = summary["run_medians"]
+    return (f"{summary['key']:<45} median {summary['median'] * 1e6:10.2f} us "
+            f"[runs {min(medians) * 1e6:.2f} to {max(medians) * 1e6:.2f}]  "
+            f"p95 {summary['p95'] * 1e6:10.2f}  p99 {summary['p99'] * 1e6:10.2f}  runs={summary['runs']}")
+
+
+def mann_whitney(x, y):
+    """Return the two-sided p-value of the Mann-Whitney U test that samples x and y
+    come from the same distribution.  The p-value is exact when there are no ties and
+    the samples are small, as the handful of per-run medians compared here are, and
+    otherwise comes from the normal approximation with a correction for ties."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = np.concatenate([x, y])
+    order = np.argsort(combined, kind="mergesort")
+    ranks = np.empty(len(combined))
+    ranks[order] = np.arange(1, len(combined) + 1)
+    _, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    ranks = (np.bincount(inverse, weights=ranks) / counts)[inverse]  # average ranks of ties
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    if counts.max() == 1 and n1 * n2 <= 400:
+        return exact_mann_whitney(round(u), n1, n2)
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - float((counts ** 3 - counts).sum()) / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return math.erfc(max(z, 0) / math.sqrt(2))
+
+
+def exact_mann_whitney(u, n1, n2):
+    """Return the exact two-sided p-value of a Mann-Whitney statistic u for samples of
+    sizes n1 and n2 without ties, by counting the orderings of the samples that give
+    each value of U."""
+    size = n1 * n2 + 1
+    # previous[j][v] is the number of orderings of i - 1 x's and j y's with U = v.  The
+    # largest of i x's and j y's is either an x, above all j y's, or a y.
+    previous = [[1] + [0] * (size - 1) for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        current = [[1] + [0] * (size - 1)]
+        for j in range(1, n2 + 1):
+            above, below = previous[j], current[j - 1]
+            current.append([below[v] + (above[v - j] if v >= j else 0) for v in range(size)])
+        previous = current
+    counts = previous[n2]
+    total = sum(counts)
+    lower = sum(counts[:u + 1]) / total
+    upper = sum(counts[u:]) / total
+    return min(1.0, 2 * min(lower, upper))
+
+
+def compare_case(baseline, current, significance=SIGNIFICANCE, threshold=THRESHOLD):
+    """Compare the summaries of one case from two sets of runs.
+
+    The unit of comparison is a run: each run's median is one observation, so that
+    the variation between processes, which is much larger than the variation within
+    one, is part of the test.  A case is a regression when the median over the runs
+    is slower by more than threshold and the Mann-Whitney test on the run medians
+    rejects equal distributions at the significance level; an improvement likewise
+    when faster.  Returns (verdict, ratio of medians, p-value), verdict one of
+    "regression", "improvement", or "unchanged".
+    """
+    ratio = current["median"] / baseline["median"] if baseline["median"] > 0 else float('inf')
+    p = mann_whitney(baseline["run_medians"], current["run_medians"])
+    verdict = "unchanged"
+    if p < significance:
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+    return verdict, ratio, p
+
+
+def compare_results(baseline, current, significance=SIGNIFICANCE, threshold=THRESHOLD):
+    """Compare two sets of runs, each a dictionary from key to summary as returned by
+    load_summaries, and return a list of (key, verdict, ratio, p-value), with verdict
+    "new" for a case missing from the baseline and "missing" for one missing from the
+    current runs."""
+    rows = []
+    for key, summary in current.items():
+        if key not in baseline:
+            rows.append((key, "new", None, None))
+        else:
+            rows.append((key,) + compare_case(baseline[key], summary, significance, threshold))
+    rows += [(key, "missing", None, None) for key in baseline if key not in current]
+    return rows
+
+
+def format_report(rows):
+    """Return the comparison as text, one line per case and a summary line."""
+    lines = [f"{'case':<45} {'change':>9} {'p-value':>9}  verdict"]
+    for key, verdict, ratio, p in rows:
+        change = f"{(ratio - 1) * 100:+8.1f}%" if ratio is not None else f"{'':>9}"
+        p_text = f"{p:9.2g}" if p is not None else f"{'':>9}"
+        flag = verdict.upper() if verdict in ("regression", "improvement") else verdict
+        lines.append(f"{key:<45} {change} {p_text}  {flag}")
+    counts = {}
+    for row in rows:
+        counts[row[1]] = counts.get(row[1], 0) + 1
+    lines.append(", ".join(f"{counts[v]} {v}" for v in sorted(counts)))
+    return "\n".join(lines)
+
+
+def run_fit(family, sizes=None, target_time=0.5):
+    """Time a workload family at several sizes and return (sizes, median times, fit),
+    the fit as returned by harness.fit_exponent."""
+    if family not in FIT_FAMILIES:
+        raise RuntimeError("Unknown family " + family + ", expected one of " + ", ".join(FIT_FAMILIES))
+    prepare, default_sizes = FIT_FAMILIES[family]
+    sizes = list(sizes or default_sizes)
+    times = []
+    for n in sizes:
+        func, setup = prepare(n)
+        result = run_case(family, func, {"n": n}, setup, target_time=target_time)
+        print(format_result(result), flush=True)
+        times.append(result.stats["median"])
+    return sizes, times, fit_exponent(sizes, times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark regression suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the workloads and write the results")
+    compare_parser = commands.add_parser("compare", help="run the workloads and compare with a baseline")
+    for command in (run_parser, compare_parser):
+        command.add_argument("--filter", help="run only workloads whose name or parameters contain this")
+        command.add_argument("--runs", type=int, default=RUNS, help="number of independent processes")
+        command.add_argument("--target-time", type=float, default=TARGET_TIME,
+                             help="seconds of samples per case in each process")
+        command.add_argument("--csv", help="also write a summary of each case to this CSV file")
+    run_parser.add_argument("--json", help="write results to this JSON file")
+    run_parser.add_argument("--quiet", action="store_true", help="do not print each result")
+    compare_parser.add_argument("--baseline", required=True,
+                                help="JSON results to compare with; written by this run if it does not exist")
+    compare_parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                                help="smallest relative change of the median to flag")
+    compare_parser.add_argument("--significance", type=float, default=SIGNIFICANCE,
+                                help="largest p-value to flag")
+    compare_parser.add_argument("--update-baseline", action="store_true",
+                                help="replace the baseline with this run's results")
+
+    fit_parser = commands.add_parser("fit", help="estimate the growth exponent of a workload family")
+    fit_parser.add_argument("--family", required=True, choices=sorted(FIT_FAMILIES))
+    fit_parser.add_argument("--sizes", type=int, nargs="+", help="input sizes, at least two")
+    fit_parser.add_argument("--target-time", type=float, default=0.5, help="seconds of samples per size")
+    args = parser.parse_args(argv)
+
+    if args.command == "fit":
+        sizes, times, fit = run_fit(args.family, args.sizes, args.target_time)
+        stderr = f" ± {fit['stderr']:.3f}" if fit["stderr"] is not None else ""
+        print(f"{args.family}: time ~ n^{fit['exponent']:.3f}{stderr}  (R² = {fit['r_squared']:.4f})")
+        return 0
+
+    if args.command == "run" and args.runs == 1:
+        # One run in this process, as each of the processes started by run_processes does.
+        results = run_workloads(args.filter, args.target_time, not args.quiet)
+        if args.json:
+            write_json(results, args.json)
+        if args.csv:
+            write_summaries_csv(summarize_runs([{r.get_key(): r.to_dict() for r in results}]), args.csv)
+        return 0
+
+    summaries = run_processes(args.runs, args.filter, args.target_time)
+    print()
+    for summary in summaries:
+        print(format_summary(summary))
+    if args.csv:
+        write_summaries_csv(summaries, args.csv)
+    if args.command == "run":
+        if args.json:
+            write_summaries(summaries, args.json)
+        return 0
+
+    if 2 / math.comb(2 * args.runs, args.runs) >= args.significance:
+        print(f"Warning: with {args.runs} runs no p-value can fall below {args.significance}, "
+              "so nothing will be flagged; use more runs.")
+
+    # Results are saved next to the baseline, so a history of runs builds up there.
+    directory = os.path.dirname(os.path.abspath(args.baseline))
+    os.makedirs(directory, exist_ok=True)
+    output = os.path.join(directory, "results-" + time.strftime("%Y%m%d-%H%M%S") + ".json")
+    write_summaries(summaries, output)
+    print("\nResults written to", output)
+    if not os.path.exists(args.baseline):
+        shutil.copy(output, args.baseline)
+        print("No baseline found; saved these results as the baseline", args.baseline)
+        return 0
+
+    rows = compare_results(load_summaries(args.baseline), load_summaries(output),
+                           args.significance, args.threshold)
+    print()
+    print(format_report(rows))
+    if args.update_baseline:
+        shutil.copy(output, args.baseline)
+        print("Baseline updated from", output)
+    return 1 if any(verdict == "regression" for _, verdict, _, _ in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
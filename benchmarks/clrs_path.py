@@ -0,0 +1,17 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Puts every clrsPython folder and the Main Project folder on sys.path, so that the
+# benchmarks can import the algorithms and the network loader as the project does.
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLRS_ROOT = os.path.join(PROJECT_ROOT, "clrsPython")
+
+for name in sorted(os.listdir(CLRS_ROOT)):
+    path = os.path.join(CLRS_ROOT, name)
+    if os.path.isdir(path) and path not in sys.path:
+        sys.path.append(path)
+MAIN_PROJECT = os.path.join(PROJECT_ROOT, "Main Project")
+if MAIN_PROJECT not in sys.path:
+    sys.path.append(MAIN_PROJECT)
@@ -0,0 +1,300 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# Benchmark harness: runs each case for a target time after a warm-up, with garbage
+# collection disabled, and reports the median time per call and the p95 and p99 of
+# single calls, with bootstrap confidence intervals, written as JSON or CSV so results
+# can be compared over time.
+
+import clrs_path  # noqa: F401  (puts the clrsPython folders on sys.path)
+
+import csv
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import numpy as np
+
+STATISTICS = (("median", 50), ("p95", 95), ("p99", 99))
+MAX_CALL_TIMES = 20000  # most single-call times kept per case
+
+
+class CaseResult:
+    """Timings of one benchmark case.
+
+    samples holds the time per call of each sample in seconds, where a sample times
+    number calls in a row so that it lasts well above the timer resolution.  The
+    median comes from these samples.  Averaging over a batch hides slow calls, so when
+    number > 1, call_times holds the times of single calls, timed one by one, and
+    the p95 and p99 come from those; when number is 1 the samples are single calls.
+    """
+
+    def __init__(self, name, params, samples, number, call_times=None):
+        self.name = name
+        self.params = dict(params or {})
+        self.samples = list(samples)
+        self.number = number
+        self.call_times = list(call_times) if call_times is not None else None
+        self.stats = summarize(self.samples, self.call_times)
+
+    def get_key(self):
+        """Return a string identifying the case and its parameters, for matching runs."""
+        return case_key(self.name, self.params)
+
+    def to_dict(self):
+        """Return the result as a dictionary that json can write."""
+        return {"name": self.name, "params": self.params, "key": self.get_key(),
+                "number": self.number, "stats": self.stats, "samples": self.samples,
+                "call_times": self.call_times}
+
+    def row(self):
+        """Return the result as one flat dictionary, for a CSV row."""
+        row = {"key": self.get_key(), "name": self.name, "number": self.number}
+        row.update(self.stats)
+        return row
+
+
+def case_key(name, params):
+    """Return the key of a case, such as "dijkstra[graph=grid,n=5000]"."""
+    if not params:
+        return name
+    return name + "[" + ",".join(f"{k}={params[k]}" for k in sorted(params)) + "]"
+
+
+def summarize(samples, call_times=None, confidence=0.95, resamples=1000, seed=0):
+    """Return a dictionary of summary statistics: count, mean, stdev, min, and the
+    median of the samples, and the p95 and p99 of call_times, or of the samples if
+    call_times is None, each with the bounds of a percentile-bootstrap confidence
+    interval (keys such as "median_low" and "median_high")."""
+    a = np.asarray(samples, dtype=float)
+    stats = {"count": len(a), "mean": float(a.mean()),
+             "stdev": float(a.std(ddof=1)) if len(a) > 1 else 0.0, "min": float(a.min())}
+    rng = np.random.default_rng(seed)
+    tails = a if call_times is None else np.asarray(call_times, dtype=float)
+    for (name, q), data in zip(STATISTICS, (a, tails, tails)):
+        value, low, high = bootstrap_percentile(data, q, rng, confidence, resamples)
+        stats[name] = value
+        stats[name + "_low"] = low
+        stats[name + "_high"] = high
+    if call_times is not None:
+        stats["call_count"] = len(tails)
+    return stats
+
+
+def bootstrap_percentile(a, q, rng, confidence=0.95, resamples=1000):
+    """Return the q-th percentile of the array a and the bounds of its percentile-
+    bootstrap confidence interval."""
+    boot = []
+    chunk = max(1, 2_000_000 // len(a))  # bound the memory used by each block of resamples
+    for start in range(0, resamples, chunk):
+        draws = rng.choice(a, size=(min(chunk, resamples - start), len(a)))
+        boot.append(np.percentile(draws, q, axis=1))
+    boot = np.concatenate(boot)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(boot, [tail, 100 - tail])
+    return float(np.percentile(a, q)), float(low), float(high)
+
+
+def time_calls(func, state, number):
+    """Return the seconds taken by number calls of func, passing state if not None."""
+    timer = time.perf_counter
+    if state is None:
+        start = timer()
+        for _ in range(number):
+            func()
+        return timer() - start
+    start = timer()
+    for _ in range(number):
+        func(state)
+    return timer() - start
+
+
+def time_single_calls(func, count, end):
+    """Return the seconds taken by each of up to count calls of func, timed one by one,
+    stopping early once time.perf_counter() passes end."""
+    timer = time.perf_counter
+    times = []
+    while len(times) < count:
+        start = timer()
+        func()
+        finish = timer()
+        times.append(finish - start)
+        if finish > end:
+            break
+    return times
+
+
+def run_case(name, func, params=None, setup=None, target_time=1.0, warmup_time=0.2,
+             min_sample_time=0.002, min_samples=20, max_samples=5000, disable_gc=True):
+    """Benchmark func and return a CaseResult.
+
+    The number of calls per sample grows until a sample takes min_sample_time.
+    Calls then run untimed for warmup_time, and samples are taken until target_time
+    has passed and at least min_samples have been taken, or max_samples is reached.
+    With a setup function, every sample is one call on freshly set-up state, so func
+    should do enough work per call to take well over the timer resolution.
+
+    When a sample is more than one call, half of target_time goes to the samples and
+    half to timing single calls one by one, up to MAX_CALL_TIMES of them, for the
+    p95 and p99.  Those times include the timer's own overhead, well under a
+    microsecond, which matters only for the very fastest functions.
+
+    Arguments:
+    name -- name of the case
+    func -- function to time.  Called with no arguments, or with the result of setup.
+    params -- optional dictionary of parameters describing the case
+    setup -- optional function called before each sample, untimed, whose result is
+    passed to func, for cases such as deletions that use up their input
+    target_time -- seconds to spend taking samples
+    warmup_time -- seconds to spend calling func before taking samples
+    min_sample_time -- shortest time a sample should take
+    min_samples, max_samples -- bounds on the number of samples
+    disable_gc -- whether to turn off garbage collection while timing
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        number = 1
+        while setup is None:
+            elapsed = time_calls(func, None, number)
+            if elapsed >= min_sample_time or number >= 1 << 30:
+                break
+            number *= 2 if elapsed == 0 else max(2, min(10, math.ceil(min_sample_time / elapsed)))
+
+        end = time.perf_counter() + warmup_time
+        while time.perf_counter() < end:
+            time_calls(func, setup() if setup is not None else None, number)
+
+        samples = []
+        sample_time = target_time if number == 1 else target_time / 2
+        end = time.perf_counter() + sample_time
+        while len(samples) < max_samples and (len(samples) < min_samples or time.perf_counter() < end):
+            state = setup() if setup is not None else None
+            samples.append(time_calls(func, state, number) / number)
+
+        call_times = None
+        if number > 1:
+            call_times = time_single_calls(func, MAX_CALL_TIMES, time.perf_counter() + target_time / 2)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return CaseResult(name, params, samples, number, call_times)
+
+
+def fit_exponent(sizes, times):
+    """Fit times = c * sizes^k by least squares on a log-log scale, to estimate the
+    empirical exponent k of the growth of running time with input size.
+
+    Returns:
+    A dictionary with the exponent, its standard error (None with fewer than three
+    points), the coefficient c, and r_squared, the fraction of the variance of
+    log(time) explained by the fit.
+    """
+    x = np.log(np.asarray(sizes, dtype=float))
+    y = np.log(np.asarray(times, dtype=float))
+    if len(x) < 2 or np.ptp(x) == 0:
+        raise RuntimeError("Need at least two different sizes to fit an exponent.")
+    k, log_c = np.polyfit(x, y, 1)
+    residuals = y - (k * x + log_c)
+    total = float(((y - y.mean()) ** 2).sum())
+    r_squared = 1 - float((residuals ** 2).sum()) / total if total > 0 else 1.0
+    stderr = None
+    if len(x) > 2:
+        stderr = float(np.sqrt((residuals ** 2).sum() / (len(x) - 2) / ((x - x.mean()) ** 2).sum()))
+    return {"exponent": float(k), "stderr": stderr, "coefficient": float(np.exp(log_c)),
+            "r_squared": r_squared}
+
+
+def environment():
+    """Return a dictionary describing the machine and Python running the benchmarks."""
+    return {"python": sys.version.split()[0], "implementation": platform.python_implementation(),
+            "platform": platform.platform(), "machine": platform.machine(),
+            "numpy": np.__version__, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def write_json(results, filename):
+    """Write results, with a description of the environment, as JSON."""
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "results": [r.to_dict() for r in results]}, file, indent=1)
+
+
+def load_json(filename):
+    """Load results written by write_json, returning a dictionary from key to result
+    dictionary."""
+    with open(filename, encoding="utf-8") as file:
+        return {r["key"]: r for r in json.load(file)["results"]}
+
+
+def write_csv(results, filename):
+    """Write one row of summary statistics per result, as CSV."""
+    rows = [r.row() for r in results]
+    if not rows:
+        return
+    with open(filename, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_result(result):
+    """Return a one-line summary of a result, with times in microseconds."""
+    s = result.stats
+    return (f"{result.get_key():<45} median {s['median'] * 1e6:10.2f} us "
+            f"[{s['median_low'] * 1e6:.2f}, {s['median_high'] * 1e6:.2f}]  "
+            f"p95 {s['p95'] * 1e6:10.2f}  p99 {s['p99'] * 1e6:10.2f}  n={s['count']}")
+
+
+def core_cases():
+    """Return (name, params, func, setup) tuples for the operations whose speed the
+    project tracks: bfs, dijkstra and kruskal on the Underground network, and
+    ChainedHashTable.search on station names."""
+    import os
+    import random
+    from bfs import bfs
+    from chained_hashtable import ChainedHashTable
+    from dijkstra import dijkstra
+    from hash_functions import hashpjw, next_prime
+    from mst import kruskal
+    from network_loader import load_network
+
+    network = load_network(os.path.join(clrs_path.PROJECT_ROOT, "Individual Task", "task1", "data",
+                                        "London_Underground_data.csv"), use_snapshot=False)
+    graph = network.get_graph()
+    names = network.get_names()
+    table = ChainedHashTable(next_prime(len(names)), hash_func=hashpjw)
+    for name in names:
+        table.insert(name)
+    rng = random.Random(0)
+    queries = [rng.choice(names) for _ in range(1000)]
+
+    def search_all():
+        for name in queries:
+            table.search(name)
+
+    return [("bfs", {"graph": "underground"}, lambda: bfs(graph, 0), None),
+            ("dijkstra", {"graph": "underground"}, lambda: dijkstra(graph, 0), None),
+            ("kruskal", {"graph": "underground"}, lambda: kruskal(graph), None),
+            ("ChainedHashTable.search", {"queries": len(queries)}, search_all, None)]
+
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time bfs, dijkstra, kruskal and ChainedHashTable.search.")
+    parser.add_argument("--target-time", type=float, default=1.0, help="seconds of samples per case")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    args = parser.parse_args()
+
+    results = []
+    for name, params, func, setup in core_cases():
+        result = run_case(name, func, params, setup, target_time=args.target_time)
+        print(format_result(result))
+        results.append(result)
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
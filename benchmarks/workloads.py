@@ -0,0 +1,204 @@
+# Project    : Designing and Developing London Underground Trains Map and Operations.
+# The fixed matrix of benchmark workloads: searches on the real network, on random
+# and grid graphs, spanning trees at several densities, and hash-table operations at
+# several load factors.  Graphs are built once, from fixed seeds, and shared.
+
+import clrs_path  # noqa: F401  (puts the clrsPython folders on sys.path)
+
+import operator
+import os
+import random
+import zlib
+from bfs import bfs
+from chained_hashtable import ChainedHashTable
+from dijkstra import dijkstra
+from edge_stream import build_adjacency_lists, gnp_edges, grid_edges, with_weights
+from hash_functions import hashpjw
+from heap import Heap
+from mst import kruskal, prim
+from network_loader import load_network
+
+UNDERGROUND_DATA = os.path.join(clrs_path.PROJECT_ROOT, "Individual Task", "task1", "data",
+                                "London_Underground_data.csv")
+SEARCH_SIZES = (1000, 5000, 20000)      # vertices of the random and grid graphs
+AVERAGE_DEGREE = 8                      # of the random graphs for searches
+MST_VERTICES = 500
+MST_DENSITIES = (0.01, 0.05, 0.2)       # edge probabilities for spanning trees
+HASH_KEYS = 2000
+LOAD_FACTORS = (0.5, 1, 2, 4)
+HEAP_SIZE = 10000
+
+
+class Workload:
+    """One benchmark case: a name, its parameters, and a function that prepares it.
+
+    prepare() returns (func, setup) as taken by harness.run_case, and is called only
+    when the workload is about to run, so that unused graphs are never built.
+    """
+
+    def __init__(self, name, params, prepare):
+        self.name = name
+        self.params = params
+        self.prepare = prepare
+
+
+graphs = {}  # built graphs, by description
+
+
+def graph(kind, n=None, p=None):
+    """Return a weighted, undirected graph, building it on first use.
+
+    Arguments:
+    kind -- "underground", "gnp" (G(n, p)), or "grid" (about n vertices, square)
+    n -- number of vertices, for "gnp" and "grid"
+    p -- edge probability, for "gnp"
+    """
+    key = (kind, n, p)
+    if key not in graphs:
+        rng = random.Random(zlib.crc32(repr(key).encode()))  # the same graph in every run
+        if kind == "underground":
+            graphs[key] = load_network(UNDERGROUND_DATA, use_snapshot=False).get_graph()
+        elif kind == "gnp":
+            graphs[key] = build_adjacency_lists(with_weights(gnp_edges(n, p, False, rng), 1, 20, rng),
+                                                n, weighted=True)
+        elif kind == "grid":
+            side = round(n ** 0.5)
+            graphs[key] = build_adjacency_lists(with_weights(grid_edges(side, side), 1, 20, rng),
+                                                side * side, weighted=True)
+        else:
+            raise RuntimeError("Unknown graph kind: " + str(kind))
+    return graphs[key]
+
+
+def search_workloads():
+    """BFS and Dijkstra from vertex 0 on the real network, random graphs, and grids."""
+    cases = [("underground", None, None)]
+    cases += [("gnp", n, AVERAGE_DEGREE / n) for n in SEARCH_SIZES]
+    cases += [("grid", n, None) for n in SEARCH_SIZES]
+    workloads = []
+    for kind, n, p in cases:
+        params = {"graph": kind} if n is None else {"graph": kind, "n": n}
+        for name, search in (("bfs", bfs), ("dijkstra", dijkstra)):
+            def prepare(kind=kind, n=n, p=p, search=search):
+                G = graph(kind, n, p)
+                return (lambda: search(G, 0)), None
+            workloads.append(Workload(name, params, prepare))
+    return workloads
+
+
+def mst_workloads():
+    """Kruskal's and Prim's algorithms on random graphs of several densities."""
+    workloads = []
+    for p in MST_DENSITIES:
+        params = {"n": MST_VERTICES, "p": p}
+        for name, algorithm in (("kruskal", lambda G: kruskal(G)), ("prim", lambda G: prim(G, 0))):
+            def prepare(p=p, algorithm=algorithm):
+                G = graph("gnp", MST_VERTICES, p)
+                return (lambda: algorithm(G)), None
+            workloads.append(Workload(name, params, prepare))
+    return workloads
+
+
+def hash_workloads():
+    """ChainedHashTable insert, search and delete of HASH_KEYS keys at several load
+    factors.  Each call does every key once, so times are per HASH_KEYS operations.
+    Keys are hashed with hashpjw rather than the builtin hash, which differs from one
+    process to the next, so that every run has the same chains."""
+    keys = ["station " + str(i) for i in range(HASH_KEYS)]
+    workloads = []
+    for alpha in LOAD_FACTORS:
+        m = max(1, round(HASH_KEYS / alpha))
+        params = {"alpha": alpha, "keys": HASH_KEYS}
+
+        def filled(m=m):
+            table = ChainedHashTable(m, hash_func=hashpjw)
+            for key in keys:
+                table.insert(key)
+            return table
+
+        def prepare_insert(m=m):
+            def insert_all(table):
+                for key in keys:
+                    table.insert(key)
+            return insert_all, lambda: ChainedHashTable(m, hash_func=hashpjw)
+
+        def prepare_search(filled=filled):
+            table = filled()
+            return (lambda: [table.search(key) for key in keys]), None
+
+        def prepare_delete(filled=filled):
+            def setup():
+                table = filled()
+                return table, [table.search(key) for key in keys]
+
+            def delete_all(state):
+                table, nodes = state
+                for node in nodes:
+                    table.delete(node)
+            return delete_all, setup
+
+        workloads.append(Workload("hashtable.insert", params, prepare_insert))
+        workloads.append(Workload("hashtable.search", params, prepare_search))
+        workloads.append(Workload("hashtable.delete", params, prepare_delete))
+    return workloads
+
+
+def heap_workloads():
+    """Building a max-heap of HEAP_SIZE random numbers, which runs Heap.heapify."""
+    def prepare():
+        rng = random.Random(0)
+        data = [rng.random() for _ in range(HEAP_SIZE)]
+
+        def build(array):
+            Heap(operator.gt, array).build_heap()
+        return build, lambda: list(data)
+    return [Workload("heap.build_heap", {"n": HEAP_SIZE}, prepare)]
+
+
+def all_workloads():
+    """Return the full matrix of workloads, in a fixed order."""
+    return search_workloads() + mst_workloads() + hash_workloads() + heap_workloads()
+
+
+# Families of workloads for fitting the growth exponent: each maps a size n to a
+# function to time and an optional setup, as prepare() does.
+
+def fit_bfs_gnp(n):
+    G = graph("gnp", n, AVERAGE_DEGREE / n)
+    return (lambda: bfs(G, 0)), None
+
+
+def fit_dijkstra_gnp(n):
+    G = graph("gnp", n, AVERAGE_DEGREE / n)
+    return (lambda: dijkstra(G, 0)), None
+
+
+def fit_bfs_grid(n):
+    G = graph("grid", n)
+    return (lambda: bfs(G, 0)), None
+
+
+def fit_kruskal_gnp(n):
+    G = graph("gnp", n, AVERAGE_DEGREE / n)
+    return (lambda: kruskal(G)), None
+
+
+def fit_hashtable_search(n):
+    """One search in a table of n keys at load factor 1: the exponent should be near 0."""
+    table = ChainedHashTable(n, hash_func=hashpjw)
+    keys = ["station " + str(i) for i in range(n)]
+    for key in keys:
+        table.insert(key)
+    queries = [keys[i] for i in random.Random(n).choices(range(n), k=1000)]
+
+    def search_all():
+        for key in queries:
+            table.search(key)
+    return search_all, None
+
+
+FIT_FAMILIES = {"bfs-gnp": (fit_bfs_gnp, (1000, 2000, 5000, 10000, 20000)),
+                "dijkstra-gnp": (fit_dijkstra_gnp, (1000, 2000, 5000, 10000, 20000)),
+                "bfs-grid": (fit_bfs_grid, (1024, 2025, 4900, 10000, 19881)),
+                "kruskal-gnp": (fit_kruskal_gnp, (1000, 2000, 5000, 10000, 20000)),
+                "hashtable-search": (fit_hashtable_search, (1000, 5000, 10000, 25000, 50000))}
@@ -72,6 +72,79 @@ class Queue:
 			return str(self.array[self.head:] + self.array[: self.tail])
 
 
+class ResizingQueue:
+
+	def __init__(self, n=16):
+		"""Initialize an empty queue with room for at least n elements.  The underlying
+		circular array has a power-of-2 size, so that wrapping around is a bitwise and,
+		and it doubles whenever it fills, so the queue is never full."""
+		capacity = 1
+		while capacity < n + 1:
+			capacity *= 2
+		self.array = [None] * capacity
+		self.mask = capacity - 1
+		self.head = 0  # index of head
+		self.tail = 0  # index of the next location where a new element will be inserted
+
+	def __len__(self):
+		return (self.tail - self.head) & self.mask
+
+	def is_empty(self):
+		"""Return a boolean indicating whether the queue is empty."""
+		return self.head == self.tail
+
+	def grow(self, n):
+		"""Move the elements, from head to tail, into an array with room for n more."""
+		size = len(self)
+		capacity = len(self.array)
+		while capacity < size + n + 1:  # always keep at least 1 empty slot
+			capacity *= 2
+		if capacity == len(self.array):
+			return
+		elements = self.to_list()
+		self.array = elements + [None] * (capacity - size)
+		self.mask = capacity - 1
+		self.head = 0
+		self.tail = size
+
+	def enqueue(self, x):
+		"""Add an element to the tail of the queue, growing the array if it is full."""
+		if self.head == (self.tail + 1) & self.mask:
+			self.grow(1)
+		self.array[self.tail] = x
+		self.tail = (self.tail + 1) & self.mask
+
+	def enqueue_many(self, xs):
+		"""Add the elements of a list, in order, to the tail of the queue, growing the
+		array at most once and copying them in at most two slices."""
+		n = len(xs)
+		self.grow(n)
+		capacity = len(self.array)
+		first = min(n, capacity - self.tail)  # how many fit before wrapping around
+		self.array[self.tail:self.tail + first] = xs[:first]
+		self.array[:n - first] = xs[first:]
+		self.tail = (self.tail + n) & self.mask
+
+	def dequeue(self):
+		"""Remove an element from the head of the queue."""
+		if self.head == self.tail:  # queue underflow?
+			raise RuntimeError("Queue is empty.")
+		x = self.array[self.head]
+		self.array[self.head] = None  # do not keep a reference to a dequeued element
+		self.head = (self.head + 1) & self.mask
+		return x
+
+	def to_list(self):
+		"""Return a list of the elements from head to tail."""
+		if self.head <= self.tail:
+			return self.array[self.head:self.tail]
+		return self.array[self.head:] + self.array[:self.tail]
+
+	def __str__(self):
+		"""Return the string representation of the queue, from head to tail."""
+		return str(self.to_list())
+
+
 # Testing
 if __name__ == "__main__":
 
@@ -116,3 +189,29 @@ if __name__ == "__main__":
 		queue2.enqueue(10)
 	except RuntimeError as e:
 		print(e)
+
+	# A resizing queue never overflows, and bulk enqueues wrap around correctly.
+	queue3 = ResizingQueue(4)
+	for i in range(6):
+		queue3.enqueue(i)
+	for i in range(4):
+		queue3.dequeue()
+	queue3.enqueue_many(list(range(6, 20)))
+	print(queue3, len(queue3))
+	from collections import deque
+	from random import randint
+	queue4 = ResizingQueue(2)
+	expected = deque()
+	for step in range(2000):
+		r = randint(0, 2)
+		if r == 0 and expected:
+			if queue4.dequeue() != expected.popleft():
+				print("Dequeue mismatch")
+		elif r == 1:
+			queue4.enqueue(step)
+			expected.append(step)
+		else:
+			items = list(range(step, step + randint(0, 5)))
+			queue4.enqueue_many(items)
+			expected.extend(items)
+	print(queue4.to_list() == list(expected))
@@ -30,7 +30,9 @@
 #                                                                       #
 #########################################################################
 
+from math import ceil
 from dll_sentinel import DLLSentinel
+from hash_functions import next_prime
 
 
 class ChainedHashTable:
@@ -57,17 +59,26 @@ class ChainedHashTable:
 		else:
 			self.get_key = get_key_func
 
-	def insert(self, data):
-		"""Insert an object into the linked list at the appropriate table slot."""
-		self.table[self.hash_function(self.get_key(data)) % self.m].prepend(data)
+	def insert(self, data, hash_value=None):
+		"""Insert an object into the linked list at the appropriate table slot.
+		If hash_value is given, it is used as the already computed hash of the object's key."""
+		if hash_value is None:
+			hash_value = self.hash_function(self.get_key(data))
+		self.table[hash_value % self.m].prepend(data)
 
-	def search(self, key):
-		"""Return an object with a given key or None if not found."""
-		return self.table[self.hash_function(key) % self.m].search(key)
+	def search(self, key, hash_value=None):
+		"""Return an object with a given key or None if not found.
+		If hash_value is given, it is used as the already computed hash of key."""
+		if hash_value is None:
+			hash_value = self.hash_function(key)
+		return self.table[hash_value % self.m].search(key)
 
-	def delete(self, node):
-		"""Delete an object with a given key from the linked list at the appropriate table slot."""
-		self.table[self.hash_function(self.get_key(node.data)) % self.m].delete(node)
+	def delete(self, node, hash_value=None):
+		"""Delete an object with a given key from the linked list at the appropriate table slot.
+		If hash_value is given, it is used as the already computed hash of the object's key."""
+		if hash_value is None:
+			hash_value = self.hash_function(self.get_key(node.data))
+		self.table[hash_value % self.m].delete(node)
 
 	def __str__(self):
 		"""Return the string representation of this hash table, looking like a Python list."""
@@ -80,11 +91,173 @@ class ChainedHashTable:
 		return string
 
 
+class ResizingChainedHashTable(ChainedHashTable):
+
+	def __init__(self, m=11, hash_func=hash, get_key_func=None, max_load_factor=1.0,
+				 incremental=False, buckets_per_operation=2):
+		"""Initialize a chained hash table that grows as objects are inserted, keeping the
+		load factor at most max_load_factor by moving to a table whose size is the next
+		prime after twice the current size.
+
+		Arguments:
+		m -- initial size of hashtable
+		hash_func -- hash function to use. If omitted, uses the builtin	Python function 'hash'.
+		get_key_func -- an optional function that returns the key for the
+		objects stored. May be a static function in the object class. If
+		omitted, then the identity function is used.
+		max_load_factor -- ceiling on the number of objects per slot
+		incremental -- if False, move every object to the larger table as soon as it is
+		made.  If True, keep the old table alongside the new one and move only
+		buckets_per_operation of its slots on each insert or delete, so that no single
+		operation pays for the whole rehash.
+		buckets_per_operation -- least number of old slots moved per operation when
+		incremental.  More are moved if needed to finish before the next growth.
+		"""
+		# Slots hold None until an object is first inserted there, so that growing the
+		# table allocates one list of None rather than a linked list per slot.
+		ChainedHashTable.__init__(self, 0, hash_func, get_key_func)
+		self.m = m
+		self.table = [None] * m
+		self.get_key_func = get_key_func
+		self.empty = DLLSentinel(get_key_func)  # stands in for every empty slot; never modified
+		self.n = 0  # number of objects stored
+		self.max_load_factor = max_load_factor
+		self.incremental = incremental
+		self.buckets_per_operation = buckets_per_operation
+		# While an incremental rehash is in progress, slots old_table[moved:] have not yet
+		# moved, and each operation moves step of them.
+		self.old_table = None
+		self.old_m = 0
+		self.moved = 0
+		self.step = buckets_per_operation
+
+	def chain(self, key, hash_value=None, create=False):
+		"""Return the linked list that holds, or would hold, objects with the given key.
+		If hash_value is given, it is used as the already computed hash of key.  An empty
+		slot gives the shared empty list, unless create is True, when the slot is given a
+		list of its own."""
+		h = self.hash_function(key) if hash_value is None else hash_value
+		if self.old_table is not None and h % self.old_m >= self.moved:
+			table, i = self.old_table, h % self.old_m  # slot not yet moved to the new table
+		else:
+			table, i = self.table, h % self.m
+		chain = table[i]
+		if chain is None:
+			if not create:
+				return self.empty
+			chain = table[i] = DLLSentinel(self.get_key_func)
+		return chain
+
+	def insert(self, data, hash_value=None):
+		"""Insert an object, growing the table if the load factor would exceed its ceiling.
+		If hash_value is given, it is used as the already computed hash of the object's key."""
+		self.rehash_step()
+		self.chain(self.get_key(data), hash_value, True).prepend(data)
+		self.n += 1
+		if self.n > self.max_load_factor * self.m:
+			self.grow()
+
+	def search(self, key, hash_value=None):
+		"""Return an object with a given key or None if not found.
+		If hash_value is given, it is used as the already computed hash of key."""
+		return self.chain(key, hash_value).search(key)
+
+	def delete(self, node, hash_value=None):
+		"""Delete a node returned by search from the table.
+		If hash_value is given, it is used as the already computed hash of the object's key."""
+		self.chain(self.get_key(node.data), hash_value).delete(node)
+		self.n -= 1
+		self.rehash_step()
+
+	def grow(self):
+		"""Start moving the objects to a table of roughly twice the size."""
+		# The step chosen by the previous growth finishes its rehash within the inserts
+		# that lead up to this one, so there is never work left over here.
+		self.finish_rehash()
+		self.old_table = self.table
+		self.old_m = self.m
+		self.moved = 0
+		self.m = next_prime(2 * self.m + 1)
+		self.table = [None] * self.m
+		if not self.incremental:
+			self.finish_rehash()
+			return
+		# At least inserts_left inserts come before the next growth, and each moves step
+		# slots, so the rehash is done by then.
+		inserts_left = max(1, int(self.max_load_factor * self.m) - self.n)
+		self.step = max(self.buckets_per_operation, ceil(self.old_m / inserts_left))
+
+	def rehash_step(self):
+		"""Move up to step slots of the old table to the new table."""
+		if self.old_table is not None:
+			self.move_buckets(self.step)
+
+	def finish_rehash(self):
+		"""Move every remaining slot of the old table to the new table."""
+		if self.old_table is not None:
+			self.move_buckets(self.old_m - self.moved)
+
+	def move_buckets(self, count):
+		"""Move the nodes in the next count slots of the old table into the new table.
+		Nodes are relinked rather than copied, so nodes returned by search stay valid."""
+		end = min(self.moved + count, self.old_m)
+		for i in range(self.moved, end):
+			if self.old_table[i] is None:
+				continue  # nothing was ever inserted in this slot
+			sentinel = self.old_table[i].sentinel
+			x = sentinel.next
+			while x is not sentinel:
+				next_x = x.next
+				# Splice x in at the head of its chain in the new table.
+				j = self.hash_function(self.get_key(x.data)) % self.m
+				if self.table[j] is None:
+					self.table[j] = DLLSentinel(self.get_key_func)
+				head = self.table[j].sentinel
+				x.next = head.next
+				x.prev = head
+				head.next.prev = x
+				head.next = x
+				x = next_x
+			self.old_table[i] = None
+		self.moved = end
+		if self.moved == self.old_m:  # done
+			self.old_table = None
+			self.old_m = 0
+			self.moved = 0
+
+	def load_factor(self):
+		"""Return the number of objects per slot of the (new) table."""
+		return self.n / self.m
+
+	def max_chain_length(self):
+		"""Return the length of the longest chain, in either table."""
+		longest = 0
+		chains = list(self.table)
+		if self.old_table is not None:
+			chains += self.old_table[self.moved:]
+		for chain in chains:
+			length = 0 if chain is None else sum(1 for _ in chain.iterator())
+			longest = max(longest, length)
+		return longest
+
+	def __len__(self):
+		"""Return the number of objects stored."""
+		return self.n
+
+	def __str__(self):
+		"""Return the string representation of this hash table, looking like a Python list,
+		followed by the slots of the old table not yet moved, if any."""
+		string = "[" + ", ".join(str(chain or self.empty) for chain in self.table) + "]"
+		if self.old_table is not None:
+			string += " pending " + str([str(chain or self.empty) for chain in self.old_table[self.moved:]])
+		return string
+
+
 # Testing
 if __name__ == "__main__":
 
 	from key_object import KeyObject
-	from hash_functions import hashpjw
+	from hash_functions import hashpjw, hashpjw_many, cached_hashpjw
 
 	# Hashtable of integers.
 	hashtable1 = ChainedHashTable(10)
@@ -111,3 +284,42 @@ if __name__ == "__main__":
 	print(x)
 	hashtable2.delete(x)  # delete object with "David"
 	print(hashtable2)
+	print()
+
+	# Growing hashtables, with and without incremental rehashing.
+	for incremental in [False, True]:
+		hashtable3 = ResizingChainedHashTable(5, hash_func=hashpjw, incremental=incremental)
+		nodes = {}
+		for i in range(1000):
+			hashtable3.insert("station " + str(i))
+			if hashtable3.load_factor() > 1.0:
+				print("Load factor too high:", hashtable3.load_factor())
+		for i in range(0, 1000, 3):
+			hashtable3.delete(hashtable3.search("station " + str(i)))
+		found = [hashtable3.search("station " + str(i)) is not None for i in range(1000)]
+		print(len(hashtable3), hashtable3.m, round(hashtable3.load_factor(), 3), hashtable3.max_chain_length(),
+			  found == [i % 3 != 0 for i in range(1000)])
+
+	# The slowest single insert while growing to 200000 objects: the incremental table
+	# spreads each rehash over the inserts before the next growth.
+	import gc
+	import time
+	keys = ["station " + str(i) for i in range(200000)]
+	for incremental in [False, True]:
+		hashtable5 = ResizingChainedHashTable(11, incremental=incremental)
+		worst = 0
+		gc.disable()
+		for key in keys:
+			start = time.perf_counter()
+			hashtable5.insert(key)
+			worst = max(worst, time.perf_counter() - start)
+		gc.enable()
+		print("incremental" if incremental else "full", "worst insert:", round(worst * 1000, 2), "ms",
+			  all(hashtable5.search(key) is not None for key in keys[::997]))
+
+	# Precomputed hashes.
+	names = ["Harrow & Wealdstone", "Kenton", "South Kenton", "North Wembley"]
+	hashtable4 = ResizingChainedHashTable(3, hash_func=cached_hashpjw)
+	for name, h in zip(names, hashpjw_many(names)):
+		hashtable4.insert(name, h)
+	print([str(hashtable4.search(name)) for name in names])
@@ -30,10 +30,12 @@
 #                                                                       #
 #########################################################################
 
+from functools import lru_cache
 from math import floor, ceil
 from miller_rabin import miller_rabin
 from random import randint
 import hashlib  # for cryptographic hashing
+import numpy as np
 
 
 def division_hash(k, m):
@@ -99,6 +101,24 @@ def find_large_prime(w, s=40):
             return n
 
 
+def next_prime(n, s=40):
+    """Return the smallest prime number greater than or equal to n.
+
+    Arguments:
+    n -- lower bound
+    s -- number of trials of Miller-Rabin primality test.  If omitted, 40 is used.
+    """
+
+    if n <= 2:
+        return 2
+    if n == 3:
+        return 3
+    n |= 1  # no even number greater than 2 is prime
+    while not miller_rabin(n, s):
+        n += 2
+    return n
+
+
 def universal_hash(k, p, a, b, m):
     """Universal hash function.
 
@@ -199,8 +219,90 @@ def hashpjw(s):
     return h
 
 
+HASHPJW_CACHE_SIZE = 1 << 16  # most strings whose hashpjw values are remembered
+
+# Hashes computed by warm_hashpjw_cache, waiting to be taken into the cache.
+_hashpjw_warm = {}
+
+
+@lru_cache(maxsize=HASHPJW_CACHE_SIZE)
+def _cached_hashpjw_str(s):
+    """Return hashpjw of the string s, remembering the most recently used values."""
+    h = _hashpjw_warm.get(s)
+    return hashpjw(s) if h is None else h
+
+
+def cached_hashpjw(s):
+    """Hash s using the hashpjw hashing function, remembering the hashes of the most
+    recently used HASHPJW_CACHE_SIZE strings so that repeated keys are lookups.  The
+    cache is keyed by str(s), as the hash is, so 1, 1.0, and True are distinct keys.
+
+    Argument:
+    s -- a value to hash.  Converted to a string if necessary."""
+
+    return _cached_hashpjw_str(str(s))
+
+
+def hashpjw_many(keys):
+    """Return a list of the hashpjw values of a sequence of keys, computed with NumPy
+    one character position at a time across all the keys.
+
+    Argument:
+    keys -- values to hash.  Each is converted to a string if necessary."""
+
+    strings = [str(k) for k in keys]
+    if len(strings) == 0:
+        return []
+    # Each row holds the code points of one string, padded with zeros.
+    array = np.array(strings, dtype=str)
+    width = array.dtype.itemsize // 4
+    codes = array.view(np.uint32).reshape(len(strings), width).astype(np.uint64)
+    lengths = np.array([len(string) for string in strings])
+    # NumPy drops trailing NUL characters, so such strings are hashed one at a time.
+    exact = np.char.str_len(array) == lengths
+
+    mask = np.uint64(0xF0000000)
+    h = np.zeros(len(strings), dtype=np.uint64)
+    for j in range(width):
+        active = lengths > j
+        # Once h reaches 2**60, shifting it would overflow 64 bits.
+        exact &= ~(active & (h >= np.uint64(1 << 60)))
+        step = (h << np.uint64(4)) + codes[:, j]
+        high = step & mask
+        step ^= high >> np.uint64(24)
+        step &= ~high
+        h = np.where(active, step, h)
+
+    hashes = h.tolist()
+    for i in np.flatnonzero(~exact).tolist():
+        hashes[i] = hashpjw(strings[i])
+    return hashes
+
+
+def warm_hashpjw_cache(keys):
+    """Compute the hashpjw values of many keys at once with hashpjw_many and remember
+    them, so that later calls to cached_hashpjw on these keys are lookups."""
+
+    strings = [str(key) for key in keys]
+    _hashpjw_warm.update(zip(strings, hashpjw_many(strings)))
+    try:
+        for string in strings[-HASHPJW_CACHE_SIZE:]:  # earlier ones would be evicted anyway
+            _cached_hashpjw_str(string)
+    finally:
+        _hashpjw_warm.clear()
+
+
 # Testing
 if __name__ == "__main__":
+    names = ["Harrow & Wealdstone", "King's Cross St. Pancras", "Heathrow Terminals 2 & 3",
+             "", "A", 12345, "x" * 60, "Stra\u00dfe"]
+    print(hashpjw_many(names) == [hashpjw(name) for name in names])
+    warm_hashpjw_cache(names)
+    print(all(cached_hashpjw(name) == hashpjw(name) for name in names))
+    print([cached_hashpjw(k) == hashpjw(k) for k in [1, 1.0, True]])
+    warm_hashpjw_cache(range(2 * HASHPJW_CACHE_SIZE))
+    print(_cached_hashpjw_str.cache_info().currsize == HASHPJW_CACHE_SIZE)
+    print([next_prime(n) for n in [0, 2, 3, 4, 11, 12, 22, 1000, 50000]])
     w = 100
     for i in range(5):
         p = find_large_prime(w)
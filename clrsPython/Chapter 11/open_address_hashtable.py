@@ -106,6 +106,7 @@ class OpenAddressHashTable:
 		"""
 		self.m = m
 		self.table = [None] * m
+		self.h2 = h2
 
 		# If not provided a get_key function, return the object as the k.
 		if get_key_func is None:
@@ -125,12 +126,23 @@ class OpenAddressHashTable:
 			self.open_slot = lambda q: self.table[q] is None or self.table[q] == self.deleted
 			self.delete = self.double_hashing_hash_delete
 
-	def insert(self, x):
-		"""Insert x into hash table and return its slot number."""
+	def probe(self, k, i, hash_value=None):
+		"""Return slot number i in the probe sequence for key k.  If hash_value is given,
+		it is used in place of the primary hash of k."""
+		if hash_value is None:
+			return self.hash_func(k, i, self.m)
+		elif self.h2 is None:
+			return (hash_value + i) % self.m
+		else:
+			return (hash_value + i * self.h2(k)) % self.m
+
+	def insert(self, x, hash_value=None):
+		"""Insert x into hash table and return its slot number.
+		If hash_value is given, it is used as the already computed primary hash of x's key."""
 		i = 0
 		# Continue probing until finding an empty slot or have searched every element.
 		for i in range(self.m):
-			q = self.hash_func(self.get_key(x), i, self.m)
+			q = self.probe(self.get_key(x), i, hash_value)
 			if self.open_slot(q):  # insert into this empty slot
 				self.table[q] = x
 				return q  # return slot number
@@ -138,8 +150,9 @@ class OpenAddressHashTable:
 		# If all m probes found occupies slots, the hash table is full.
 		raise RuntimeError("Cannot insert: hash table is full")
 
-	def search(self, k):
+	def search(self, k, hash_value=None):
 		"""Search for and object with key k.
+		If hash_value is given, it is used as the already computed primary hash of k.
 
 		Returns:
 		Index of object. 
@@ -151,7 +164,7 @@ class OpenAddressHashTable:
 		# Continue probing until finding an element with key k, finding an empty slot,
 		# or have searched all m slots.
 		while True:
-			q = self.hash_func(k, i, self.m)
+			q = self.probe(k, i, hash_value)
 			if self.table[q] is None:  # empty slot
 				return None  # not found
 			elif self.get_key(self.table[q]) == k:
@@ -161,16 +174,16 @@ class OpenAddressHashTable:
 				if i == self.m:  # searched entire table?
 					return None  # not found
 
-	def double_hashing_hash_delete(self, k):
+	def double_hashing_hash_delete(self, k, hash_value=None):
 		"""Delete an object from the hash table by replacing it with self.deleted."""
-		q = self.search(k)  # index of the slot where the object is located
+		q = self.search(k, hash_value)  # index of the slot where the object is located
 		if q is None:  # if not found
 			raise RuntimeError("Cannot delete: " + str(k) + " is not in hash table")
 		self.table[q] = self.deleted 	# slot now contains self.deleted
 
-	def linear_probing_hash_delete(self, k):
+	def linear_probing_hash_delete(self, k, hash_value=None):
 		"""Delete an object from the hash table, knowing that linear probing is used."""
-		q = self.search(k)  # index of the slot where the object is located
+		q = self.search(k, hash_value)  # index of the slot where the object is located
 		if q is None:  # if not found
 			raise RuntimeError("Cannot delete: " + str(k) + " is not in hash table")
 
@@ -319,3 +332,12 @@ if __name__ == "__main__":
 	print(hashtable5.search(porthos))
 	hashtable5.delete(porthos)
 	print(hashtable5)
+	print()
+
+	# Precomputed hashes give the same slots.
+	from hash_functions import hashpjw_many
+	keys = [2, 3, 5, 7, 11, 13, 19]
+	hashtable6 = OpenAddressHashTable(10, hashpjw)
+	hashtable7 = OpenAddressHashTable(10, hashpjw)
+	for k, h in zip(keys, hashpjw_many(keys)):
+		print(hashtable6.insert(k) == hashtable7.insert(k, h), hashtable7.search(k, h) == hashtable6.search(k))
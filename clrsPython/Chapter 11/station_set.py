@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# station_set.py
+
+from array import array
+from hash_functions import cached_hashpjw
+
+EMPTY = -1  # hash stored in an empty slot
+HASH_BITS = 62  # stored hashes are nonnegative and below 2**HASH_BITS
+WORD_MASK = (1 << 64) - 1
+FIBONACCI = 0x9E3779B97F4A7C15  # 2**64 divided by the golden ratio, made odd
+
+
+class StationSet:
+
+	def __init__(self, m=16, hash_func=cached_hashpjw, max_load_factor=0.85):
+		"""Initialize an open-address set of keys, such as station names, using linear
+		probing with Robin Hood displacement.  Keys and their hashes are kept in two
+		parallel arrays, so probing compares cached hashes before comparing keys.
+
+		Hashes are mixed by Fibonacci hashing before use: the stored hash is the top bits
+		of the hash times FIBONACCI, and a key's home slot is the top lg m of those bits.
+		Masking off the low bits instead would leave hash functions such as hashpjw,
+		whose low bits are poorly mixed, with long probe sequences.
+
+		Arguments:
+		m -- initial number of slots, rounded up to a power of 2
+		hash_func -- hash function to use.  If omitted, uses cached_hashpjw.
+		max_load_factor -- ceiling on the fraction of occupied slots; the table doubles
+		in size before an insertion would exceed it
+		"""
+		size = 1
+		while size < m:
+			size *= 2
+		self.m = size
+		self.shift = HASH_BITS - (size.bit_length() - 1)  # home slot is hash >> shift
+		self.n = 0
+		self.hash_function = hash_func
+		self.max_load_factor = max_load_factor
+		self.keys = [None] * size
+		self.hashes = array('q', [EMPTY]) * size
+
+	def hash_of(self, key, hash_value=None):
+		"""Return the stored form of the hash of key, using hash_value if given: the top
+		HASH_BITS bits of the low 64 bits of the hash times FIBONACCI."""
+		if hash_value is None:
+			hash_value = self.hash_function(key)
+		return ((hash_value * FIBONACCI) & WORD_MASK) >> (64 - HASH_BITS)
+
+	def insert(self, key, hash_value=None):
+		"""Insert key.  Return True if it was added, False if it was already present.
+		If hash_value is given, it is used as the already computed hash of key."""
+		if self.search(key, hash_value) is not None:
+			return False
+		if self.n + 1 > self.max_load_factor * self.m:
+			self.resize(2 * self.m)
+		self.place(key, self.hash_of(key, hash_value))
+		self.n += 1
+		return True
+
+	def place(self, key, h):
+		"""Put a key known to be absent into the table.  An entry that is closer to its
+		home slot than the key being placed gives up its slot and is placed further on."""
+		keys = self.keys
+		hashes = self.hashes
+		mask = self.m - 1
+		shift = self.shift
+		i = h >> shift
+		dist = 0  # how far the key being placed is from its home slot
+		while hashes[i] != EMPTY:
+			slot_dist = (i - (hashes[i] >> shift)) & mask
+			if slot_dist < dist:  # take from the rich, give to the poor
+				keys[i], key = key, keys[i]
+				hashes[i], h = h, hashes[i]
+				dist = slot_dist
+			i = (i + 1) & mask
+			dist += 1
+		keys[i] = key
+		hashes[i] = h
+
+	def find_slot(self, key, hash_value=None):
+		"""Return the slot holding key, or None if key is not present."""
+		h = self.hash_of(key, hash_value)
+		keys = self.keys
+		hashes = self.hashes
+		mask = self.m - 1
+		shift = self.shift
+		i = h >> shift
+		dist = 0
+		while True:
+			slot_hash = hashes[i]
+			if slot_hash == EMPTY:
+				return None
+			if (i - (slot_hash >> shift)) & mask < dist:  # key would have displaced this entry
+				return None
+			if slot_hash == h and keys[i] == key:
+				return i
+			i = (i + 1) & mask
+			dist += 1
+
+	def search(self, key, hash_value=None):
+		"""Return the stored key equal to key, or None if not found.
+		If hash_value is given, it is used as the already computed hash of key."""
+		i = self.find_slot(key, hash_value)
+		return None if i is None else self.keys[i]
+
+	def delete(self, key, hash_value=None):
+		"""Delete key, shifting the entries after it back by one slot until reaching an
+		empty slot or an entry in its home slot, so that no deleted marker is needed.
+		If hash_value is given, it is used as the already computed hash of key."""
+		i = self.find_slot(key, hash_value)
+		if i is None:
+			raise RuntimeError("Cannot delete: " + str(key) + " is not in the set")
+		keys = self.keys
+		hashes = self.hashes
+		mask = self.m - 1
+		shift = self.shift
+		j = (i + 1) & mask
+		while hashes[j] != EMPTY and (j - (hashes[j] >> shift)) & mask > 0:
+			keys[i] = keys[j]
+			hashes[i] = hashes[j]
+			i = j
+			j = (j + 1) & mask
+		keys[i] = None
+		hashes[i] = EMPTY
+		self.n -= 1
+
+	def resize(self, m):
+		"""Move every key to a table with m slots, reusing the cached hashes."""
+		old_keys = self.keys
+		old_hashes = self.hashes
+		self.m = m
+		self.shift = HASH_BITS - (m.bit_length() - 1)
+		self.keys = [None] * m
+		self.hashes = array('q', [EMPTY]) * m
+		for i in range(len(old_keys)):
+			if old_hashes[i] != EMPTY:
+				self.place(old_keys[i], old_hashes[i])
+
+	def load_factor(self):
+		"""Return the fraction of occupied slots."""
+		return self.n / self.m
+
+	def probe_lengths(self):
+		"""Return a list of how far each key is from its home slot."""
+		mask = self.m - 1
+		return [(i - (h >> self.shift)) & mask for i, h in enumerate(self.hashes) if h != EMPTY]
+
+	def max_probe_length(self):
+		"""Return the largest distance of any key from its home slot."""
+		return max(self.probe_lengths(), default=0)
+
+	def __contains__(self, key):
+		return self.find_slot(key) is not None
+
+	def __len__(self):
+		return self.n
+
+	def __iter__(self):
+		for i in range(self.m):
+			if self.hashes[i] != EMPTY:
+				yield self.keys[i]
+
+	def __str__(self):
+		"""Return the keys in slot order, looking like a Python list."""
+		return str([key for key in self])
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import random, sample
+
+	stations = ["Harrow & Wealdstone", "Kenton", "South Kenton", "North Wembley",
+				"Wembley Central", "Stonebridge Park", "Harlesden", "Willesden Junction"]
+	set1 = StationSet(4)
+	for station in stations:
+		set1.insert(station)
+	print(set1, len(set1), set1.m)
+	print(set1.search("Kenton"), set1.search("Oxford Circus"), set1.insert("Kenton"))
+	set1.delete("Kenton")
+	print("Kenton" in set1, "Harlesden" in set1)
+	try:
+		set1.delete("Kenton")  # already deleted
+	except RuntimeError as e:
+		print(e)
+
+	# Churn: opening and closing stations at random should match a Python set.
+	names = ["station " + str(i) for i in range(2000)]
+	set2 = StationSet()
+	expected = set()
+	for step in range(20000):
+		name = names[int(random() * len(names))]
+		if name in expected:
+			set2.delete(name)
+			expected.remove(name)
+		else:
+			set2.insert(name)
+			expected.add(name)
+	print(set(set2) == expected and len(set2) == len(expected))
+	lengths = set2.probe_lengths()
+	mean = sum(lengths) / len(lengths)
+	variance = sum((x - mean) ** 2 for x in lengths) / len(lengths)
+	print("load factor", round(set2.load_factor(), 3), "max probe", set2.max_probe_length(),
+		  "mean probe", round(mean, 3), "variance", round(variance, 3))
+	print(all(set2.search(name) == name for name in sample(sorted(expected), 100)))
+
+	# hashpjw of similar names differs mostly in the low bits; after mixing, 1000 such
+	# names at load factor about 0.49 still have short, even probe sequences.
+	set3 = StationSet(2048)
+	for i in range(1000):
+		set3.insert("station " + str(i))
+	lengths = set3.probe_lengths()
+	mean = sum(lengths) / len(lengths)
+	print("load factor", round(set3.load_factor(), 3), "max probe", set3.max_probe_length(),
+		  "variance", round(sum((x - mean) ** 2 for x in lengths) / len(lengths), 3))
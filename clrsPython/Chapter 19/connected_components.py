@@ -33,6 +33,7 @@
 # Either of the following import statements works.
 # from disjoint_set_list import make_set, find_set, union
 from disjoint_set_forest import make_set, find_set, union
+from disjoint_set_array import ArrayDisjointSet
 
 
 def connected_components(G):
@@ -59,6 +60,23 @@ def connected_components(G):
 	return nodes
 
 
+def connected_components_array(G):
+	"""Compute the connected components of graph G, returning an ArrayDisjointSet in
+	which two vertices are in the same set if and only if they are in the same
+	connected component.  Its component_count property gives the number of components.
+
+	G -- an undirected graph implemented with adjacency lists
+	"""
+	card_V = G.get_card_V()
+	sets = ArrayDisjointSet(card_V)
+
+	# For each edge, unite its endpoint vertices.
+	for u in range(card_V):
+		for edge in G.get_adj_list(u):
+			sets.union(u, edge.get_v())
+	return sets
+
+
 def same_component(u, v, sets):
 	"""Return a boolean indicating whether two vertices are in the same connected component.
 
@@ -95,3 +113,9 @@ if __name__ == "__main__":
 		print('a and e are in the same component')
 	else:
 		print('a and e are not in the same component')
+
+	# Same components with the array-based disjoint sets.
+	array_sets = connected_components_array(graph1)
+	print(array_sets.component_count, 'components')
+	print(all(array_sets.same_set(u, v) == same_component(u, v, sets)
+			  for u in range(len(vertices)) for v in range(len(vertices))))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# disjoint_set_array.py
+
+from array import array
+
+
+class ArrayDisjointSet:
+
+	def __init__(self, n):
+		"""Initialize n singleton sets {0}, {1}, ..., {n-1}, stored in integer arrays
+		rather than as one object per element.
+
+		Arguments:
+		n -- number of elements
+		"""
+		self.parent = array('i', range(n))  # each element starts as its own root
+		self.size = array('i', [1]) * n  # size[x] is meaningful only for a root x
+		self.count = n
+
+	@property
+	def component_count(self):
+		"""Return the number of disjoint sets."""
+		return self.count
+
+	def find(self, x):
+		"""Return the root of the set containing x.  Iterative, with path halving:
+		every other node on the find path is made to point to its grandparent."""
+		parent = self.parent
+		while parent[x] != x:
+			parent[x] = parent[parent[x]]
+			x = parent[x]
+		return x
+
+	def union(self, x, y):
+		"""Unite the sets containing x and y, making the root of the smaller set a child
+		of the root of the larger.  Return True if they were different sets, False if
+		x and y were already in the same set."""
+		x = self.find(x)
+		y = self.find(y)
+		if x == y:
+			return False
+		if self.size[x] < self.size[y]:
+			x, y = y, x
+		self.parent[y] = x
+		self.size[x] += self.size[y]
+		self.count -= 1
+		return True
+
+	def same_set(self, x, y):
+		"""Return a boolean indicating whether x and y are in the same set."""
+		return self.find(x) == self.find(y)
+
+	def set_size(self, x):
+		"""Return the number of elements in the set containing x."""
+		return self.size[self.find(x)]
+
+
+# Testing
+if __name__ == "__main__":
+
+	# Same unions as the disjoint-set forest test.
+	letters = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+	sets = ArrayDisjointSet(len(letters))
+	i = 0
+	while i < len(letters):
+		sets.union(i, i + 1)
+		i += 2
+	print([letters[sets.find(i)] for i in range(len(letters))], sets.component_count)
+	i = 0
+	while i < len(letters):
+		sets.union(i, i + 2)
+		i += 4
+	print([letters[sets.find(i)] for i in range(len(letters))], sets.component_count)
+	sets.union(0, 4)
+	print([letters[sets.find(i)] for i in range(len(letters))], sets.component_count)
+	print(sets.union(1, 7), sets.set_size(3))
+
+	# A long chain does not hit the recursion limit.
+	n = 200000
+	chain = ArrayDisjointSet(n)
+	for i in range(n - 1):
+		chain.parent[i] = i + 1  # build a path 0 -> 1 -> ... -> n-1 without compression
+	print(chain.find(0) == n - 1)
@@ -30,7 +30,7 @@
 #                                                                       #
 #########################################################################
 
-from fifo_queue import Queue
+from fifo_queue import ResizingQueue
 from adjacency_list_graph import AdjacencyListGraph
 from print_path import print_path
 
@@ -39,32 +39,80 @@ GRAY = 1   # discovered
 BLACK = 2  # visited
 
 
-def bfs(G, source):
+def bfs(G, source, mask=None, closed_edges=None, level_synchronous=False, workspace=None):
 	"""Perform breadth-first search on a graph, filling in distances and predecessors.
 
 	Arguments:
 	G -- the graph, implemented with adjacency lists
 	source -- index of the source vertex
+	mask -- optional vertex status, indexed by vertex: vertices v with a false mask[v]
+	are closed and never discovered.  The source itself is not checked.
+	closed_edges -- optional set of (u, v) pairs for edges that cannot be traversed.
+	In an undirected graph, either orientation of a pair closes the edge.
+	level_synchronous -- if True, search one level at a time with plain lists for the
+	current and next frontiers instead of a queue.  Distances are the same, and so are
+	the predecessors, since vertices are discovered in the same order.
+	workspace -- optional SearchWorkspace for G whose lists are reused instead of
+	allocating new ones.  The returned lists then belong to the workspace.
 	"""
 	# Initialize all vertices to white with distance of infinity and no predecessor, except source is gray.
 	card_V = G.get_card_V()  # vertices are numbered, so that color[i] gives the color of vertex i
-	color = [WHITE] * card_V  # all unvisited
-	dist = [float('inf')] * card_V  # dist[i] holds the distance from the source vertex to vertex i
-	pi = [None] * card_V
+	if workspace is None:
+		color = [WHITE] * card_V  # all unvisited
+		dist = [float('inf')] * card_V  # dist[i] holds the distance from the source vertex to vertex i
+		pi = [None] * card_V
+		touched = None
+	else:
+		workspace.reset(G, source)  # only the entries the last search changed are cleared
+		color, dist, pi, touched = workspace.color, workspace.dist, workspace.pi, workspace.touched
 	color[source] = GRAY
 	dist[source] = 0
 
-	q = Queue(card_V)
+	undirected = closed_edges is not None and not G.is_directed()
+
+	if level_synchronous:
+		frontier = [source]
+		level = 0
+		while frontier:
+			level += 1
+			next_frontier = []
+			for u in frontier:
+				for edge in G.get_adj_list(u):
+					v = edge.get_v()
+					if color[v] == WHITE:
+						if mask is not None and not mask[v]:
+							continue
+						if closed_edges is not None and \
+								((u, v) in closed_edges or (undirected and (v, u) in closed_edges)):
+							continue
+						color[v] = GRAY
+						dist[v] = level
+						pi[v] = u
+						next_frontier.append(v)
+				color[u] = BLACK
+			if touched is not None:
+				touched.extend(next_frontier)
+			frontier = next_frontier
+		return dist, pi
+
+	q = ResizingQueue() if workspace is None else workspace.queue  # grows with the frontier only
 	q.enqueue(source)
 	while not q.is_empty():
 		u = q.dequeue()
 		for edge in G.get_adj_list(u):  # search the neighbors of u
 			v = edge.get_v()
 			if color[v] == WHITE:  # is v being discovered now?
+				if mask is not None and not mask[v]:
+					continue  # v is closed
+				if closed_edges is not None and \
+						((u, v) in closed_edges or (undirected and (v, u) in closed_edges)):
+					continue  # edge (u, v) is closed
 				color[v] = GRAY 
 				dist[v] = dist[u] + 1 	# add 1 to distance for v
 				pi[v] = u 	# assign predecessor
 				q.enqueue(v)  # v is now on the frontier
+				if touched is not None:
+					touched.append(v)
 		color[u] = BLACK  # u is now behind the frontier
 	return dist, pi
 
@@ -101,3 +149,20 @@ if __name__ == "__main__":
 	for i in range(card_V):
 		print(vertices[i] + ": dist = " + str(dist[i]) + ", path = " + \
 				str(print_path(predecessor, s, i, lambda i: vertices[i])))
+
+	# Routing around closures without copying the graph.
+	status = [True] * card_V
+	status[vertices.index('w')] = False  # station w closed
+	dist, predecessor = bfs(graph2, s, status, {(vertices.index('u'), vertices.index('s'))})
+	for i in range(card_V):
+		print(vertices[i] + ": dist = " + str(dist[i]) + ", path = " + \
+				str(print_path(predecessor, s, i, lambda i: vertices[i])))
+
+	# The level-synchronous mode gives the same results on larger random graphs.
+	all_equal = True
+	for directed in [True, False]:
+		graph3 = generate_random_graph(500, 0.01, True, directed)
+		for s in range(0, 500, 50):
+			if bfs(graph3, s) != bfs(graph3, s, level_synchronous=True):
+				all_equal = False
+	print("All level-synchronous results are " + ("not " if not all_equal else "") + "equal")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# bfs_frontier.py
+
+import numpy as np
+
+
+def as_numpy(a):
+	"""Return a NumPy view of an array.array or NumPy array, without copying."""
+	if isinstance(a, np.ndarray):
+		return a
+	return np.asarray(memoryview(a))
+
+
+def gather(offsets, targets, vertices):
+	"""Return two parallel NumPy arrays, owners and neighbors, holding every edge
+	(owner, neighbor) out of the given vertices, in order of vertices and then in
+	adjacency-list order."""
+	starts = offsets[vertices]
+	degrees = offsets[vertices + 1] - starts
+	total = int(degrees.sum())
+	if total == 0:
+		empty = np.empty(0, dtype=np.int64)
+		return empty, empty
+	# The index of each edge is the start of its list plus its position within the list.
+	ends = np.cumsum(degrees)
+	index = np.arange(total) + np.repeat(starts - (ends - degrees), degrees)
+	return np.repeat(vertices, degrees), targets[index].astype(np.int64)
+
+
+def bfs_frontier(G, source, G_reverse=None, alpha=14, beta=24):
+	"""Perform breadth-first search one whole frontier at a time, with NumPy.
+
+	Top-down steps gather the edges out of the frontier and keep the neighbors not yet
+	discovered, in the order bfs would discover them.  Once the edges out of the
+	frontier outnumber 1/alpha of the edges out of undiscovered vertices, bottom-up
+	steps are taken instead: every undiscovered vertex looks for a neighbor in the
+	frontier.  The search switches back to top-down when the frontier shrinks below
+	1/beta of the vertices.
+
+	Arguments:
+	G -- the graph, in compressed-sparse-row form (a CSRGraph)
+	source -- index of the source vertex
+	G_reverse -- for a directed graph, its transpose, used by bottom-up steps.  If
+	omitted, it is computed from G when first needed.  Ignored for an undirected graph.
+	alpha -- how much smaller than the undiscovered part the frontier must be, by
+	edge count, to stay top-down.  0 means always top-down.
+	beta -- how much smaller than the whole graph the frontier must be, by vertex
+	count, to return to top-down
+
+	Returns:
+	dist -- list of distances from the source, infinity for unreachable vertices, as
+	returned by bfs
+	pi -- list of predecessors, None for the source and unreachable vertices.  The
+	predecessors form a breadth-first tree.  They equal those of bfs on the same
+	adjacency lists if only top-down steps were taken; bottom-up steps may break ties
+	between equally near predecessors differently.
+	"""
+	card_V = G.get_card_V()
+	offsets = as_numpy(G.get_offsets()).astype(np.int64)
+	targets = as_numpy(G.get_targets())
+	degrees = np.diff(offsets)
+	reverse_offsets = None  # built when the first bottom-up step needs it
+
+	dist = np.full(card_V, -1, dtype=np.int64)  # -1 for undiscovered
+	pi = np.full(card_V, -1, dtype=np.int64)
+	dist[source] = 0
+	frontier = np.array([source], dtype=np.int64)
+	unvisited_edges = int(degrees.sum()) - int(degrees[source])
+	bottom_up = False
+	level = 0
+
+	while frontier.size > 0:
+		level += 1
+		frontier_edges = int(degrees[frontier].sum())
+		if not bottom_up and frontier_edges * alpha > unvisited_edges:
+			bottom_up = True
+		elif bottom_up and frontier.size < card_V / beta:
+			bottom_up = False
+
+		if bottom_up:
+			if reverse_offsets is None:
+				if G.is_directed():
+					if G_reverse is None:
+						G_reverse = G.transpose()
+					reverse_offsets = as_numpy(G_reverse.get_offsets()).astype(np.int64)
+					reverse_targets = as_numpy(G_reverse.get_targets())
+				else:
+					reverse_offsets, reverse_targets = offsets, targets
+			in_frontier = np.zeros(card_V, dtype=bool)
+			in_frontier[frontier] = True
+			owners, neighbors = gather(reverse_offsets, reverse_targets, np.flatnonzero(dist < 0))
+			hit = in_frontier[neighbors]
+			owners = owners[hit]
+			parents = neighbors[hit]
+			# Each newly discovered vertex takes the first of its neighbors in the frontier.
+			new, first = np.unique(owners, return_index=True)
+			parents = parents[first]
+		else:
+			owners, neighbors = gather(offsets, targets, frontier)
+			undiscovered = dist[neighbors] < 0
+			owners = owners[undiscovered]
+			neighbors = neighbors[undiscovered]
+			# Keep the first edge reaching each vertex, in the order it was reached.
+			first = np.sort(np.unique(neighbors, return_index=True)[1])
+			new = neighbors[first]
+			parents = owners[first]
+
+		dist[new] = level
+		pi[new] = parents
+		unvisited_edges -= int(degrees[new].sum())
+		frontier = new
+
+	inf = float('inf')
+	return [inf if x < 0 else x for x in dist.tolist()], [None if p < 0 else p for p in pi.tolist()]
+
+
+# Testing
+if __name__ == "__main__":
+
+	import time
+	from array import array
+	from bfs import bfs
+	from csr_graph import CSRGraph, from_adjacency_list_graph
+	from generate_random_graph import generate_random_graph
+
+	# Distances agree with bfs, and predecessors form a breadth-first tree.
+	all_equal = True
+	for directed in [True, False]:
+		for p in [0.01, 0.05, 0.3]:
+			graph1 = generate_random_graph(300, p, True, directed)
+			csr1 = from_adjacency_list_graph(graph1)
+			for s in range(0, 300, 37):
+				bfs_dist, bfs_pi = bfs(graph1, s)
+				dist, pi = bfs_frontier(csr1, s)
+				tree = all(pi[v] is None if v == s or dist[v] == float('inf') else
+						   csr1.has_edge(pi[v], v) and dist[pi[v]] == dist[v] - 1 for v in range(300))
+				if dist != bfs_dist or not tree:
+					all_equal = False
+				# A search that stays top-down matches bfs exactly.
+				if bfs_frontier(csr1, s, alpha=0) != (bfs_dist, bfs_pi):
+					all_equal = False
+	print("All frontier BFS results are " + ("not " if not all_equal else "") + "equal")
+
+	# A sparse random graph with 100,000 vertices, built directly in CSR form.
+	card_V = 100000
+	rng = np.random.default_rng(1)
+	u = rng.integers(0, card_V, 4 * card_V)
+	v = rng.integers(0, card_V, 4 * card_V)
+	keep = u != v
+	u, v = np.concatenate([u[keep], v[keep]]), np.concatenate([v[keep], u[keep]])
+	order = np.argsort(u, kind="stable")
+	offsets = np.zeros(card_V + 1, dtype=np.int32)
+	np.cumsum(np.bincount(u, minlength=card_V), out=offsets[1:])
+	csr2 = CSRGraph(card_V, array('i', offsets.tolist()), array('i', v[order].tolist()), directed=False)
+	start = time.perf_counter()
+	dist, pi = bfs_frontier(csr2, 0)
+	elapsed = time.perf_counter() - start
+	print("Reached", sum(d != float('inf') for d in dist), "vertices, eccentricity",
+		  max(d for d in dist if d != float('inf')), "in", round(elapsed, 3), "seconds")
+	print(dist == bfs(csr2, 0)[0])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# bidirectional_bfs.py
+
+def bidirectional_bfs(G, s, t, G_reverse=None):
+	"""Find a path from s to t with the fewest edges by breadth-first searching from both
+	ends and stopping when the two searches meet.  Each round expands one whole level
+	from whichever side has the smaller frontier.
+
+	Arguments:
+	G -- the graph, with get_adj_list for each vertex
+	s -- index of the source vertex
+	t -- index of the target vertex
+	G_reverse -- for a directed graph, its transpose.  If omitted, it is computed from G.
+	Ignored for an undirected graph.
+
+	Returns:
+	path -- list of vertices on a shortest path from s to t, or None if no path exists
+	dist -- number of edges on the path, or infinity if no path exists
+	expanded -- number of vertices whose adjacency lists were searched
+	"""
+	if s == t:
+		return [s], 0, 0
+	if not G.is_directed():
+		G_reverse = G
+	elif G_reverse is None:
+		G_reverse = G.transpose()
+
+	# Predecessors in the forward search, successors in the backward search.
+	pi_forward = {s: None}
+	pi_backward = {t: None}
+	dist_forward = {s: 0}
+	dist_backward = {t: 0}
+	frontier_forward = [s]
+	frontier_backward = [t]
+	expanded = 0
+	best = float('inf')
+	meet = None
+
+	while frontier_forward and frontier_backward:
+		# Expand the smaller frontier by one whole level.
+		if len(frontier_forward) <= len(frontier_backward):
+			graph, frontier, pi, dist, other_dist = G, frontier_forward, pi_forward, dist_forward, dist_backward
+		else:
+			graph, frontier, pi, dist, other_dist = G_reverse, frontier_backward, pi_backward, dist_backward, dist_forward
+		next_frontier = []
+		for u in frontier:
+			expanded += 1
+			for edge in graph.get_adj_list(u):
+				v = edge.get_v()
+				if v not in dist:  # is v being discovered now?
+					dist[v] = dist[u] + 1
+					pi[v] = u
+					next_frontier.append(v)
+					if v in other_dist and dist[v] + other_dist[v] < best:  # the searches meet at v
+						best = dist[v] + other_dist[v]
+						meet = v
+		if frontier is frontier_forward:
+			frontier_forward = next_frontier
+		else:
+			frontier_backward = next_frontier
+		if meet is not None:  # the level is complete, so no shorter meeting is possible
+			break
+
+	if meet is None:
+		return None, float('inf'), expanded
+	return join_paths(pi_forward, pi_backward, meet), best, expanded
+
+
+def join_paths(pi_forward, pi_backward, meet):
+	"""Return the path formed by the forward predecessors up to meet and the backward
+	successors after it."""
+	path = []
+	v = meet
+	while v is not None:
+		path.append(v)
+		v = pi_forward[v]
+	path.reverse()
+	v = pi_backward[meet]
+	while v is not None:
+		path.append(v)
+		v = pi_backward[v]
+	return path
+
+
+# Testing
+if __name__ == "__main__":
+
+	from bfs import bfs
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+
+	# Undirected, textbook example.
+	vertices = ['r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
+	edges = [('r', 's'), ('r', 't'), ('r', 'w'), ('s', 'u'), ('s', 'v'),
+			 ('t', 'u'), ('u', 'y'), ('v', 'w'), ('v', 'y'), ('w', 'x'),
+			 ('w', 'z'), ('x', 'y'), ('x', 'z')]
+	graph1 = AdjacencyListGraph(len(vertices), False)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]))
+	path, dist, expanded = bidirectional_bfs(graph1, vertices.index('s'), vertices.index('z'))
+	print([vertices[i] for i in path], dist, expanded)
+
+	# Distances should agree with bfs on random directed graphs.
+	card_V = 60
+	all_equal = True
+	for trial in range(5):
+		graph2 = generate_random_graph(card_V, 0.05, True, True)
+		graph2_reverse = graph2.transpose()
+		for s in range(0, card_V, 7):
+			bfs_dist, bfs_pi = bfs(graph2, s)
+			for t in range(card_V):
+				path, dist, expanded = bidirectional_bfs(graph2, s, t, graph2_reverse)
+				if dist != bfs_dist[t]:
+					print("Distance mismatch from", s, "to", t)
+					all_equal = False
+				elif path is not None:
+					if path[0] != s or path[-1] != t or len(path) != dist + 1 or \
+							any(not graph2.has_edge(path[i], path[i + 1]) for i in range(dist)):
+						print("Bad path from", s, "to", t, path)
+						all_equal = False
+	print("All distances are " + ("not " if not all_equal else "") + "equal")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# multi_source_bfs.py
+
+from fifo_queue import ResizingQueue
+from single_source_shortest_paths import initialize_single_source
+
+
+def multi_source_bfs(G, sources):
+	"""Perform breadth-first search from several sources at once, as if from a single
+	extra vertex joined to every source.  Each vertex gets its distance from the
+	nearest source and the source it is nearest to.
+
+	Arguments:
+	G -- the graph, implemented with adjacency lists
+	sources -- nonempty list of source vertex indices
+
+	Returns:
+	dist -- fewest edges from any source, infinity if no source reaches the vertex
+	pi -- predecessors, None for sources and unreachable vertices
+	nearest -- for each vertex, the source it is nearest to, or None if unreachable.
+	Ties between equally near sources are broken arbitrarily.
+	"""
+	if not sources:
+		raise RuntimeError("Need at least one source vertex.")
+	dist, pi = initialize_single_source(G, sources[0])
+	nearest = [None] * G.get_card_V()
+	q = ResizingQueue(len(sources))
+	for s in sources:
+		if nearest[s] is None:
+			dist[s] = 0
+			nearest[s] = s
+			q.enqueue(s)
+
+	inf = float('inf')
+	while not q.is_empty():
+		u = q.dequeue()
+		for edge in G.get_adj_list(u):
+			v = edge.get_v()
+			if dist[v] == inf:  # first discovery is final, as in bfs
+				dist[v] = dist[u] + 1
+				pi[v] = u
+				nearest[v] = nearest[u]
+				q.enqueue(v)
+	return dist, pi, nearest
+
+
+# Testing
+if __name__ == "__main__":
+
+	from bfs import bfs
+	from generate_random_graph import generate_random_graph
+
+	# Distances and labels should match the nearest of one bfs per source.
+	card_V = 200
+	all_equal = True
+	for directed in [True, False]:
+		graph = generate_random_graph(card_V, 0.015, True, directed)
+		sources = [3, 50, 121, 180, 199]
+		dist, pi, nearest = multi_source_bfs(graph, sources)
+		single = [bfs(graph, s)[0] for s in sources]
+		for v in range(card_V):
+			best = min(d[v] for d in single)
+			if dist[v] != best:
+				all_equal = False
+			elif nearest[v] is not None and single[sources.index(nearest[v])][v] != best:
+				all_equal = False
+			# Following predecessors leads back to the labelled source.
+			u = v
+			while pi[u] is not None:
+				u = pi[u]
+			if nearest[v] is not None and u != nearest[v]:
+				all_equal = False
+	print("All multi-source distances are " + ("not " if not all_equal else "") + "equal")
+	print(dist[:10], nearest[:10])
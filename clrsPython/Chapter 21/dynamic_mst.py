@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# dynamic_mst.py
+
+from mst import fast_kruskal, get_total_weight
+
+
+class DynamicMST:
+
+	def __init__(self, G):
+		"""Initialize a minimum spanning tree (or forest) of G that is kept up to date as
+		edges close and reopen, without recomputing it from scratch.
+
+		Arguments:
+		G -- a weighted, undirected graph, represented by adjacency lists.  It is copied,
+		so later changes to G do not affect this object.
+		"""
+		self.graph = G.copy()
+		self.graph.build_edge_index()
+		self.tree = fast_kruskal(self.graph)
+		self.tree.build_edge_index()
+		self.total_weight = get_total_weight(self.tree)
+
+	def get_graph(self):
+		"""Return the graph of open edges."""
+		return self.graph
+
+	def get_tree(self):
+		"""Return the current minimum spanning tree, as an AdjacencyListGraph."""
+		return self.tree
+
+	def get_total_weight(self):
+		"""Return the total weight of the current minimum spanning tree."""
+		return self.total_weight
+
+	def is_tree_edge(self, u, v):
+		"""Return a boolean indicating whether edge (u, v) is in the minimum spanning tree."""
+		return self.tree.has_edge(u, v)
+
+	def close_edge(self, u, v):
+		"""Remove edge (u, v) from the graph.  If it was a tree edge, reconnect the two
+		pieces of the tree with the lightest open edge between them, if there is one.
+
+		Returns:
+		The replacement edge as a (u, v, weight) triple, or None if no edge was added to the tree.
+		"""
+		edge = self.graph.find_edge(u, v)
+		if edge is None:
+			raise RuntimeError("Edge (" + str(u) + ", " + str(v) + ") is not open.")
+		self.graph.delete_edge(u, v)
+		if not self.tree.has_edge(u, v):
+			return None  # closing a non-tree edge leaves the tree minimum
+		self.tree.delete_edge(u, v)
+		self.total_weight -= edge.get_weight()
+
+		# Only edges leaving the smaller piece of the cut tree can reconnect it.
+		side = self.smaller_side(u, v)
+		best = None
+		for x in side:
+			for e in self.graph.get_adj_list(x):
+				y = e.get_v()
+				if y not in side and (best is None or e.get_weight() < best[2]):
+					best = (x, y, e.get_weight())
+		if best is not None:
+			self.tree.insert_edge(*best)
+			self.total_weight += best[2]
+		return best
+
+	def open_edge(self, u, v, weight):
+		"""Add edge (u, v) with the given weight to the graph.  If u and v are already
+		connected in the tree, the new edge replaces the heaviest edge on the tree path
+		between them when it is lighter; otherwise it joins two trees of the forest.
+
+		Returns:
+		The tree edge that was replaced, as a (u, v, weight) triple, or None.
+		"""
+		self.graph.insert_edge(u, v, weight)
+		path = self.tree_path(u, v)
+		if path is None:  # u and v are in different trees
+			self.tree.insert_edge(u, v, weight)
+			self.total_weight += weight
+			return None
+
+		# Find the heaviest edge on the cycle that the new edge would close.
+		heaviest = None
+		for i in range(len(path) - 1):
+			w = self.tree.find_edge(path[i], path[i + 1]).get_weight()
+			if heaviest is None or w > heaviest[2]:
+				heaviest = (path[i], path[i + 1], w)
+		if weight >= heaviest[2]:
+			return None
+		self.tree.delete_edge(heaviest[0], heaviest[1])
+		self.tree.insert_edge(u, v, weight)
+		self.total_weight += weight - heaviest[2]
+		return heaviest
+
+	def tree_path(self, u, v):
+		"""Return the list of vertices on the tree path from u to v, or None if u and v
+		are in different trees."""
+		pi = {u: None}
+		frontier = [u]
+		while frontier and v not in pi:
+			next_frontier = []
+			for x in frontier:
+				for edge in self.tree.get_adj_list(x):
+					y = edge.get_v()
+					if y not in pi:
+						pi[y] = x
+						next_frontier.append(y)
+			frontier = next_frontier
+		if v not in pi:
+			return None
+		path = []
+		while v is not None:
+			path.append(v)
+			v = pi[v]
+		path.reverse()
+		return path
+
+	def smaller_side(self, u, v):
+		"""Return the set of vertices in the smaller of the trees containing u and v,
+		searching both trees one vertex at a time so that the work is proportional to
+		the smaller one."""
+		sides = [{u}, {v}]
+		stacks = [[u], [v]]
+		while True:
+			for i in (0, 1):
+				if not stacks[i]:
+					return sides[i]
+				x = stacks[i].pop()
+				for edge in self.tree.get_adj_list(x):
+					y = edge.get_v()
+					if y not in sides[i]:
+						sides[i].add(y)
+						stacks[i].append(y)
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import choice, randint
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+
+	# Example from book, closing the tree edge (c, f).
+	vertices = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
+	edges = [('a', 'b', 4), ('a', 'h', 8), ('b', 'c', 8), ('b', 'h', 11), ('c', 'd', 7),
+			 ('c', 'f', 4), ('c', 'i', 2), ('d', 'e', 9), ('d', 'f', 14), ('e', 'f', 10),
+			 ('f', 'g', 2), ('g', 'h', 1), ('g', 'i', 6), ('h', 'i', 7)]
+	graph1 = AdjacencyListGraph(len(vertices), False, True)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	dynamic1 = DynamicMST(graph1)
+	print("Initial weight =", dynamic1.get_total_weight())
+	print("Replacement:", dynamic1.close_edge(vertices.index('c'), vertices.index('f')))
+	print("Weight after closing (c, f) =", dynamic1.get_total_weight())
+	print("Replaced:", dynamic1.open_edge(vertices.index('c'), vertices.index('f'), 4))
+	print("Weight after reopening (c, f) =", dynamic1.get_total_weight())
+
+	# Random closures and reopenings should match recomputing from scratch.
+	card_V = 60
+	graph2 = generate_random_graph(card_V, 0.1, True, False, True, 1, 30)
+	dynamic2 = DynamicMST(graph2)
+	closed = []
+	all_equal = True
+	for step in range(300):
+		if closed and randint(0, 1) == 0:
+			u, v, w = closed.pop(randint(0, len(closed) - 1))
+			dynamic2.open_edge(u, v, w)
+		else:
+			u, v = choice(dynamic2.get_graph().get_edge_list())
+			closed.append((u, v, dynamic2.get_graph().find_edge(u, v).get_weight()))
+			dynamic2.close_edge(u, v)
+		expected = get_total_weight(fast_kruskal(dynamic2.get_graph()))
+		if dynamic2.get_total_weight() != expected:
+			print("Weight mismatch at step", step)
+			all_equal = False
+	print("All total weights are " + ("not " if not all_equal else "") + "equal")
@@ -30,9 +30,10 @@
 #                                                                       #
 #########################################################################
 
+from heapq import heapify, heappop
 from merge_sort import merge_sort
 from adjacency_list_graph import AdjacencyListGraph
-from disjoint_set_forest import make_set, find_set, union
+from disjoint_set_array import ArrayDisjointSet
 from min_heap_priority_queue import MinHeapPriorityQueue
 
 
@@ -74,10 +75,8 @@ def kruskal(G):
     card_V = G.get_card_V()
     # Initialize an undirected, weighted, minimum spanning tree.
     mst = AdjacencyListGraph(card_V, False, True)
-    # Keep an array of handles to disjoint-set objects.
-    forest = [None] * card_V
-    for v in range(card_V):
-        forest[v] = make_set(v)
+    # Keep the disjoint sets of vertices in integer arrays.
+    forest = ArrayDisjointSet(card_V)
 
     # Make an array of weighted edges and sort it by weight.
     edges = []
@@ -90,12 +89,51 @@ def kruskal(G):
 
     # Examine each edge.
     for edge in edges:
-        u = forest[edge.get_u()]
-        v = forest[edge.get_v()]
         # If the endpoints are not in the same tree, connect the trees.
-        if find_set(u) != find_set(v):
+        if forest.union(edge.get_u(), edge.get_v()):
             mst.insert_edge(edge.get_u(), edge.get_v(), edge.get_weight())
-            union(u, v)
+
+    return mst
+
+
+def fast_kruskal(G, lazy=False):
+    """Return the minimum spanning tree of a weighted, undirected graph G using Kruskal's
+    algorithm on (weight, u, v) tuples, which compare with the built-in tuple ordering.
+    Stops as soon as card_V - 1 edges have been accepted.
+
+    Arguments:
+    G -- an undirected graph, represented by adjacency lists
+    lazy -- if False, sort all the edges with the built-in sorted.  If True, make a heap
+    of the edges in linear time and extract them one at a time, so that when the tree
+    closes early, the heaviest edges are never ordered.
+    """
+    if G.is_directed():
+        raise RuntimeError("Graph should be undirected.")
+
+    card_V = G.get_card_V()
+    mst = AdjacencyListGraph(card_V, False, True)
+    forest = ArrayDisjointSet(card_V)
+
+    edges = []
+    for u in range(card_V):
+        for edge in G.get_adj_list(u):
+            v = edge.get_v()
+            if u < v:  # append edge only once
+                edges.append((edge.get_weight(), u, v))
+    if lazy:
+        heapify(edges)
+        ordered = (heappop(edges) for _ in range(len(edges)))
+    else:
+        ordered = sorted(edges)
+
+    accepted = 0
+    for weight, u, v in ordered:
+        if accepted == card_V - 1:  # the tree is complete
+            break
+        # If the endpoints are not in the same tree, connect the trees.
+        if forest.union(u, v):
+            mst.insert_edge(u, v, weight)
+            accepted += 1
 
     return mst
 
@@ -180,6 +218,8 @@ if __name__ == "__main__":
     print_undirected_edges(kruskal1, vertices)
     kruskal_weight = get_total_weight(kruskal1)
     print("Kruskal weight =", kruskal_weight)
+    print("Fast Kruskal weights =", get_total_weight(fast_kruskal(graph1)),
+          get_total_weight(fast_kruskal(graph1, lazy=True)))
     print("MST with Prim's algorithm:")
     prim1 = prim(graph1, 0)
     print_undirected_edges(prim1, vertices)
@@ -204,3 +244,5 @@ if __name__ == "__main__":
     prim_weight2 = get_total_weight(prim2)
     print("Prim weight =", prim_weight2)
     print(prim_weight2 == kruskal_weight2)
+    print(get_total_weight(fast_kruskal(graph2)) == kruskal_weight2,
+          get_total_weight(fast_kruskal(graph2, lazy=True)) == kruskal_weight2)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# bidirectional_dijkstra.py
+
+from heapq import heappush, heappop
+from bidirectional_bfs import join_paths
+
+
+def bidirectional_dijkstra(G, s, t, G_reverse=None):
+	"""Find a shortest path from s to t by running Dijkstra's algorithm forward from s
+	and backward from t, always advancing the side whose next vertex is closer.  The
+	search stops once the sum of the two smallest heap keys reaches the weight of the
+	best path found through a vertex reached by both sides.
+
+	Arguments:
+	G -- a weighted graph, with get_adj_list for each vertex
+	s -- index of the source vertex
+	t -- index of the target vertex
+	G_reverse -- for a directed graph, its transpose.  If omitted, it is computed from G.
+	Ignored for an undirected graph.
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	path -- list of vertices on a shortest path from s to t, or None if no path exists
+	d -- weight of the path, or infinity if no path exists
+	expanded -- number of vertices whose adjacency lists were searched
+	"""
+	if s == t:
+		return [s], 0, 0
+	if not G.is_directed():
+		G_reverse = G
+	elif G_reverse is None:
+		G_reverse = G.transpose()
+
+	inf = float('inf')
+	# Predecessors in the forward search, successors in the backward search.
+	pi_forward = {s: None}
+	pi_backward = {t: None}
+	d_forward = {s: 0}
+	d_backward = {t: 0}
+	settled_forward = set()
+	settled_backward = set()
+	heap_forward = [(0, s)]
+	heap_backward = [(0, t)]
+	expanded = 0
+	best = inf
+	meet = None
+
+	while heap_forward and heap_backward:
+		if heap_forward[0][0] + heap_backward[0][0] >= best:
+			break  # no path through an unsettled vertex can be shorter
+
+		# Advance the side with the smaller minimum key.
+		if heap_forward[0][0] <= heap_backward[0][0]:
+			graph, heap, pi, d, settled, other_d = \
+				G, heap_forward, pi_forward, d_forward, settled_forward, d_backward
+		else:
+			graph, heap, pi, d, settled, other_d = \
+				G_reverse, heap_backward, pi_backward, d_backward, settled_backward, d_forward
+		du, u = heappop(heap)
+		if u in settled:  # an out-of-date pair for a vertex already extracted
+			continue
+		settled.add(u)
+		expanded += 1
+
+		# Relax each edge, and check whether the searches meet at its other endpoint.
+		for edge in graph.get_adj_list(u):
+			v = edge.get_v()
+			dv = du + edge.get_weight()
+			if dv < d.get(v, inf):
+				d[v] = dv
+				pi[v] = u
+				heappush(heap, (dv, v))
+				if v in other_d and dv + other_d[v] < best:
+					best = dv + other_d[v]
+					meet = v
+
+	if meet is None:
+		return None, inf, expanded
+	return join_paths(pi_forward, pi_backward, meet), best, expanded
+
+
+# Testing
+if __name__ == "__main__":
+
+	from dijkstra import dijkstra
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+
+	# Textbook example.
+	vertices = ['s', 't', 'x', 'y', 'z']
+	edges = [('s', 't', 10), ('s', 'y', 5), ('t', 'x', 1), ('t', 'y', 2), ('x', 'z', 4),
+			('y', 't', 3), ('y', 'x', 9), ('y', 'z', 2), ('z', 's', 7), ('z', 'x', 6)]
+	graph1 = AdjacencyListGraph(len(vertices), True, True)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	path, d, expanded = bidirectional_dijkstra(graph1, vertices.index('s'), vertices.index('x'))
+	print([vertices[i] for i in path], d, expanded)
+
+	# Distances should agree with dijkstra on random graphs.
+	card_V = 80
+	all_equal = True
+	for directed in [True, False]:
+		graph2 = generate_random_graph(card_V, 0.06, True, directed, True, 0, 15)
+		graph2_reverse = graph2.transpose() if directed else None
+		for s in range(0, card_V, 9):
+			dijkstra_d, dijkstra_pi = dijkstra(graph2, s)
+			for t in range(card_V):
+				path, d, expanded = bidirectional_dijkstra(graph2, s, t, graph2_reverse)
+				if d != dijkstra_d[t]:
+					print("Distance mismatch from", s, "to", t)
+					all_equal = False
+				elif path is not None:
+					weight = sum(graph2.find_edge(path[i], path[i + 1]).get_weight()
+								 for i in range(len(path) - 1))
+					if path[0] != s or path[-1] != t or weight != d:
+						print("Bad path from", s, "to", t, path)
+						all_equal = False
+	print("All distances are " + ("not " if not all_equal else "") + "equal")
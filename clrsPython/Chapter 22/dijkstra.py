@@ -30,13 +30,86 @@
 #                                                                       #
 #########################################################################
 
+from heapq import heappush, heappop
 from single_source_shortest_paths import initialize_single_source, relax
 from min_heap_priority_queue import MinHeapPriorityQueue
 
 
-def dijkstra(G, s):
+def dijkstra(G, s, target=None, mask=None, closed_edges=None, workspace=None):
 	"""Solve single-source shortest-paths problem with no negative-weight edges.
 
+	Uses a binary heap of (distance, vertex) pairs.  A vertex enters the heap only when
+	its distance first becomes finite or decreases, and out-of-date pairs are skipped
+	when they reach the top, so that no decrease-key operation is needed.
+
+	Arguments:
+	G -- a directed, weighted graph
+	s -- index of source vertex
+	target -- optional index of a target vertex.  If given, stop as soon as the target
+	is settled.  Then d[target] and the path to the target in pi are final, but the
+	entries for other vertices may be only upper bounds.
+	mask -- optional vertex status, indexed by vertex: vertices v with a false mask[v]
+	are closed and never relaxed.  The source itself is not checked.
+	closed_edges -- optional set of (u, v) pairs for edges that cannot be traversed.
+	In an undirected graph, either orientation of a pair closes the edge.
+	workspace -- optional SearchWorkspace for G whose lists and heap are reused instead
+	of allocating new ones.  The returned lists then belong to the workspace.
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	d -- distances from source vertex s
+	pi -- predecessors
+	"""
+
+	card_V = G.get_card_V()
+
+	if workspace is None:
+		d, pi = initialize_single_source(G, s)
+		settled = [False] * card_V
+		heap = [(0, s)]
+		touched = None
+	else:
+		workspace.reset(G, s)  # only the entries the last search changed are cleared
+		d, pi, settled, heap, touched = \
+			workspace.dist, workspace.pi, workspace.settled, workspace.heap, workspace.touched
+		d[s] = 0
+		heap.append((0, s))
+	undirected = closed_edges is not None and not G.is_directed()
+	inf = float('inf')
+
+	while heap:
+		du, u = heappop(heap)  # extract a vertex with the minimum distance
+		if settled[u]:  # an out-of-date pair for a vertex already extracted
+			continue
+		settled[u] = True
+		if u == target:
+			break
+
+		# Relax each edge and update d and pi.
+		for edge in G.get_adj_list(u):
+			v = edge.get_v()
+			if mask is not None and not mask[v]:
+				continue  # v is closed
+			if closed_edges is not None and \
+					((u, v) in closed_edges or (undirected and (v, u) in closed_edges)):
+				continue  # edge (u, v) is closed
+			dv = du + edge.get_weight()
+			if dv < d[v]:
+				if touched is not None and d[v] == inf:
+					touched.append(v)
+				d[v] = dv
+				pi[v] = u
+				heappush(heap, (dv, v))
+
+	return d, pi
+
+
+def dijkstra_decrease_key(G, s):
+	"""Solve single-source shortest-paths problem with no negative-weight edges,
+	as in the textbook: every vertex is inserted into a min-priority queue up front
+	and its key is decreased upon each relaxation.
+
 	Arguments:
 	G -- a directed, weighted graph
 	s -- index of source vertex
@@ -73,6 +146,7 @@ def dijkstra(G, s):
 # Testing
 if __name__ == "__main__":
 
+	from random import choice, randint
 	from adjacency_list_graph import AdjacencyListGraph
 	from bellman_ford import bellman_ford
 	from generate_random_graph import generate_random_graph
@@ -97,9 +171,37 @@ if __name__ == "__main__":
 	all_equal = True
 	for s in range(card_V):
 		dijkstra_d, dijkstra_pi = dijkstra(graph2, s)
+		decrease_key_d, decrease_key_pi = dijkstra_decrease_key(graph2, s)
 		bf_d, bf_pi, cycle = bellman_ford(graph2, s)
-		if bf_d != dijkstra_d:
+		if bf_d != dijkstra_d or bf_d != decrease_key_d:
 			print("Shortest-path distances mismatch for source vertex", s)
 			all_equal = False
 		# Don't check whether pi values are equal because shortest paths might not be unique.
-	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
\ No newline at end of file
+	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
+
+	# Stopping at a target gives the same distance to the target.
+	all_equal = True
+	full_d, full_pi = dijkstra(graph2, 0)
+	for t in range(card_V):
+		target_d, target_pi = dijkstra(graph2, 0, t)
+		if target_d[t] != full_d[t]:
+			all_equal = False
+	print("All point-to-point distances are " + ("not " if not all_equal else "") + "equal")
+
+	# Closures should give the same distances as deleting from a copy of the graph.
+	all_equal = True
+	for trial in range(20):
+		status = [randint(0, 4) > 0 for v in range(card_V)]
+		closed = set(choice(graph2.get_edge_list()) for i in range(30))
+		reduced = graph2.copy()
+		for u, v in closed:
+			reduced.delete_edge(u, v)
+		for v in range(card_V):
+			if not status[v]:
+				for u in range(card_V):
+					if reduced.has_edge(u, v):
+						reduced.delete_edge(u, v)
+		masked_d, masked_pi = dijkstra(graph2, 0, mask=status, closed_edges=closed)
+		if masked_d != dijkstra(reduced, 0)[0]:
+			all_equal = False
+	print("All disrupted distances are " + ("not " if not all_equal else "") + "equal")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# multi_source_dijkstra.py
+
+from heapq import heappush, heappop
+from single_source_shortest_paths import initialize_single_source, relax
+
+
+def multi_source_dijkstra(G, sources):
+	"""Solve the shortest-paths problem from several sources at once, as if from a
+	single extra vertex joined to every source by a weight-0 edge.  Each vertex gets
+	its distance from the nearest source and the source it is nearest to.
+
+	Arguments:
+	G -- a weighted graph
+	sources -- nonempty list of source vertex indices
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	d -- distances from the nearest source
+	pi -- predecessors, None for sources and unreachable vertices
+	nearest -- for each vertex, the source it is nearest to, or None if unreachable
+	"""
+	if not sources:
+		raise RuntimeError("Need at least one source vertex.")
+	card_V = G.get_card_V()
+	d, pi = initialize_single_source(G, sources[0])
+	nearest = [None] * card_V
+	settled = [False] * card_V
+	heap = []
+	for s in sources:
+		if nearest[s] is None:
+			d[s] = 0
+			nearest[s] = s
+			heap.append((0, s))
+
+	while heap:
+		du, u = heappop(heap)
+		if settled[u]:  # an out-of-date pair for a vertex already extracted
+			continue
+		settled[u] = True
+
+		def improved(v):
+			"""Record that v is now reached through u, from u's nearest source."""
+			nearest[v] = nearest[u]
+			heappush(heap, (d[v], v))
+
+		for edge in G.get_adj_list(u):
+			relax(u, edge.get_v(), edge.get_weight(), d, pi, improved)
+
+	return d, pi, nearest
+
+
+# Testing
+if __name__ == "__main__":
+
+	from dijkstra import dijkstra
+	from generate_random_graph import generate_random_graph
+
+	# Distances and labels should match the nearest of one dijkstra run per source.
+	card_V = 150
+	all_equal = True
+	for directed in [True, False]:
+		graph = generate_random_graph(card_V, 0.03, True, directed, True, 1, 20)
+		sources = [0, 17, 64, 99, 140]
+		d, pi, nearest = multi_source_dijkstra(graph, sources)
+		single = [dijkstra(graph, s)[0] for s in sources]
+		for v in range(card_V):
+			best = min(ds[v] for ds in single)
+			if d[v] != best:
+				all_equal = False
+			elif nearest[v] is not None and single[sources.index(nearest[v])][v] != best:
+				all_equal = False
+	print("All multi-source distances are " + ("not " if not all_equal else "") + "equal")
+	print(d[:8], nearest[:8])
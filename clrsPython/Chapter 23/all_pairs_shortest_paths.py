@@ -31,9 +31,62 @@
 #########################################################################
 
 import numpy as np
+from math import ceil
+from multiprocessing import Pool
 
+# Smallest n for which the APSP drivers start worker processes: below it, starting
+# the processes and sending them the operands costs more than the product saves.
+MIN_PARALLEL_SIZE = 256
+BANDS_PER_PRODUCT = 8  # bands of rows of C handed out to the workers per product
 
-def extend_shortest_paths(L_r_minus_1, W, L_r, n):
+
+def open_pool(processes, n):
+	"""Return a Pool of worker processes for min-plus products of n x n matrices, or
+	None if processes is None or at most 1, or n is too small to gain from workers.
+	The caller owns the pool and should close it once its products are done."""
+	if processes is None or processes <= 1 or n < MIN_PARALLEL_SIZE:
+		return None
+	return Pool(processes)
+
+
+def min_plus_product(A, B, tile_size=64, pool=None):
+	"""Return the min-plus product of A and B, the matrix C with
+	C[i, j] = min over k of A[i, k] + B[k, j].
+
+	The product is computed in tile_size x tile_size x tile_size blocks, so that each
+	NumPy operation works on a block small enough to stay in cache.
+
+	Arguments:
+	A, B -- n x n NumPy arrays
+	tile_size -- number of rows, columns, and terms of the sum handled per block
+	pool -- optional multiprocessing Pool, as made by open_pool, whose workers compute
+	bands of rows of C in parallel
+	"""
+	if pool is not None:
+		rows = A.shape[0]
+		band = tile_size * max(1, ceil(rows / tile_size / BANDS_PER_PRODUCT))
+		tasks = [(A[i:i + band], B, tile_size) for i in range(0, rows, band)]
+		return np.vstack(pool.starmap(_min_plus_band, tasks))
+	return _min_plus_band(A, B, tile_size)
+
+
+def _min_plus_band(A, B, tile_size):
+	"""Return the min-plus product of a band of rows A with all of B, block by block."""
+	rows, n = A.shape
+	C = np.full((rows, B.shape[1]), float('inf'))
+	for i in range(0, rows, tile_size):
+		i_end = min(i + tile_size, rows)
+		for j in range(0, B.shape[1], tile_size):
+			j_end = min(j + tile_size, B.shape[1])
+			block = C[i:i_end, j:j_end]
+			for k in range(0, n, tile_size):
+				k_end = min(k + tile_size, n)
+				sums = A[i:i_end, k:k_end, None] + B[None, k:k_end, j:j_end]
+				np.minimum(block, sums.min(axis=1), out=block)
+	return C
+
+
+def extend_shortest_paths(L_r_minus_1, W, L_r, n, vectorized=True, tile_size=64, pool=None):
 	"""Extend the shortest paths given in one matrix by the edge
 	weights given in another matrix.
 
@@ -43,53 +96,82 @@ def extend_shortest_paths(L_r_minus_1, W, L_r, n):
 	L_r -- matrix assumed to be initialized with infinity in all locations--
 	at conclusion, holds shortest-path weights with at most r edges
 	n -- each matrix is n x n
+	vectorized -- if True, use the blocked min-plus product instead of looping over
+	i, j, and k in Python
+	tile_size, pool -- passed to min_plus_product if vectorized
 	"""
+	if vectorized:
+		np.minimum(L_r, min_plus_product(np.asarray(L_r_minus_1, dtype=float), np.asarray(W, dtype=float),
+										 tile_size, pool), out=L_r)
+		return
 	for i in range(n):
 		for j in range(n):
 			for k in range(n):
 				L_r[i, j] = min(L_r[i, j], L_r_minus_1[i, k] + W[k, j])
 
 
-def slow_apsp(W, L_0, n):
+def slow_apsp(W, L_0, n, vectorized=True, tile_size=64, processes=None, pool=None):
 	"""Compute all-pairs shortest paths for a weighted directed graph.
 
 	Arguments:
 	L_0 -- a matrix initialized with 0 on the diagonal and infinity everywhere else
 	W -- the weighted adjacency matrix for the graph, but with 0 on the diagonal
 	n -- each matrix is n x n
+	vectorized, tile_size -- passed to extend_shortest_paths
+	processes -- number of worker processes for the products, started once for all of
+	them by open_pool, which runs small graphs serially
+	pool -- optional Pool owned by the caller, used instead of starting one
 	Returns:
 	L -- matrix of shortest-path weights, where L[i,j] is the weight of a
 	shortest path from vertex i to vertex j
 	"""
-	L = np.copy(L_0)
-	m = np.ndarray((n, n))
-
-	for r in range(1, n):
-		m.fill(float('inf'))  # initialize m
-		extend_shortest_paths(L, W, m, n)
-		L = m.copy()
-	return L
-
-
-def faster_apsp(W, n):
+	own_pool = pool is None and vectorized
+	if own_pool:
+		pool = open_pool(processes, n)
+	try:
+		L = np.copy(L_0)
+		m = np.ndarray((n, n))
+
+		for r in range(1, n):
+			m.fill(float('inf'))  # initialize m
+			extend_shortest_paths(L, W, m, n, vectorized, tile_size, pool)
+			L = m.copy()
+		return L
+	finally:
+		if own_pool and pool is not None:
+			pool.close()
+			pool.join()
+
+
+def faster_apsp(W, n, vectorized=True, tile_size=64, processes=None, pool=None):
 	"""Compute all-pairs shortest paths for a weighted directed graph.
 
 	Arguments:
 	W -- the weighted adjacency matrix for the graph, but with 0 on the diagonal
 	n -- each matrix is n x n
+	vectorized, tile_size -- passed to extend_shortest_paths
+	processes, pool -- as for slow_apsp
 	Returns:
 	L -- matrix of shortest-path weights, where L[i,j] is the weight of a
 	shortest path from vertex i to vertex j
 	"""
-	L = W.copy()
-	M = np.ndarray((n,n))
-	r = 1
-	while r < n-1:
-		M.fill(float('inf'))  # initialize M
-		extend_shortest_paths(L, L, M, n)  # compute M = L^2
-		r *= 2
-		L = M.copy()
-	return L
+	own_pool = pool is None and vectorized
+	if own_pool:
+		pool = open_pool(processes, n)
+	try:
+		L = W.copy()
+		M = np.ndarray((n,n))
+		r = 1
+		while r < n-1:
+			M.fill(float('inf'))  # initialize M
+			extend_shortest_paths(L, L, M, n, vectorized, tile_size, pool)  # compute M = L^2
+			r *= 2
+			L = M.copy()
+		return L
+	finally:
+		if own_pool and pool is not None:
+			pool.close()
+			pool.join()
 
 
 def initialize_L_0(n):
@@ -145,3 +227,25 @@ if __name__ == "__main__":
 	faster_L = faster_apsp(W, n)
 	print(faster_L)
 	print(np.array_equal(slow_L, faster_L))
+
+	# The looping, blocked, and multiprocess versions should agree.
+	loop_L = faster_apsp(W, n, vectorized=False)
+	print(np.array_equal(loop_L, faster_L))
+	print(np.array_equal(faster_apsp(W, n, tile_size=16, processes=2), faster_L))  # small: runs serially
+	with Pool(2) as pool:  # one pool owned by the caller, shared by every product
+		print(np.array_equal(faster_apsp(W, n, tile_size=16, pool=pool), faster_L),
+			  np.array_equal(slow_apsp(W, L_0, n, tile_size=16, pool=pool), faster_L))
+
+	# Cross-check against Floyd-Warshall on a larger graph.
+	from floyd_warshall import floyd_warshall
+	n = 300
+	graph3 = generate_random_graph(n, 0.02, False, True, True, 1, 30)
+	W = create_W(graph3, n)
+	print(np.array_equal(faster_apsp(W, n), floyd_warshall(W, n)))
+
+	# Workers are started once per call, not once per product.
+	import time
+	for processes in [None, 2]:
+		start = time.perf_counter()
+		faster_apsp(W, n, processes=processes)
+		print("processes =", processes, round(time.perf_counter() - start, 2), "seconds")
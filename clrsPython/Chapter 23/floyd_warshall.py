@@ -32,34 +32,65 @@
 
 import numpy as np
 
+NIL = -1  # entry in a predecessor matrix when there is no predecessor
 
-def floyd_warshall(W, n):
+
+def floyd_warshall(W, n, vectorized=True, predecessors=False):
 	"""Compute all-pairs shortest paths. 
 
 	Argument: 
-	W -- the weighted adjacency matrix for the graph, but with 0 on the diagonal
+	W -- the weighted adjacency matrix for the graph, but with 0 on the diagonal,
+	as returned by create_W
 	n -- each matrix is n x n
+	vectorized -- if True, perform each iteration of the outer loop as one NumPy
+	operation on the whole matrix instead of looping over i and j in Python
+	predecessors -- if True, also compute the predecessor matrix
 
 	Returns:
-	n x n matrix of shortest-path weights in G
+	n x n matrix of shortest-path weights in G, and if predecessors is True, also the
+	n x n predecessor matrix, in which entry [i, j] is the predecessor of j on a
+	shortest path from i, or NIL
 
 	Note: Implements the Floyd-Warshall' procedure in Exercise 23.2-4
 	"""
-	d = W.copy()
-	for k in range(n):
-		for i in range(n):
-			for j in range(n):
-				d[i,j] = min(d[i,j], d[i,k] + d[k,j])
+	d = np.array(W, dtype=float)
+	if predecessors:
+		pi = np.where((d < float('inf')) & ~np.eye(n, dtype=bool), np.arange(n)[:, None], NIL)
+
+	if vectorized:
+		for k in range(n):
+			# Row k and column k do not change during iteration k, so update d in place.
+			through_k = d[:, k, None] + d[None, k, :]
+			if predecessors:
+				shorter = through_k < d
+				d[shorter] = through_k[shorter]
+				pi = np.where(shorter, pi[None, k, :], pi)
+			else:
+				np.minimum(d, through_k, out=d)
+	else:
+		for k in range(n):
+			for i in range(n):
+				for j in range(n):
+					if d[i, k] + d[k, j] < d[i, j]:
+						d[i, j] = d[i, k] + d[k, j]
+						if predecessors:
+							pi[i, j] = pi[k, j]
+
+	if predecessors:
+		return d, pi
 	return d
 
 
-def transitive_closure(G, n):
+def transitive_closure(G, n, vectorized=True):
 	"""Return the transitive closure of a directed graph. The transitive closure is
 	a graph with an edge from i to j if and only if a path exists from i to j.
 
 	Argument:
-	G -- a weighted, directed graph represented by an adjacency matrix
+	G -- a directed graph represented by an adjacency matrix, or a weighted
+	adjacency matrix as returned by create_W, with infinity for no edge
 	n -- matrices are n x n
+	vectorized -- if True, perform each iteration of the outer loop as one NumPy
+	operation on the whole matrix instead of looping over i and j in Python
 	Returns:
 	A transitive closure matrix in which the [i][j] entry is True
 	if there is a path in G from vertex i to vertex j, False otherwise
@@ -68,15 +99,20 @@ def transitive_closure(G, n):
 	Floyd-Warshall' procedure in Exercise 23.2-4.
 	"""
 
-	t = np.ndarray((n,n), dtype=bool)
-	for i in range(n):
-		for j in range(n):
-			t[i,j] = i == j or G.has_edge(i, j)
-
-	for k in range(n):
-		for i in range(n):
-			for j in range(n):
-				t[i,j] = t[i,j] or (t[i,k] and t[k,j])
+	if isinstance(G, np.ndarray):
+		t = G < float('inf')
+	else:
+		t = G.get_adj_matrix() != G.no_edge
+	t = t | np.eye(n, dtype=bool)
+
+	if vectorized:
+		for k in range(n):
+			t |= t[:, k, None] & t[None, k, :]
+	else:
+		for k in range(n):
+			for i in range(n):
+				for j in range(n):
+					t[i,j] = t[i,j] or (t[i,k] and t[k,j])
 
 	return t
 
@@ -86,6 +122,8 @@ if __name__ == "__main__":
 
 	from adjacency_matrix_graph import AdjacencyMatrixGraph
 	from all_pairs_shortest_paths import create_W
+	from generate_random_graph import generate_random_graph
+	from print_all_pairs_shortest_path import print_all_pairs_shortest_path
 
 	# Textbook example for Floyd-Warshall.
 	vertices1 = [1, 2, 3, 4, 5]
@@ -99,6 +137,12 @@ if __name__ == "__main__":
 	w = create_W(graph1, n)
 	fw_result = floyd_warshall(w, n)
 	print(fw_result)
+	fw_loop_result, fw_loop_pi = floyd_warshall(w, n, vectorized=False, predecessors=True)
+	fw_vector_result, fw_vector_pi = floyd_warshall(w, n, predecessors=True)
+	print(fw_vector_pi)
+	print(np.array_equal(fw_result, fw_loop_result), np.array_equal(fw_loop_pi, fw_vector_pi))
+	for j in range(n):
+		print_all_pairs_shortest_path(fw_vector_pi, 0, j)
 
 	# Textbook example for transitive closure.
 	vertices2 = [1, 2, 3, 4]
@@ -110,3 +154,11 @@ if __name__ == "__main__":
 	print(graph2)
 	tc_result = transitive_closure(graph2, n)
 	print(tc_result)
+	print(np.array_equal(tc_result, transitive_closure(graph2, n, vectorized=False)))
+
+	# Larger example, comparing the vectorized and looping versions.
+	n = 60
+	graph3 = generate_random_graph(n, 0.05, False, True, True, 1, 20)
+	w = create_W(graph3, n)
+	print(np.array_equal(floyd_warshall(w, n), floyd_warshall(w, n, vectorized=False)))
+	print(np.array_equal(transitive_closure(w, n), transitive_closure(w, n, vectorized=False)))
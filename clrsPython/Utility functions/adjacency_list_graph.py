@@ -74,7 +74,7 @@ class Edge:
 
 class AdjacencyListGraph:
 
-	def __init__(self, card_V, directed=True, weighted=False):
+	def __init__(self, card_V, directed=True, weighted=False, indexed=False):
 		"""Initialize a graph implemented by an adjacency list. Vertices are
 		numbered from 0, so that adj_list[i] corresponds to adjacency list of vertex i.
 
@@ -82,6 +82,9 @@ class AdjacencyListGraph:
 		card_V -- number of vertices in this graph
 		directed -- boolean indicating whether the graph is directed
 		weighted -- boolean indicating whether edges are weighted
+		indexed -- boolean indicating whether to keep a hash index of the edges, so that
+		find_edge, has_edge, insert_edge, and delete_edge take O(1) expected time
+		instead of time linear in the length of an adjacency list
 		"""
 		self.directed = directed
 		self.weighted = weighted
@@ -91,6 +94,8 @@ class AdjacencyListGraph:
 			self.adj_lists[i] = DLLSentinel(get_key_func=Edge.get_v)  # will be a list of Edge objects
 		self.card_V = card_V
 		self.card_E = 0
+		# If indexed, edge_index maps (u, v) to the linked-list node holding edge (u, v).
+		self.edge_index = {} if indexed else None
 
 	def get_card_V(self):
 		"""Return the number of vertices in this graph."""
@@ -116,6 +121,20 @@ class AdjacencyListGraph:
 		"""Return a boolean indicating whether this graph is weighted."""
 		return self.weighted
 
+	def is_indexed(self):
+		"""Return a boolean indicating whether this graph keeps a hash index of its edges."""
+		return self.edge_index is not None
+
+	def build_edge_index(self):
+		"""Build the hash index of the edges from the adjacency lists, turning indexing on."""
+		self.edge_index = {}
+		for u in range(self.card_V):
+			sentinel = self.adj_lists[u].sentinel
+			x = sentinel.next
+			while x is not sentinel:
+				self.edge_index[(u, x.data.v)] = x
+				x = x.next
+
 	def insert_edge(self, u, v, weight=None):
 		"""Insert an edge between vertices u and v.
 
@@ -138,7 +157,9 @@ class AdjacencyListGraph:
 		# Cannot insert multiple edges between two vertices.
 		if self.has_edge(u, v):
 			raise RuntimeError("An edge (" + str(u) + ", " + str(v) + ") already exists.")
-		self.adj_lists[u].append(Edge(v, weight))
+		node = self.adj_lists[u].append(Edge(v, weight))
+		if self.edge_index is not None:
+			self.edge_index[(u, v)] = node
 		self.card_E += 1
 
 		# If this graph is undirected, insert an edge from v to u.
@@ -146,16 +167,24 @@ class AdjacencyListGraph:
 			# Cannot insert multiple edges between two vertices.
 			if self.has_edge(v, u):
 				raise RuntimeError("An edge (" + str(v) + ", " + str(u) + ") already exists.")
-			self.adj_lists[v].append(Edge(u, weight))
+			node = self.adj_lists[v].append(Edge(u, weight))
+			if self.edge_index is not None:
+				self.edge_index[(v, u)] = node
 
 	def find_edge(self, u, v):
 		"""Return the edge object for edge (u, v) if (u, v) is in this graph, None otherwise."""
-		edge = self.adj_lists[u].search(v)
+		edge = self.find_node(u, v)
 		if edge is None:
 			return None
 		else:
 			return edge.data
 
+	def find_node(self, u, v):
+		"""Return the linked-list node holding edge (u, v), or None if (u, v) is not in this graph."""
+		if self.edge_index is not None:
+			return self.edge_index.get((u, v))
+		return self.adj_lists[u].search(v)
+
 	def has_edge(self, u, v):
 		"""Return True if edge (u, v) is in this graph, False otherwise."""
 		return self.find_edge(u, v) is not None
@@ -163,15 +192,19 @@ class AdjacencyListGraph:
 	def delete_edge(self, u, v, delete_undirected=True):
 		"""Delete edge (u, v) if it exists.  No error if it does not exist.
 			Delete both directions if the graph is undirected and delete_undirected is True."""
-		edge = self.adj_lists[u].search(v)
+		edge = self.find_node(u, v)
 		if edge is not None:
 			self.adj_lists[u].delete(edge)
+			if self.edge_index is not None:
+				del self.edge_index[(u, v)]
 			self.card_E -= 1
 
 		if not self.directed and delete_undirected:
-			edge = self.adj_lists[v].search(u)
+			edge = self.find_node(v, u)
 			if edge is not None:
 				self.adj_lists[v].delete(edge)
+				if self.edge_index is not None:
+					del self.edge_index[(v, u)]
 
 	def copy(self):
 		"""Return a copy of this graph."""
@@ -179,6 +212,8 @@ class AdjacencyListGraph:
 		copy.card_E = self.card_E
 		for u in range(self.card_V):
 			copy.adj_lists[u] = self.adj_lists[u].copy()
+		if self.edge_index is not None:
+			copy.build_edge_index()
 		return copy
 
 	def get_edge_list(self):
@@ -194,7 +229,7 @@ class AdjacencyListGraph:
 
 	def transpose(self):
 		"""Return the transpose of this graph."""
-		xpose = AdjacencyListGraph(self.card_V, self.directed, self.weighted)
+		xpose = AdjacencyListGraph(self.card_V, self.directed, self.weighted, self.is_indexed())
 		for u in range(self.card_V):
 			adj_list = self.get_adj_list(u)
 			for edge in adj_list:
@@ -236,6 +271,36 @@ class AdjacencyListGraph:
 		return result
 
 
+def from_edges(card_V, edges, directed=True, weighted=False, indexed=False):
+	"""Build and return an AdjacencyListGraph from a sequence of edges in one pass.
+	Unlike repeated calls to insert_edge, no edge is checked for being already present,
+	so the caller must guarantee that the edges are distinct and, for an undirected
+	graph, that each edge appears in only one direction and is not a self-loop.
+
+	Arguments:
+	card_V -- number of vertices in the graph
+	edges -- iterable of (u, v) pairs, or (u, v, weight) triples if weighted
+	directed -- boolean indicating whether the graph is directed
+	weighted -- boolean indicating whether edges are weighted
+	indexed -- boolean indicating whether the graph keeps a hash index of its edges
+	"""
+	G = AdjacencyListGraph(card_V, directed, weighted)
+	adj_lists = G.adj_lists
+	card_E = 0
+	for edge in edges:
+		u = edge[0]
+		v = edge[1]
+		weight = edge[2] if weighted else None
+		adj_lists[u].append(Edge(v, weight))
+		if not directed:
+			adj_lists[v].append(Edge(u, weight))
+		card_E += 1
+	G.card_E = card_E
+	if indexed:
+		G.build_edge_index()
+	return G
+
+
 # Testing
 if __name__ == "__main__":
 
@@ -311,3 +376,17 @@ if __name__ == "__main__":
 	# Test transpose.
 	xpose1 = graph1.transpose()
 	print(xpose1)
+
+	# Indexed graph should agree with the unindexed one.
+	graph4 = graph2.copy()
+	graph4.build_edge_index()
+	for u in range(graph4.get_card_V()):
+		for v in range(graph4.get_card_V()):
+			if graph4.has_edge(u, v) != graph2.has_edge(u, v):
+				print("Index mismatch for", (u, v))
+	graph4.delete_edge(*graph2.get_edge_list()[0])
+	print(graph4.get_card_E() == graph2.get_card_E() - 1)
+
+	# Bulk construction.
+	graph5 = from_edges(10, graph2.get_edge_list(), directed=False, indexed=True)
+	print(sorted(graph5.get_edge_list()) == sorted(graph2.get_edge_list()))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# csr_graph.py
+
+from array import array
+from adjacency_list_graph import AdjacencyListGraph
+
+
+class CSREdge:
+	"""Lightweight view of one entry of a CSR graph, with the same interface as Edge."""
+
+	__slots__ = ("v", "weight")
+
+	def __init__(self, v, weight=None):
+		"""Initialize an edge view.
+
+		Arguments:
+		v -- the other vertex that the edge is incident on
+		weight -- optional parameter for weighted graphs
+		"""
+		self.v = v
+		self.weight = weight
+
+	def get_v(self):
+		"""Return the vertex index."""
+		return self.v
+
+	def get_weight(self):
+		"""Return the weight of this edge."""
+		return self.weight
+
+	def __str__(self):
+		"""String version of the vertex with optional weight in parentheses."""
+		return self.strmap(lambda v: v)
+
+	def strmap(self, mapping_func):
+		"""String version of the vertex with optional weight in parentheses.
+		Vertex numbers are mapped according to a mapping function."""
+		string = str(mapping_func(self.v))
+		if self.weight is not None:
+			string += " (" + str(self.weight) + ")"
+		return string
+
+
+class CSRGraph:
+
+	def __init__(self, card_V, offsets, targets, weights=None, directed=True, weighted=False):
+		"""Initialize a graph stored in compressed-sparse-row form.  The neighbors of
+		vertex u are targets[offsets[u]:offsets[u+1]], and if the graph is weighted, the
+		corresponding weights are weights[offsets[u]:offsets[u+1]].  An undirected edge
+		is stored once in each direction, as in AdjacencyListGraph.
+
+		Arguments:
+		card_V -- number of vertices in this graph
+		offsets -- array of card_V + 1 nondecreasing indices into targets
+		targets -- array of neighbor indices
+		weights -- array of edge weights parallel to targets, or None if unweighted
+		directed -- boolean indicating whether the graph is directed
+		weighted -- boolean indicating whether edges are weighted
+		"""
+		if len(offsets) != card_V + 1:
+			raise RuntimeError("Offsets array must have " + str(card_V + 1) + " entries.")
+		if weighted and (weights is None or len(weights) != len(targets)):
+			raise RuntimeError("A weighted graph needs one weight per target.")
+		self.card_V = card_V
+		self.offsets = offsets
+		self.targets = targets
+		self.weights = weights if weighted else None
+		self.directed = directed
+		self.weighted = weighted
+		self.card_E = len(targets) if directed else len(targets) // 2
+
+	def get_card_V(self):
+		"""Return the number of vertices in this graph."""
+		return self.card_V
+
+	def get_card_E(self):
+		"""Return the number of edges in this graph."""
+		return self.card_E
+
+	def get_offsets(self):
+		"""Return the offsets array."""
+		return self.offsets
+
+	def get_targets(self):
+		"""Return the targets array."""
+		return self.targets
+
+	def get_weights(self):
+		"""Return the weights array, or None if the graph is unweighted."""
+		return self.weights
+
+	def get_adj_list(self, u):
+		"""Return an iterator of edge views for the adjacency list of vertex u."""
+		start = self.offsets[u]
+		end = self.offsets[u + 1]
+		if self.weighted:
+			return map(CSREdge, self.targets[start:end], self.weights[start:end])
+		return map(CSREdge, self.targets[start:end])
+
+	def get_neighbors(self, u):
+		"""Return the neighbors of vertex u as a slice of the targets array."""
+		return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+	def get_neighbor_weights(self, u):
+		"""Return the weights of the edges leaving u, parallel to get_neighbors(u)."""
+		return self.weights[self.offsets[u]:self.offsets[u + 1]]
+
+	def get_degree(self, u):
+		"""Return the number of entries in the adjacency list of vertex u."""
+		return self.offsets[u + 1] - self.offsets[u]
+
+	def is_directed(self):
+		"""Return a boolean indicating whether this graph is directed."""
+		return self.directed
+
+	def is_weighted(self):
+		"""Return a boolean indicating whether this graph is weighted."""
+		return self.weighted
+
+	def find_edge(self, u, v):
+		"""Return an edge view for edge (u, v) if (u, v) is in this graph, None otherwise."""
+		for i in range(self.offsets[u], self.offsets[u + 1]):
+			if self.targets[i] == v:
+				return CSREdge(v, self.weights[i] if self.weighted else None)
+		return None
+
+	def has_edge(self, u, v):
+		"""Return True if edge (u, v) is in this graph, False otherwise."""
+		return self.find_edge(u, v) is not None
+
+	def get_edge_list(self):
+		"""Return a Python list containing the edges of this graph."""
+		edge_list = []
+		for u in range(self.card_V):
+			for v in self.get_neighbors(u):
+				if self.directed or u < v:
+					edge_list.append((u, v))
+		return edge_list
+
+	def transpose(self):
+		"""Return the transpose of this graph, also in CSR form."""
+		if not self.directed:
+			return CSRGraph(self.card_V, self.offsets, self.targets, self.weights, False, self.weighted)
+
+		# Count the in-degree of each vertex, then place each edge (u, v) in row v.
+		counts = array('i', [0]) * (self.card_V + 1)
+		for v in self.targets:
+			counts[v + 1] += 1
+		for v in range(self.card_V):
+			counts[v + 1] += counts[v]
+		offsets = array('i', counts)
+		targets = array('i', [0]) * len(self.targets)
+		weights = array(array_typecode(self.weights), [0]) * len(self.targets) if self.weighted else None
+		for u in range(self.card_V):
+			for i in range(self.offsets[u], self.offsets[u + 1]):
+				v = self.targets[i]
+				targets[counts[v]] = u
+				if self.weighted:
+					weights[counts[v]] = self.weights[i]
+				counts[v] += 1
+		return CSRGraph(self.card_V, offsets, targets, weights, True, self.weighted)
+
+	def to_adjacency_list_graph(self):
+		"""Return this graph represented by adjacency lists."""
+		G = AdjacencyListGraph(self.card_V, self.directed, self.weighted)
+		for u in range(self.card_V):
+			for edge in self.get_adj_list(u):
+				if self.directed or u < edge.v:
+					G.insert_edge(u, edge.v, edge.weight)
+		return G
+
+	def __str__(self):
+		"""Return the adjacency lists formatted as a string."""
+		return self.strmap()
+
+	def strmap(self, mapping_func=None):
+		"""Return the adjacency lists formatted as a string, but mapping vertex numbers
+		by a mapping function.  If mapping_func is None, then do not map."""
+		if mapping_func is None:
+			mapping_func = lambda i: i
+
+		result = ""
+		for i in range(self.card_V):
+			result += str(mapping_func(i)) + ": "
+			for edge in self.get_adj_list(i):
+				result += edge.strmap(mapping_func) + " "
+			result += "\n"
+		return result
+
+
+def array_typecode(a):
+	"""Return the array typecode for the elements of an array.array, a memoryview, or a
+	NumPy array, such as the weights of a CSRGraph loaded from a snapshot."""
+	if isinstance(a, array):
+		return a.typecode
+	if isinstance(a, memoryview):
+		return a.format
+	return a.dtype.char
+
+
+def weight_typecode(weights):
+	"""Return the array typecode for a sequence of weights: 'q' if every weight is
+	integral, so that integer weights stay integers, and 'd' otherwise."""
+	for w in weights:
+		if w != w or w in (float('inf'), float('-inf')) or w != int(w):
+			return 'd'
+	return 'q'
+
+
+def from_adjacency_list_graph(G):
+	"""Return a CSRGraph with the same vertices, edges, and adjacency-list order as G.
+
+	Arguments:
+	G -- a graph with get_adj_list, such as an AdjacencyListGraph
+	"""
+	card_V = G.get_card_V()
+	weighted = G.is_weighted()
+	offsets = array('i', [0]) * (card_V + 1)
+	targets = array('i')
+	weights = []
+	for u in range(card_V):
+		for edge in G.get_adj_list(u):
+			targets.append(edge.get_v())
+			if weighted:
+				weights.append(edge.get_weight())
+		offsets[u + 1] = len(targets)
+	if weighted:
+		weights = array(weight_typecode(weights), weights)
+	else:
+		weights = None
+	return CSRGraph(card_V, offsets, targets, weights, G.is_directed(), weighted)
+
+
+# Testing
+if __name__ == "__main__":
+
+	from generate_random_graph import generate_random_graph
+
+	# Round trip from adjacency lists.
+	graph1 = generate_random_graph(10, 0.25, True, False, True, 1, 9)
+	csr1 = from_adjacency_list_graph(graph1)
+	print(graph1)
+	print(csr1)
+	print(csr1.get_card_E() == graph1.get_card_E())
+	print(sorted(csr1.get_edge_list()) == sorted(graph1.get_edge_list()))
+	graph2 = csr1.to_adjacency_list_graph()
+	print(sorted(graph2.get_edge_list()) == sorted(graph1.get_edge_list()))
+
+	# Unweighted, directed.
+	graph3 = generate_random_graph(8, 0.3)
+	csr3 = from_adjacency_list_graph(graph3)
+	print(csr3)
+	print(sorted(csr3.transpose().get_edge_list()) == sorted(graph3.transpose().get_edge_list()))
+	for u in range(csr3.get_card_V()):
+		for v in range(csr3.get_card_V()):
+			if csr3.has_edge(u, v) != graph3.has_edge(u, v):
+				print("has_edge mismatch for", (u, v))
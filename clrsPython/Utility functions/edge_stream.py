@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# edge_stream.py
+
+from array import array
+from math import floor, log
+import random
+import numpy as np
+from adjacency_list_graph import from_edges
+from csr_graph import CSRGraph
+
+# Number of stations on each London Underground line, from London_Underground_data.csv.
+UNDERGROUND_LINE_LENGTHS = {"Bakerloo": 25, "Central": 49, "Circle": 35, "District": 60,
+							"Hammersmith & City": 29, "Jubilee": 27, "Metropolitan": 34,
+							"Northern": 50, "Piccadilly": 53, "Victoria": 16, "Waterloo & City": 2}
+
+# Edge sources.  Each yields (u, v) pairs.
+
+def gnp_edges(card_V, p, directed=False, rng=None):
+	"""Yield the edges of a G(n, p) random graph, each possible edge present with
+	probability p, in increasing order of (u, v).  Rather than drawing a random number
+	per pair, draw the geometrically distributed number of pairs to skip before the
+	next edge, so the time is proportional to the number of vertices plus edges.
+
+	Arguments:
+	card_V -- number of vertices
+	p -- probability that a given edge is present
+	directed -- if True, every ordered pair (u, v), including u == v, is a possible
+	edge, as in generate_random_graph; otherwise every pair with u < v
+	rng -- random.Random instance to draw from, or None for the random module
+	"""
+	rng = rng or random
+	if p <= 0 or card_V == 0:
+		return
+	log_q = log(1 - p) if p < 1 else None
+	total = card_V * card_V if directed else card_V * (card_V - 1) // 2
+	u = 0
+	row_start = 0  # index of the first pair in row u
+	row_length = card_V if directed else card_V - 1
+	index = -1
+	while True:
+		index += 1 if log_q is None else 1 + floor(log(1 - rng.random()) / log_q)
+		if index >= total:
+			return
+		while index >= row_start + row_length:  # move down to the row holding index
+			row_start += row_length
+			u += 1
+			if not directed:
+				row_length -= 1
+		offset = index - row_start
+		yield (u, offset) if directed else (u, u + 1 + offset)
+
+
+def gnm_edges(card_V, m, directed=False, rng=None):
+	"""Yield the edges of a G(n, m) random graph: m distinct edges chosen uniformly
+	from all possible edges (as in gnp_edges), in increasing order of (u, v)."""
+	rng = rng or random
+	total = card_V * card_V if directed else card_V * (card_V - 1) // 2
+	if m > total:
+		raise RuntimeError("Cannot choose " + str(m) + " edges from " + str(total) + ".")
+	u = 0
+	row_start = 0
+	row_length = card_V if directed else card_V - 1
+	for index in sorted(rng.sample(range(total), m)):
+		while index >= row_start + row_length:
+			row_start += row_length
+			u += 1
+			if not directed:
+				row_length -= 1
+		offset = index - row_start
+		yield (u, offset) if directed else (u, u + 1 + offset)
+
+
+def grid_edges(rows, cols):
+	"""Yield the edges of a rows x cols grid graph, vertex r * cols + c joined to its
+	right and lower neighbors, each edge once."""
+	for r in range(rows):
+		for c in range(cols):
+			u = r * cols + c
+			if c + 1 < cols:
+				yield u, u + 1
+			if r + 1 < rows:
+				yield u, u + cols
+
+
+def metro_edges(line_lengths=None, copies=1, interchange_probability=0.3, rng=None):
+	"""Yield the edges of a metro-like network made of lines, each line a path of
+	stations.  Each stop on a line is a new station, except that with the given
+	probability it is an existing station, making it an interchange.  Stations are
+	numbered in order of creation, so a builder can take card_V from the largest id.
+
+	Arguments:
+	line_lengths -- dict from line name to number of stops, by default the real
+	Underground line lengths
+	copies -- how many times to lay down the whole set of lines, to scale the network
+	interchange_probability -- probability that a stop reuses an existing station.  The
+	real network has about 380 stops on lines at 270 stations, so about 0.3.
+	rng -- random.Random instance to draw from, or None for the random module
+	"""
+	rng = rng or random
+	line_lengths = line_lengths or UNDERGROUND_LINE_LENGTHS
+	card_V = 0
+	for copy in range(copies):
+		for length in line_lengths.values():
+			previous = None
+			for stop in range(length):
+				if card_V > 1 and rng.random() < interchange_probability:
+					station = rng.randrange(card_V)
+					if station == previous:
+						continue  # a line does not stop at the same station twice in a row
+				else:
+					station = card_V
+					card_V += 1
+				if previous is not None:
+					yield previous, station
+				previous = station
+
+
+# Stages.  Each takes an iterable of edges and yields edges.
+
+def dedup_edges(edges, directed=False):
+	"""Yield each edge the first time it appears, dropping later copies and, for an
+	undirected graph, copies in the other orientation and self-loops.  Seen edges are
+	remembered as single integers rather than tuples."""
+	seen = set()
+	for edge in edges:
+		u, v = edge[0], edge[1]
+		if not directed:
+			if u == v:
+				continue
+			key = (u << 32) | v if u < v else (v << 32) | u
+		else:
+			key = (u << 32) | v
+		if key not in seen:
+			seen.add(key)
+			yield edge
+
+
+def with_weights(edges, min_weight=1, max_weight=20, rng=None):
+	"""Yield each (u, v) edge as a (u, v, weight) triple, the weight a random integer
+	from min_weight to max_weight."""
+	rng = rng or random
+	for edge in edges:
+		yield edge[0], edge[1], rng.randint(min_weight, max_weight)
+
+
+# Builders.  Each consumes an iterable of edges.
+
+def collect_edges(edges, weighted=False):
+	"""Store a stream of edges in compact arrays: sources and targets as 4-byte ints
+	and weights as 8-byte floats, about 16 bytes per edge instead of a tuple each.
+
+	Returns:
+	sources, targets, weights -- the arrays, weights None if unweighted
+	card_V -- one more than the largest vertex seen
+	"""
+	sources = array('i')
+	targets = array('i')
+	weights = array('d') if weighted else None
+	largest = -1
+	for edge in edges:
+		u, v = edge[0], edge[1]
+		sources.append(u)
+		targets.append(v)
+		if weighted:
+			weights.append(edge[2])
+		if u > largest:
+			largest = u
+		if v > largest:
+			largest = v
+	return sources, targets, weights, largest + 1
+
+
+def build_csr(edges, card_V=None, directed=False, weighted=False):
+	"""Build a CSRGraph from a stream of edges, each (u, v) or (u, v, weight), with a
+	stable counting sort, so each adjacency list keeps the order of the stream.  An
+	undirected edge is stored in both directions.  Duplicates are not removed; pass
+	the stream through dedup_edges first if it may contain any.
+
+	Arguments:
+	edges -- iterable of edges
+	card_V -- number of vertices, or None to use one more than the largest vertex
+	directed -- boolean indicating whether the graph is directed
+	weighted -- boolean indicating whether edges carry weights
+	"""
+	sources, targets, weights, seen_V = collect_edges(edges, weighted)
+	card_V = seen_V if card_V is None else card_V
+	u = np.frombuffer(sources, dtype=np.int32)
+	v = np.frombuffer(targets, dtype=np.int32)
+	w = np.frombuffer(weights, dtype=np.float64) if weighted else None
+	if not directed:
+		u, v = np.concatenate([u, v]), np.concatenate([v, u])
+		w = np.concatenate([w, w]) if weighted else None
+	order = np.argsort(u, kind="stable")
+	offsets = np.zeros(card_V + 1, dtype=np.int32)
+	np.cumsum(np.bincount(u, minlength=card_V), out=offsets[1:])
+
+	csr_offsets = array('i', offsets.tobytes())
+	csr_targets = array('i', v[order].tobytes())
+	csr_weights = None
+	if weighted:
+		w = w[order]
+		if np.all(w == np.floor(w)):  # keep integer weights as integers
+			csr_weights = array('q', w.astype(np.int64).tobytes())
+		else:
+			csr_weights = array('d', w.tobytes())
+	return CSRGraph(card_V, csr_offsets, csr_targets, csr_weights, directed, weighted)
+
+
+def build_adjacency_lists(edges, card_V=None, directed=False, weighted=False):
+	"""Build an AdjacencyListGraph from a stream of edges with from_edges, which skips
+	the duplicate checks, so the stream must not contain duplicates."""
+	sources, targets, weights, seen_V = collect_edges(edges, weighted)
+	card_V = seen_V if card_V is None else card_V
+	if weighted:
+		triples = ((sources[i], targets[i], weights[i] if weights[i] != int(weights[i]) else int(weights[i]))
+				   for i in range(len(sources)))
+	else:
+		triples = ((sources[i], targets[i], None) for i in range(len(sources)))
+	return from_edges(card_V, triples, directed, weighted)
+
+
+# Testing
+if __name__ == "__main__":
+
+	import time
+	from random import Random
+	from bfs import bfs
+	from bfs_frontier import bfs_frontier
+
+	# Geometric skipping gives the same edge set as testing every pair with the same
+	# probability would, on average: compare the count with its expectation.
+	rng = Random(7)
+	card_V = 2000
+	for directed in [False, True]:
+		counts = [sum(1 for _ in gnp_edges(card_V, 0.002, directed, rng)) for trial in range(5)]
+		expected = 0.002 * (card_V * card_V if directed else card_V * (card_V - 1) / 2)
+		print("G(n, p) edge counts", counts, "expected", expected)
+	edges = list(gnp_edges(50, 0.3, False, rng))
+	print(all(u < v < 50 for u, v in edges), edges == sorted(set(edges)))
+	print(sorted(gnp_edges(3, 1.0, False)) == [(0, 1), (0, 2), (1, 2)], list(gnp_edges(3, 0, True)))
+
+	edges = list(gnm_edges(100, 300, True, rng))
+	print(len(edges) == len(set(edges)) == 300)
+	grid = build_csr(grid_edges(3, 4), 12)
+	print(grid.get_card_E() == 17, bfs(grid, 0)[0][11] == 5)
+
+	# The metro-like network has the scale of the Underground.
+	metro = list(metro_edges(rng=Random(3)))
+	unique = list(dedup_edges(metro))
+	graph = build_adjacency_lists(with_weights(unique, 1, 5, rng), weighted=True)
+	print(graph.get_card_V(), "stations,", graph.get_card_E(), "connections from", len(metro), "stops")
+	csr = build_csr(iter(unique))
+	print(sorted(build_adjacency_lists(iter(unique), directed=False).get_edge_list()) == sorted(csr.get_edge_list()))
+	print(bfs(csr, 0)[0] == bfs(build_adjacency_lists(iter(unique)), 0)[0])
+
+	# A graph with about a million edges, built from the stream.  Only the compact
+	# arrays of collect_edges and the CSR arrays are held, never a list of tuples.
+	start = time.perf_counter()
+	big = build_csr(with_weights(gnp_edges(200000, 10 / 200000, False, rng), 1, 9, rng), 200000, weighted=True)
+	print(big.get_card_E(), "edges in", round(time.perf_counter() - start, 2), "seconds")
+	dist, pi = bfs_frontier(big, 0)
+	print("Eccentricity of vertex 0:", max(d for d in dist if d != float('inf')))
@@ -30,9 +30,10 @@
 #                                                                       #
 #########################################################################
 
-from random import randint, random
-from adjacency_list_graph import AdjacencyListGraph
+from random import randint
+from adjacency_list_graph import from_edges
 from adjacency_matrix_graph import AdjacencyMatrixGraph
+from edge_stream import gnp_edges
 
 
 def generate_random_graph(card_V, edge_probability, by_adjacency_lists=True,
@@ -52,23 +53,22 @@ def generate_random_graph(card_V, edge_probability, by_adjacency_lists=True,
     Returns:
         A graph
         """
-    constructor = AdjacencyListGraph if by_adjacency_lists else AdjacencyMatrixGraph
-    G = constructor(card_V, directed, weighted)
-
-    for u in range(card_V):
-        if directed:
-            min_v = 0
+    # Skip geometrically distributed runs of absent edges rather than testing every pair.
+    edges = []
+    for u, v in gnp_edges(card_V, edge_probability, directed):
+        if weighted:
+            weight = randint(min_weight, max_weight)  # random weight within range
         else:
-            min_v = u + 1
+            weight = None
+        edges.append((u, v, weight))
 
-        for v in range(min_v, card_V):
-            if random() <= edge_probability:  # add edge (u, v)
-                if weighted:
-                    weight = randint(min_weight, max_weight)  # random weight within range
-                else:
-                    weight = None
-                G.insert_edge(u, v, weight)  # guaranteed that edge (u, v) is not already present
+    if by_adjacency_lists:
+        # Each edge (u, v) is generated at most once, so skip the duplicate checks.
+        return from_edges(card_V, edges, directed, weighted)
 
+    G = AdjacencyMatrixGraph(card_V, directed, weighted)
+    for u, v, weight in edges:
+        G.insert_edge(u, v, weight)
     return G
 
 
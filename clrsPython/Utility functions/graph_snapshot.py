@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# graph_snapshot.py
+
+import mmap
+import struct
+import sys
+import numpy as np
+from csr_graph import CSRGraph, from_adjacency_list_graph, weight_typecode
+
+# File layout, every section starting on an 8-byte boundary:
+#   header (HEADER_FORMAT)
+#   name offsets: uint64[card_V + 1] into the name bytes, then the UTF-8 name bytes
+#   line offsets: uint64[line_count + 1] into the line-name bytes, then the line-name bytes
+#   CSR offsets: int64[card_V + 1]
+#   CSR targets: int32[entry_count]
+#   weights: int64 or float64[entry_count], if weighted
+#   line ids: int32[entry_count], parallel to targets, -1 for none, if there are lines
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+HEADER_FORMAT = "=8sIIQQQQQ"  # magic, version, flags, card_V, entry count, line count, name bytes, line bytes
+DIRECTED = 1
+WEIGHTED = 2
+FLOAT_WEIGHTS = 4
+HAS_LINES = 8
+BIG_ENDIAN = 16  # arrays are in the byte order of the machine that saved them
+
+
+def padding(n):
+	"""Return the number of zero bytes that bring n up to a multiple of 8."""
+	return -n % 8
+
+
+def string_table(strings):
+	"""Return the uint64 offsets and the UTF-8 bytes of a list of strings."""
+	encoded = [str(s).encode("utf-8") for s in strings]
+	offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+	np.cumsum([len(b) for b in encoded], out=offsets[1:])
+	return offsets, b"".join(encoded)
+
+
+def save_graph(filename, G, names=None, line_names=None, line_ids=None):
+	"""Save a graph in the binary snapshot format.
+
+	Arguments:
+	filename -- name of the file to write
+	G -- a CSRGraph, or a graph with get_adj_list such as an AdjacencyListGraph
+	names -- optional list of vertex names, such as station names
+	line_names -- optional list of line names
+	line_ids -- optional sequence of indices into line_names, one per entry of the CSR
+	targets array (so per direction of an undirected edge), -1 for no line
+	"""
+	if not isinstance(G, CSRGraph):
+		G = from_adjacency_list_graph(G)
+	card_V = G.get_card_V()
+	entry_count = len(G.get_targets())
+	names = names if names is not None else [str(v) for v in range(card_V)]
+	if len(names) != card_V:
+		raise RuntimeError("Need one name per vertex, " + str(card_V) + " names.")
+	line_names = line_names if line_names is not None else []
+	if line_ids is not None and len(line_ids) != entry_count:
+		raise RuntimeError("Need one line id per CSR entry, " + str(entry_count) + " ids.")
+
+	flags = DIRECTED if G.is_directed() else 0
+	if sys.byteorder == "big":
+		flags |= BIG_ENDIAN
+	sections = []
+	name_offsets, name_bytes = string_table(names)
+	line_offsets, line_bytes = string_table(line_names)
+	sections += [name_offsets.tobytes(), name_bytes, line_offsets.tobytes(), line_bytes]
+	sections.append(np.asarray(G.get_offsets(), dtype=np.int64).tobytes())
+	sections.append(np.asarray(G.get_targets(), dtype=np.int32).tobytes())
+	if G.is_weighted():
+		flags |= WEIGHTED
+		weights = G.get_weights()
+		if weight_typecode(weights) == 'd':
+			flags |= FLOAT_WEIGHTS
+			sections.append(np.asarray(weights, dtype=np.float64).tobytes())
+		else:
+			sections.append(np.asarray(weights, dtype=np.int64).tobytes())
+	if line_ids is not None:
+		flags |= HAS_LINES
+		sections.append(np.asarray(line_ids, dtype=np.int32).tobytes())
+
+	header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, flags, card_V, entry_count,
+						 len(line_names), len(name_bytes), len(line_bytes))
+	with open(filename, "wb") as file:
+		file.write(header + bytes(padding(len(header))))
+		for section in sections:
+			file.write(section + bytes(padding(len(section))))
+
+
+class GraphSnapshot:
+
+	def __init__(self, filename):
+		"""Open a snapshot written by save_graph, mapping the file into memory.  The CSR
+		arrays are NumPy views of the mapped pages rather than copies, so processes that
+		open the same file share one copy in the page cache.
+
+		Arguments:
+		filename -- name of the file to open
+		"""
+		with open(filename, "rb") as file:
+			self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+		header_size = struct.calcsize(HEADER_FORMAT)
+		magic, version, flags, card_V, entry_count, line_count, name_bytes, line_bytes = \
+			struct.unpack_from(HEADER_FORMAT, self.map)
+		if magic != MAGIC:
+			raise RuntimeError(filename + " is not a graph snapshot.")
+		if version != VERSION:
+			raise RuntimeError(filename + " has snapshot version " + str(version) +
+							   ", expected " + str(VERSION) + ".")
+		if bool(flags & BIG_ENDIAN) != (sys.byteorder == "big"):
+			raise RuntimeError(filename + " was saved with the other byte order.")
+		self.card_V = card_V
+		self.position = header_size + padding(header_size)
+
+		self.name_offsets = self.section(np.uint64, card_V + 1)
+		self.name_bytes = self.section(np.uint8, name_bytes)
+		self.line_offsets = self.section(np.uint64, line_count + 1)
+		self.line_bytes = self.section(np.uint8, line_bytes)
+		self.offsets = self.section(np.int64, card_V + 1)
+		self.targets = self.section(np.int32, entry_count)
+		weighted = bool(flags & WEIGHTED)
+		self.weights = None
+		if weighted:
+			self.weights = self.section(np.float64 if flags & FLOAT_WEIGHTS else np.int64, entry_count)
+		self.line_ids = self.section(np.int32, entry_count) if flags & HAS_LINES else None
+
+		# The graph indexes memoryviews of the same pages, which give Python ints and
+		# floats per element, so bfs, dijkstra, and kruskal run at their usual speed.
+		self.graph = CSRGraph(card_V, memoryview(self.offsets), memoryview(self.targets),
+							  None if self.weights is None else memoryview(self.weights),
+							  bool(flags & DIRECTED), weighted)
+		self.names = None  # decoded on first use
+
+	def section(self, dtype, count):
+		"""Return a NumPy view of the next section of the file and move past it."""
+		view = np.frombuffer(self.map, dtype=dtype, count=count, offset=self.position)
+		self.position += view.nbytes + padding(view.nbytes)
+		return view
+
+	def get_graph(self):
+		"""Return the graph, as a CSRGraph over the mapped arrays."""
+		return self.graph
+
+	def get_card_V(self):
+		"""Return the number of vertices."""
+		return self.card_V
+
+	def get_name(self, v):
+		"""Return the name of vertex v, decoding only that name."""
+		return bytes(self.name_bytes[self.name_offsets[v]:self.name_offsets[v + 1]]).decode("utf-8")
+
+	def get_names(self):
+		"""Return the list of vertex names, indexed by vertex."""
+		if self.names is None:
+			self.names = decode_table(self.name_offsets, self.name_bytes)
+		return self.names
+
+	def get_line_names(self):
+		"""Return the list of line names."""
+		return decode_table(self.line_offsets, self.line_bytes)
+
+	def get_line_ids(self):
+		"""Return the line id of each CSR entry as a NumPy array, or None if not saved."""
+		return self.line_ids
+
+
+def decode_table(offsets, data):
+	"""Decode a string table into a list of strings."""
+	text = bytes(data)
+	bounds = offsets.tolist()
+	return [text[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def load_graph_mmap(filename):
+	"""Return a GraphSnapshot for a file written by save_graph, mapped with zero copy."""
+	return GraphSnapshot(filename)
+
+
+# Testing
+if __name__ == "__main__":
+
+	import os
+	import tempfile
+	import time
+	from adjacency_list_graph import from_edges
+	from bfs import bfs
+	from dijkstra import dijkstra
+	from mst import kruskal, get_total_weight
+	from generate_random_graph import generate_random_graph
+	from bfs_frontier import bfs_frontier
+
+	directory = tempfile.mkdtemp()
+
+	# A small network with names and lines.
+	stations = ["Baker Street", "Bond Street", "Green Park", "Westminster", "Waterloo", "Bank"]
+	graph1 = from_edges(len(stations), [(0, 1, 2), (1, 2, 1), (2, 3, 2), (3, 4, 2), (4, 5, 4), (1, 5, 9)],
+						directed=False, weighted=True)
+	csr1 = from_adjacency_list_graph(graph1)
+	lines = ["Jubilee", "Central", "Waterloo & City"]
+	line_ids = [1 if {u, edge.get_v()} == {1, 5} else (2 if {u, edge.get_v()} == {4, 5} else 0)
+				for u in range(csr1.get_card_V()) for edge in csr1.get_adj_list(u)]
+	filename = os.path.join(directory, "network.graph")
+	save_graph(filename, csr1, stations, lines, line_ids)
+	snapshot = load_graph_mmap(filename)
+	print(snapshot.get_names() == stations, snapshot.get_name(4), snapshot.get_line_names())
+	print(dijkstra(snapshot.get_graph(), 0) == dijkstra(graph1, 0))
+	print(snapshot.get_line_ids().tolist() == line_ids, snapshot.get_graph().transpose().get_card_E())
+
+	# Larger random graphs give the same searches and spanning trees after a round trip.
+	all_equal = True
+	for directed in [True, False]:
+		graph2 = generate_random_graph(400, 0.02, True, directed, True, 1, 30)
+		filename = os.path.join(directory, "random.graph")
+		save_graph(filename, graph2)
+		G = load_graph_mmap(filename).get_graph()
+		for s in range(0, 400, 57):
+			if bfs(G, s) != bfs(graph2, s) or dijkstra(G, s) != dijkstra(graph2, s):
+				all_equal = False
+			if bfs_frontier(G, s)[0] != bfs(graph2, s)[0]:
+				all_equal = False
+		if not directed and get_total_weight(kruskal(G)) != get_total_weight(kruskal(graph2)):
+			all_equal = False
+	print("All snapshot results are " + ("not " if not all_equal else "") + "equal")
+
+	# Loading a large graph takes about as long as opening the file.
+	card_V = 200000
+	rng = np.random.default_rng(2)
+	u = rng.integers(0, card_V, 3 * card_V)
+	order = np.argsort(u, kind="stable")
+	offsets = np.zeros(card_V + 1, dtype=np.int64)
+	np.cumsum(np.bincount(u, minlength=card_V), out=offsets[1:])
+	targets = rng.integers(0, card_V, 3 * card_V)[order]
+	big = CSRGraph(card_V, offsets, targets, rng.integers(1, 10, 3 * card_V), True, True)
+	filename = os.path.join(directory, "big.graph")
+	save_graph(filename, big)
+	start = time.perf_counter()
+	loaded = load_graph_mmap(filename)
+	print("Loaded", loaded.get_graph().get_card_E(), "edges in",
+		  round((time.perf_counter() - start) * 1000, 2), "ms")
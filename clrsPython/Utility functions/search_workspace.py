@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# search_workspace.py
+
+from fifo_queue import ResizingQueue
+from bfs import WHITE
+
+
+class SearchWorkspace:
+
+	def __init__(self, G):
+		"""Initialize buffers that bfs and dijkstra can reuse from one search to the next
+		on graphs with the same vertices as G, instead of allocating them per search.
+
+		Each search records the vertices whose entries it changes, and the next search
+		resets just those entries, so that starting a search takes time proportional to
+		the part of the graph the previous search reached rather than to the whole graph.
+		The dist and pi lists returned by a search using the workspace are the
+		workspace's own lists, so they stay valid only until the next search with it.
+		Copy them to keep them longer.
+
+		Arguments:
+		G -- a graph, or any object with get_card_V
+		"""
+		self.card_V = G.get_card_V()
+		self.color = [WHITE] * self.card_V  # used by bfs
+		self.dist = [float('inf')] * self.card_V  # dist in bfs, d in dijkstra
+		self.pi = [None] * self.card_V
+		self.settled = [False] * self.card_V  # used by dijkstra
+		self.queue = ResizingQueue()
+		self.heap = []
+		self.touched = []  # vertices whose entries the last search changed
+
+	def get_card_V(self):
+		"""Return the number of vertices the workspace is for."""
+		return self.card_V
+
+	def reset(self, G, source):
+		"""Restore every entry changed by the previous search and mark the source as touched.
+
+		Arguments:
+		G -- the graph about to be searched, which must have card_V vertices
+		source -- index of the source vertex of the next search
+		"""
+		if G.get_card_V() != self.card_V:
+			raise RuntimeError("Workspace is for " + str(self.card_V) + " vertices, graph has "
+							   + str(G.get_card_V()) + ".")
+		inf = float('inf')
+		color = self.color
+		dist = self.dist
+		pi = self.pi
+		settled = self.settled
+		for v in self.touched:
+			color[v] = WHITE
+			dist[v] = inf
+			pi[v] = None
+			settled[v] = False
+		self.touched.clear()
+		self.heap.clear()  # a search stopped at its target can leave pairs behind
+		while not self.queue.is_empty():
+			self.queue.dequeue()
+		self.touched.append(source)
+
+
+# Testing
+if __name__ == "__main__":
+
+	import timeit
+	from bfs import bfs
+	from dijkstra import dijkstra
+	from generate_random_graph import generate_random_graph
+
+	# Searches sharing one workspace give the same results as fresh searches.
+	card_V = 300
+	graph = generate_random_graph(card_V, 0.01, True, True, True, 1, 20)
+	workspace = SearchWorkspace(graph)
+	all_equal = True
+	for s in range(0, card_V, 7):
+		expected = bfs(graph, s)
+		if bfs(graph, s, workspace=workspace) != expected:
+			all_equal = False
+		if bfs(graph, s, level_synchronous=True, workspace=workspace) != expected:
+			all_equal = False
+		t = (s * 13) % card_V
+		expected = dijkstra(graph, s)
+		if dijkstra(graph, s, workspace=workspace) != expected:
+			all_equal = False
+		d, pi = dijkstra(graph, s, t, workspace=workspace)  # stops early, leaving heap entries
+		if d[t] != expected[0][t]:
+			all_equal = False
+	print("All workspace results are " + ("not " if not all_equal else "") + "equal")
+
+	# Short searches on a large graph no longer pay for initializing every vertex.
+	from random import randint
+	from adjacency_list_graph import from_edges
+	big = from_edges(20000, set((randint(0, 19999), randint(0, 19999), 1) for i in range(60000)), True, True)
+	workspace = SearchWorkspace(big)
+	near = next(iter(big.get_adj_list(0))).get_v()  # a target one edge from the source
+	print("Fresh lists:", round(timeit.timeit(lambda: dijkstra(big, 0, near), number=200), 4),
+		  "workspace:", round(timeit.timeit(lambda: dijkstra(big, 0, near, workspace=workspace), number=200), 4))